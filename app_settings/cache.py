@@ -0,0 +1,59 @@
+import threading
+from collections import OrderedDict
+from .fingerprint import clear_memo
+
+
+class Empty(object):
+    pass
+
+MAX_ENTRIES = 10000
+
+# settings name -> {key: value}, oldest entries first
+_value_storage = {}
+_lock = threading.Lock()
+
+
+def get_value(settings_name, key):
+    """
+    returns the finalized value cached for key or Empty.
+    """
+    storage = _value_storage.get(settings_name, None)
+    if storage is None:
+        return Empty
+    return storage.get(key, Empty)
+
+
+def set_value(settings_name, key, value):
+    """
+    caches value for key. once there are MAX_ENTRIES values for
+    settings_name, the oldest one is evicted.
+    """
+    with _lock:
+        storage = _value_storage.get(settings_name, None)
+        if storage is None:
+            storage = _value_storage[settings_name] = OrderedDict()
+        elif len(storage) >= MAX_ENTRIES and key not in storage:
+            storage.popitem(last=False)
+        storage[key] = value
+
+
+def invalidate(settings_name=None):
+    clear_memo()
+    if settings_name is None:
+        _value_storage.clear()
+    else:
+        _value_storage.pop(settings_name, None)
+
+
+def setting_changed_receiver(sender, setting, **kwargs):
+    if setting in _value_storage:
+        invalidate(setting)
+
+
+try:
+    from django.test.signals import setting_changed
+except ImportError:
+    setting_changed = None
+
+if setting_changed is not None:
+    setting_changed.connect(setting_changed_receiver, dispatch_uid='app_settings.cache')
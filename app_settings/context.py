@@ -0,0 +1,60 @@
+import threading
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # python < 3.7, overrides are per thread then
+    ContextVar = None
+
+
+class ThreadLocalVar(object):
+    """
+    the part of the ContextVar api used here, backed by a threading.local.
+    """
+    def __init__(self, name, default=None):
+        self.name = name
+        self.default = default
+        self._local = threading.local()
+
+    def get(self):
+        return getattr(self._local, 'value', self.default)
+
+    def set(self, value):
+        self._local.value = value
+
+
+if ContextVar is not None:
+    _overrides = ContextVar('app_settings_overrides', default=None)
+else:
+    _overrides = ThreadLocalVar('app_settings_overrides', default=None)
+
+
+# the value of _overrides is None (nothing overridden, the fast path) or a
+# layer: ({holder: wrapped}, previous layer, holder pushed by the layer).
+# layers are never mutated, so every thread / task just sees the stack it
+# built itself.
+
+def get_override(holder, default=None):
+    layer = _overrides.get()
+    if layer is None:
+        return default
+    return layer[0].get(holder, default)
+
+
+def push_override(holder, wrapped):
+    layer = _overrides.get()
+    overrides = dict(layer[0]) if layer is not None else {}
+    overrides[holder] = wrapped
+    _overrides.set((overrides, layer, holder))
+
+
+def pop_override(holder):
+    """
+    drops the latest override, which has to be the one pushed for holder:
+    overrides of different holders are undone in reverse order.
+    """
+    layer = _overrides.get()
+    if layer is None or holder not in layer[0]:
+        raise Exception('settings "%s" are not overridden in this context' % holder)
+    if layer[2] is not holder:
+        raise Exception('the latest override in this context is not the one of settings "%s"' % holder)
+    _overrides.set(layer[1])
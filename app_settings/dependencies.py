@@ -0,0 +1,55 @@
+class DependencyGraph(object):
+    """
+    maps the settings resolved by a wrapper to the inputs (names of
+    settings / configuration entries) they were resolved from, and back.
+    so a change of some inputs invalidates just the settings depending on
+    them.
+    """
+    def __init__(self):
+        # resolved setting -> inputs
+        self.inputs = {}
+        # input -> resolved settings
+        self.dependents = {}
+
+    def add(self, name, inputs):
+        if self.inputs.get(name, None) is inputs:
+            return
+        self.remove(name)
+        self.inputs[name] = inputs
+        for input_name in inputs:
+            self.dependents.setdefault(input_name, set()).add(name)
+
+    def remove(self, name):
+        for input_name in self.inputs.pop(name, ()):
+            dependents = self.dependents.get(input_name, None)
+            if dependents is not None:
+                dependents.discard(name)
+                if not dependents:
+                    del self.dependents[input_name]
+
+    def affected(self, changed_inputs):
+        """
+        the resolved settings depending on any of changed_inputs.
+        """
+        names = set()
+        for input_name in changed_inputs:
+            names.update(self.dependents.get(input_name, ()))
+        return names
+
+    def __len__(self):
+        return len(self.inputs)
+
+
+def changed_keys(old, new):
+    """
+    keys of two settings dicts whose values differ.
+    """
+    old = old or {}
+    new = new or {}
+    changed = set()
+    for key in set(old) | set(new):
+        old_value = old.get(key, None)
+        new_value = new.get(key, None)
+        if old_value is not new_value and old_value != new_value:
+            changed.add(key)
+    return changed
@@ -2,3 +2,33 @@
 
 class InvalidSettingError(Exception):
     pass
+
+
+class SettingImportError(ImportError):
+    """
+    an import target of a setting couldn't be imported.
+    """
+    def __init__(self, message, path=None, settings_name=None, setting_lookup=None, error=None):
+        super(SettingImportError, self).__init__(message)
+        self.path = path
+        self.settings_name = settings_name
+        self.setting_lookup = setting_lookup
+        self.error = error
+
+
+class SettingsValidationError(InvalidSettingError):
+    """
+    the validation method of one or more settings rejected their value.
+    causes maps the lookups whose validation method raised to the exception
+    it raised.
+    """
+    def __init__(self, errors, causes=None):
+        causes = dict(causes or {})
+        super(SettingsValidationError, self).__init__(
+            'Invalid settings: %s' % ', '.join(
+                "'%s'" % lookup + (' (%s: %s)' % (type(causes[lookup]).__name__, causes[lookup]) if lookup in causes else '')
+                for lookup in errors
+            )
+        )
+        self.errors = list(errors)
+        self.causes = causes
@@ -0,0 +1,173 @@
+import hashlib
+import itertools
+import sys
+import weakref
+
+try:
+    string_types = (basestring, )
+    integer_types = (int, long)
+except NameError:  # python 3
+    string_types = (str, bytes)
+    integer_types = (int, )
+
+
+MAX_MEMO_ENTRIES = 100000
+
+# id(frozen container) -> (container, digest), see fingerprint(memoize=True)
+_memo = {}
+
+# objects hashed by identity -> serial number, see _identity()
+_serials = itertools.count()
+_identities = weakref.WeakKeyDictionary()
+_strong_identities = {}
+
+
+def fingerprint(value, memoize=False):
+    """
+    canonical hex digest of value.
+
+    dicts, lists and tuples are hashed like a merkle tree over the digests
+    of their items (dicts independent of their ordering), classes and
+    functions by their dotted path - if it imports back to the very same
+    object - and objects providing get_fingerprint() (like SettingsWrapper)
+    by their own fingerprint. lambdas, closures, partials, bound methods
+    and objects without an own repr are hashed by identity, so their
+    digest is only stable within the process.
+
+    with memoize=True the digest of every nested tuple or frozenset holding
+    only immutable values is remembered, so it is known already for the
+    next value sharing it. dicts, lists and sets may be changed in place,
+    they are hashed again every time.
+    """
+    if memoize and len(_memo) > MAX_MEMO_ENTRIES:
+        clear_memo()
+    return _digest(value, set(), _memo if memoize else None)
+
+
+def clear_memo():
+    _memo.clear()
+
+
+def combine(*parts):
+    """
+    digest of already computed digests / plain strings.
+    """
+    return _hash('t', '\0'.join(parts))
+
+
+def _hash(tag, *parts):
+    sha = hashlib.sha1(tag.encode('ascii'))
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = part.encode('utf-8')
+        sha.update(part)
+    return sha.hexdigest()
+
+
+def _dotted_path(value):
+    return '%s.%s' % (
+        getattr(value, '__module__', None),
+        getattr(value, '__qualname__', None) or getattr(value, '__name__', None)
+    )
+
+
+def _importable_path(value):
+    """
+    the dotted path of value, if it leads back to value itself - or None.
+    """
+    module = sys.modules.get(getattr(value, '__module__', None) or '', None)
+    name = getattr(value, '__qualname__', None) or getattr(value, '__name__', None)
+    if module is None or not isinstance(name, string_types):
+        return None
+    obj = module
+    for part in name.split('.'):
+        obj = getattr(obj, part, None)
+        if obj is None:
+            return None
+    if obj is not value:
+        return None
+    return '%s.%s' % (module.__name__, name)
+
+
+def _identity(value):
+    """
+    a serial number unique to value for as long as the process runs (ids
+    are reused once an object is gone, serial numbers aren't).
+    """
+    try:
+        serial = _identities.get(value, None)
+        if serial is None:
+            serial = _identities[value] = next(_serials)
+        return str(serial)
+    except TypeError:  # neither hashable nor weak referenceable
+        pass
+    entry = _strong_identities.get(id(value), None)
+    if entry is None or entry[0] is not value:
+        entry = _strong_identities[id(value)] = (value, next(_serials))
+    return str(entry[1])
+
+
+def _is_frozen(value, memo):
+    """
+    whether the digest of value can't change. containers are frozen once
+    memoized, objects hashed by their repr or fingerprint may change.
+    """
+    if value is None or isinstance(value, string_types + integer_types + (bool, float)):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return id(value) in memo
+    if getattr(type(value), 'get_fingerprint', None) is not None:
+        return False
+    return isinstance(value, type) or callable(value)
+
+
+def _digest(value, in_progress, memo):
+    if value is None or isinstance(value, bool):
+        return _hash('n', repr(value))
+    if isinstance(value, string_types):
+        if isinstance(value, bytes):
+            value = value.decode('utf-8', 'replace')
+        return _hash('s', value)
+    if isinstance(value, integer_types):
+        return _hash('i', str(value))
+    if isinstance(value, float):
+        return _hash('f', repr(value))
+
+    get_fingerprint = getattr(type(value), 'get_fingerprint', None)
+    if get_fingerprint is not None:
+        return _hash('w', get_fingerprint(value))
+
+    if isinstance(value, type) or callable(value):
+        path = _importable_path(value)
+        if path is not None:
+            return _hash('c', path)
+        return _hash('x', _dotted_path(type(value)), _identity(value))
+
+    if isinstance(value, (dict, list, tuple, set, frozenset)):
+        if memo is not None and id(value) in memo:
+            return memo[id(value)][1]
+        if id(value) in in_progress:
+            return _hash('r')  # recursive reference, like a configuration's '.'
+        in_progress.add(id(value))
+        try:
+            if isinstance(value, dict):
+                items = sorted(
+                    _digest(key, in_progress, memo) + _digest(item, in_progress, memo)
+                    for key, item in value.items()
+                )
+                digest = _hash('d', *items)
+            else:
+                items = [_digest(item, in_progress, memo) for item in value]
+                if isinstance(value, (set, frozenset)):
+                    digest = _hash('e', *sorted(items))
+                else:
+                    digest = _hash('l' if isinstance(value, list) else 't', *items)
+        finally:
+            in_progress.discard(id(value))
+        if memo is not None and isinstance(value, (tuple, frozenset)) and all(_is_frozen(item, memo) for item in value):
+            memo[id(value)] = (value, digest)  # keeps value alive, so its id stays unique
+        return digest
+
+    if type(value).__repr__ is object.__repr__:
+        return _hash('x', _dotted_path(type(value)), _identity(value))  # the repr is id based
+    return _hash('o', _dotted_path(type(value)), repr(value))
@@ -0,0 +1,228 @@
+import time
+from django.utils import importlib
+from .exceptions import SettingImportError
+from .schema import get_schema
+
+# module path -> seconds it took to import it in preload_imports()
+import_timings = {}
+
+# dotted path -> imported object / the error importing it raised
+_resolved = {}
+_failed = {}
+
+_import_stats = {
+    'hits': 0,
+    'misses': 0,
+    'failures': 0,
+    'seconds': 0.0,
+}
+
+
+def perform_import(settings_name, val, setting_lookup):
+    """
+    If the given setting is a string import notation,
+    then perform the necessary import or imports.
+    """
+    if not val:
+        return None
+    if isinstance(val, basestring):
+        return import_from_string(settings_name, val, setting_lookup)
+    elif isinstance(val, (list, tuple)):
+        return [import_from_string(settings_name, item, setting_lookup) for item in val]
+    elif isinstance(val, dict):
+        ret = {}
+        for key, value in val.items():
+            ret[key] = import_from_string(settings_name, value, setting_lookup)
+        val = ret
+    return val
+
+
+def import_from_string(settings_name, val, setting_lookup, scope=None):
+    """
+    Attempt to import a class from a string representation.
+
+    every dotted path is imported just once per process, successful or not:
+    repeated lookups are served from _resolved / _failed. failures are
+    forgotten by clear_import_cache() and whenever django settings change,
+    so a path can be fixed without restarting.
+    """
+    # TODO: use scope for more detailed Exception message
+    try:
+        value = _resolved[val]
+    except KeyError:
+        pass
+    else:
+        _import_stats['hits'] += 1
+        return value
+
+    error = _failed.get(val, None)
+    if error is None:
+        _import_stats['misses'] += 1
+        start = time.time()
+        try:
+            value = _import(val)
+        except Exception as e:
+            _import_stats['failures'] += 1
+            error = _failed[val] = e
+        else:
+            _resolved[val] = value
+            return value
+        finally:
+            _import_stats['seconds'] += time.time() - start
+    else:
+        _import_stats['hits'] += 1
+
+    parts = val.split('.')
+    module_path, class_name = '.'.join(parts[:-1]), parts[-1]
+    if isinstance(error, AttributeError):
+        msg = "Could not import Class '%s' from module '%s' for '%s' setting '%s': %s" % (
+            class_name, module_path, settings_name, setting_lookup, error
+        )
+    else:
+        msg = "Could not import '%s' for '%s' setting '%s': %s" % (val, settings_name, setting_lookup, error)
+    raise SettingImportError(msg, path=val, settings_name=settings_name, setting_lookup=setting_lookup, error=error)
+
+
+def _import(val):
+    parts = val.split('.')
+    module_path, class_name = '.'.join(parts[:-1]), parts[-1]
+    # Nod to tastypie's use of importlib.
+    module = importlib.import_module(module_path)
+    return getattr(module, class_name)
+
+
+def import_stats():
+    """
+    counters of import_from_string: cache hits, misses (real imports),
+    failures and the seconds spent importing.
+    """
+    stats = dict(_import_stats)
+    stats['cached'] = len(_resolved)
+    stats['failed'] = len(_failed)
+    return stats
+
+
+def clear_import_cache():
+    _resolved.clear()
+    _failed.clear()
+
+
+def collect_import_targets(app_config, settings=None):
+    """
+    returns {dotted path: [absolute lookups of the settings using it]} for
+    every string in an import target (IMPORT_STRINGS, CLASS, _INIT_METHOD)
+    of the django settings and the DEFAULTS of app_config.
+    """
+    settings_name = app_config.get('NAME')
+    if settings is None:
+        try:
+            from django.conf import settings as django_settings
+            settings = getattr(django_settings, settings_name, None)
+        except ImportError:
+            settings = None
+
+    targets = {}
+    schema = get_schema(app_config)
+    for values in (schema.defaults, settings):
+        _collect(schema, values, settings_name, targets)
+
+    validation_method = app_config.get('VALIDATION_METHOD', None)
+    if validation_method:
+        _add_targets(targets, validation_method, settings_name + '.VALIDATION_METHOD')
+    return targets
+
+
+def _collect(schema, values, lookup, targets):
+    if isinstance(values, (list, tuple)):
+        for value in values:
+            _collect(schema, value, lookup, targets)
+        return
+    if not isinstance(values, dict):
+        return
+
+    for key, value in values.items():
+        if not isinstance(key, basestring):
+            continue
+        if key in schema.import_targets or key.startswith('_VALIDATE_'):
+            _add_targets(targets, value, lookup + '.' + key)
+        elif isinstance(value, (dict, list, tuple)) and isinstance(schema.available_settings.get(key, None), dict):
+            child_schema = schema.child(schema.get_many_for_one(key)[0] or key)
+            if key.endswith('_COLLECTION') and isinstance(value, dict):
+                value = list(value.values())
+            _collect(child_schema, value, lookup + '.' + key, targets)
+
+
+def _add_targets(targets, value, lookup):
+    if isinstance(value, basestring):
+        value = [value]
+    elif isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, (list, tuple)):
+        return
+    for path in value:
+        if isinstance(path, basestring) and '.' in path:
+            targets.setdefault(path, []).append(lookup)
+
+
+def preload_imports(app_config, settings=None):
+    """
+    imports every module referenced by an import target of app_config at
+    once, deduplicated by module. imports run one after the other: they
+    serialize on the import lock anyway, and importing from threads can
+    deadlock on it (e.g. when called while a module is being imported).
+    the time spent per module is recorded in import_timings and the
+    imported objects are cached for import_from_string. failing imports
+    are ignored here, they raise when the setting is accessed.
+
+    returns {module path: seconds} of this run.
+    """
+    targets = collect_import_targets(app_config, settings)
+    modules = set(path.rsplit('.', 1)[0] for path in targets)
+
+    timings = {}
+    for module_path in sorted(modules):
+        start = time.time()
+        try:
+            importlib.import_module(module_path)
+        except Exception:
+            pass
+        timings[module_path] = time.time() - start
+
+    import_timings.update(timings)
+
+    settings_name = app_config.get('NAME')
+    for path, lookups in targets.items():
+        try:
+            import_from_string(settings_name, path, lookups[0])
+        except ImportError:
+            pass
+    return timings
+
+
+def slowest_imports(app_config, settings=None, limit=10):
+    """
+    [(seconds, module path, [setting lookups])] of the slowest recorded
+    imports of app_config's settings.
+    """
+    modules = {}
+    for path, lookups in collect_import_targets(app_config, settings).items():
+        modules.setdefault(path.rsplit('.', 1)[0], []).extend(lookups)
+    return sorted(
+        ((import_timings[module_path], module_path, sorted(set(lookups)))
+         for module_path, lookups in modules.items() if module_path in import_timings),
+        reverse=True
+    )[:limit]
+
+
+def setting_changed_receiver(sender, setting, **kwargs):
+    # a changed setting (like INSTALLED_APPS) may make a failed path importable
+    _failed.clear()
+
+
+try:
+    from django.test.signals import setting_changed
+except ImportError:
+    setting_changed = None
+
+if setting_changed is not None:
+    setting_changed.connect(setting_changed_receiver, dispatch_uid='app_settings.imports')
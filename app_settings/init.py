@@ -1,12 +1,169 @@
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from . import instrumentation
+from .lazy import lazy
 
-_instance_storage = {}
+try:
+    import asyncio
+except ImportError:  # python 2
+    asyncio = None
+
+
+class InstanceRegistry(object):
+    """
+    stores the instances created by get_instance().
+
+    entries are evicted least recently used once there are more than
+    max_size of them, and after ttl seconds if a ttl is given. with
+    weak=True only weak references are kept (where the instance allows it),
+    so instances nobody uses anymore just disappear.
+    """
+    def __init__(self, max_size=1024, ttl=None, weak=False):
+        self._storage = OrderedDict()
+        self._lock = threading.Lock()
+        self.configure(max_size=max_size, ttl=ttl, weak=weak)
+        self.reset_stats()
+
+    def configure(self, max_size=1024, ttl=None, weak=False):
+        # max_size=None makes the storage unbounded
+        self.max_size = max_size
+        self.ttl = ttl
+        self.weak = weak
+        with self._lock:
+            self._evict()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._storage),
+        }
+
+    def get(self, key):
+        with self._lock:
+            entry = self._storage.pop(key, None)
+            instance = None
+            if entry is not None:
+                reference, created = entry
+                instance = reference() if isinstance(reference, weakref.ref) else reference
+                if instance is None or (self.ttl is not None and time.time() - created > self.ttl):
+                    instance = None
+                    self.evictions += 1
+                else:
+                    self._storage[key] = entry  # most recently used
+            if instance is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return instance
+
+    def set(self, key, instance):
+        reference = instance
+        if self.weak:
+            try:
+                reference = weakref.ref(instance)
+            except TypeError:
+                pass  # no weakref support, keep a strong reference
+        with self._lock:
+            self._storage.pop(key, None)
+            self._storage[key] = (reference, time.time())
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._storage.clear()
+
+    def instances(self):
+        """
+        the stored instances, which are still alive.
+        """
+        with self._lock:
+            entries = list(self._storage.values())
+        instances = []
+        for reference, created in entries:
+            instance = reference() if isinstance(reference, weakref.ref) else reference
+            if instance is not None:
+                instances.append(instance)
+        return instances
+
+    def after_fork(self):
+        # the lock may have been held by another thread of the parent process
+        self._lock = threading.Lock()
+
+    def _evict(self):
+        if self.max_size is None:
+            return
+        while len(self._storage) > self.max_size:
+            self._storage.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self._storage)
+
+
+instance_registry = InstanceRegistry()
 
 
 def storage_instance(hash_value, instance=None):
     if instance is None:
-        return _instance_storage.get(hash_value, None)
+        return instance_registry.get(hash_value)
+
+    instance_registry.set(hash_value, instance)
+
+
+class SingleFlight(object):
+    """
+    runs func once per key for concurrent callers: callers arriving while it
+    runs wait for it and get the same result (or exception).
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func):
+        with self._lock:
+            call = self._calls.get(key, None)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {
+                    'event': threading.Event(),
+                    'thread': threading.current_thread(),
+                }
+
+        if not leader:
+            if call['thread'] is threading.current_thread():
+                return func()  # reentrant call of the leader, waiting would dead lock
+            call['event'].wait()
+            if 'error' in call:
+                raise call['error']
+            return call['result']
+
+        try:
+            call['result'] = func()
+        except Exception as e:
+            call['error'] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call['event'].set()
+        return call['result']
 
-    _instance_storage[hash_value] = instance
+    def after_fork(self):
+        # calls running in other threads of the parent process never finish here
+        self._lock = threading.Lock()
+        self._calls = {}
+
+
+instance_flight = SingleFlight()
 
 
 def get_instance(config):
@@ -16,29 +173,110 @@ def get_instance(config):
             str(config.__class__)
         ))
     instance_class = config.CLASS
-    hash_value = hash((instance_class, config))
+    hash_value = (instance_class, config.get_fingerprint())
     instance = storage_instance(hash_value)
 
     if instance is None:
-        instance = instance_class(settings=config)
-        storage_instance(hash_value, instance)
+        # concurrent callers wait for the same instance instead of creating their own
+        instance = instance_flight.do(hash_value, lambda: create_instance(hash_value, instance_class, config))
+    elif instrumentation.enabled:
+        instrumentation.record('instance', config.get_absolute_lookup('CLASS'))
+
+    return instance
+
+
+def create_instance(hash_value, instance_class, config):
+    instance = storage_instance(hash_value)
+    if instance is not None:
+        return instance  # created while waiting for the flight
 
+    start = instrumentation.enabled and instrumentation.clock()
+    instance = instance_class(settings=config)
+    storage_instance(hash_value, instance)
+    if start:
+        instrumentation.record('instance_created', config.get_absolute_lookup('CLASS'), instrumentation.clock() - start)
     return instance
 
 
+def warm_up(settings, max_workers=8):
+    """
+    initializes every INIT setting of settings (including nested settings
+    and every item of collections) now, in up to max_workers threads.
+    instances are created once, even if requests ask for them meanwhile.
+
+    returns the number of initialized settings.
+    """
+    pending = list(settings.list_init_targets())
+    count = len(pending)
+    lock = threading.Lock()
+    errors = []
+
+    def worker():
+        while True:
+            with lock:
+                if not pending or errors:
+                    return
+                init_method, config = pending.pop()
+            try:
+                init_method(config)
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=worker) for i in range(min(max_workers, count))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    return count
+
+
+def aget_instance(config, executor=None):
+    """
+    get_instance() for asyncio code (python 3): returns a future of the
+    instance, to be awaited. it is created in executor, so slow __init__
+    methods don't block the event loop; concurrent callers share one
+    instantiation like threads do.
+    """
+    if asyncio is None:
+        raise Exception('aget_instance() needs asyncio (python 3)')
+    loop = asyncio.get_event_loop()
+    instance = storage_instance((config.CLASS, config.get_fingerprint()))
+    if instance is not None:
+        future = loop.create_future()
+        future.set_result(instance)
+        return future
+    return loop.run_in_executor(executor, get_instance, config)
+
+
+def awarm_up(settings, executor=None, max_workers=8):
+    """
+    warm_up() for asyncio code (python 3): returns a future of the number
+    of initialized settings.
+    """
+    if asyncio is None:
+        raise Exception('awarm_up() needs asyncio (python 3)')
+    return asyncio.get_event_loop().run_in_executor(executor, warm_up, settings, max_workers)
+
+
 def get_wrapped_instance(config):
-    return ClassWrapper(get_instance(config), config)
+    instance = get_instance(config)
+    # the wrapper (and the attributes bound by it) is kept along with the instance
+    hash_value = (BoundClassWrapper, config.CLASS, config.get_fingerprint())
+    wrapper = storage_instance(hash_value)
+    if wrapper is None or not wrapper.wraps(instance):
+        wrapper = BoundClassWrapper(instance, config)
+        storage_instance(hash_value, wrapper)
+    return wrapper
 
 
 def get_class_from_config(config):
     if isinstance(config, (tuple, list)):
-        ret = config.__class__()
-
-        for current_config in config:
-            instance = get_instance(current_config)
-            ret += config.__class__((instance, ))
-
-        return ret
+        # instances are created on access
+        return lazy(config, get_instance)
 
     instance = get_instance(config)
     return instance
@@ -46,13 +284,8 @@ def get_class_from_config(config):
 
 def wrap_class_with_config(config):
     if isinstance(config, (tuple, list)):
-        ret = config.__class__()
-
-        for current_config in config:
-            instance = get_wrapped_instance(current_config)
-            ret += config.__class__((instance, ))
-
-        return ret
+        # instances are created on access
+        return lazy(config, get_wrapped_instance)
 
     instance = get_wrapped_instance(config)
     return instance
@@ -63,17 +296,27 @@ class Empty(object):
 
 
 class ClassWrapper(object):
+    # see BoundClassWrapper
+    bind_attributes = False
+
     def __init__(self, instance, config):
         self.__instance = instance
         self.__config = config
+        self.__instance_attributes = set()
 
-        for attr in self.__config.__dict__['_dict'].keys():
+        for attr in self.__config.as_dict().keys():
             if hasattr(self.__instance, attr):
-                raise Exception('can\'t wrap class"%s" with this config. \
-                    Attribute "%s" found in both.' % (
-                    str(instance.__class__),
-                    attr
-                ))
+                self.__raise_conflict(attr)
+
+    def __raise_conflict(self, attr):
+        raise Exception('can\'t wrap class"%s" with this config. \
+            Attribute "%s" found in both.' % (
+            str(self.__instance.__class__),
+            attr
+        ))
+
+    def wraps(self, instance):
+        return self.__instance is instance
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -84,18 +327,48 @@ class ClassWrapper(object):
         return not self.__eq__(other)
 
     def __getattr__(self, attr):
+        if attr in self.__instance_attributes:
+            return getattr(self.__instance, attr)
+
         # at least one of te two following is always None
         config_value = getattr(self.__config, attr, Empty)
         instance_value = getattr(self.__instance, attr, Empty)
 
+        if self.bind_attributes and not attr.startswith('__'):
+            self.__bind(attr, config_value, instance_value)
+
         if config_value is not Empty:
             return config_value
         if instance_value is not Empty:
             return instance_value
         raise AttributeError('Attribute "%s" not found in config/instance' % attr)
 
+    def __bind(self, attr, config_value, instance_value):
+        if config_value is not Empty and instance_value is not Empty:
+            self.__raise_conflict(attr)
+        if config_value is not Empty:
+            self.__dict__[attr] = config_value
+        elif instance_value is not Empty:
+            # instance attributes (methods too) may be replaced, so only the
+            # lookup is bound
+            self.__instance_attributes.add(attr)
+
     def __str__(self, ):
         return 'ClassWrapper: instance=%s (%s)' % (self.__instance, self.__config)
 
     def __unicode__(self, ):
         return self.__str__()
+
+
+class BoundClassWrapper(ClassWrapper):
+    """
+    ClassWrapper deciding on first access of an attribute whether it is
+    served by the config or the instance. config values are stored on the
+    wrapper then, so accessing them again is a plain attribute lookup.
+    attributes of the instance (including methods) are read from the
+    instance directly, without looking at the config again.
+
+    conflicting attributes (found in both) raise when wrapping, like they
+    do for ClassWrapper.
+    """
+    bind_attributes = True
@@ -0,0 +1,141 @@
+import threading
+import time
+
+# checked before recording anything, so instrumentation costs a single
+# attribute lookup as long as no collector is installed
+enabled = False
+
+clock = time.time
+
+_collectors = []
+
+EVENTS = (
+    'app_settings',     # app_settings() created a settings wrapper
+    'get_attribute',    # a setting was resolved
+    'cache_hit',        # a setting was served from the process wide cache
+    'get_value',        # the raw value of a setting was looked up
+    'parent_settings',  # get_value() fell back to the parent_settings
+    'finalize',         # finalize_value() of a setting
+    'link',             # a linked value was resolved
+    'import',           # perform_import() of a setting
+    'init',             # perform_init() of a setting
+    'instance',         # get_instance() returned an existing instance
+    'instance_created', # get_instance() created a new instance
+)
+
+
+def add_collector(collector):
+    global enabled
+    if collector not in _collectors:
+        _collectors.append(collector)
+    enabled = True
+    return collector
+
+
+def remove_collector(collector):
+    global enabled
+    if collector in _collectors:
+        _collectors.remove(collector)
+    enabled = bool(_collectors)
+
+
+def record(event, lookup, seconds=None):
+    """
+    passes an event of the setting lookup (an absolute lookup like
+    'APP.BACKENDS.NAME') to every collector. seconds is the duration of
+    the event, if it was timed.
+    """
+    for collector in _collectors:
+        collector.record(event, lookup, seconds)
+
+
+class Collector(object):
+    """
+    base class of collectors, see add_collector().
+    """
+    def record(self, event, lookup, seconds=None):
+        """
+        called for every event, see record(). ignores them by default.
+        """
+        pass
+
+    def after_fork(self):
+        """
+        called in forked worker processes, see prefork.after_fork().
+        """
+        pass
+
+
+class MemoryCollector(Collector):
+    """
+    counts events per (event, lookup) and keeps a histogram of their
+    durations, with bucket upper bounds in seconds.
+    """
+    buckets = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, None)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def after_fork(self):
+        self._lock = threading.Lock()
+
+    def reset(self):
+        # (event, lookup) -> count
+        self.counters = {}
+        # (event, lookup) -> [total seconds, max seconds, count per bucket...]
+        self.timings = {}
+
+    def record(self, event, lookup, seconds=None):
+        key = (event, lookup)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + 1
+            if seconds is None:
+                return
+            timing = self.timings.get(key, None)
+            if timing is None:
+                timing = self.timings[key] = [0.0, 0.0] + [0] * len(self.buckets)
+            timing[0] += seconds
+            timing[1] = max(timing[1], seconds)
+            for index, bound in enumerate(self.buckets):
+                if bound is None or seconds <= bound:
+                    timing[2 + index] += 1
+                    break
+
+    def histogram(self, event, lookup):
+        """
+        [(bucket upper bound, count)] of the durations of event for lookup.
+        """
+        timing = self.timings.get((event, lookup), None)
+        if timing is None:
+            return []
+        return list(zip(self.buckets, timing[2:]))
+
+    def hottest(self, limit=10, event='get_value'):
+        """
+        [(count, lookup)] of the lookups with the most events.
+        """
+        return sorted(
+            ((count, lookup) for (_event, lookup), count in self.counters.items() if _event == event),
+            reverse=True
+        )[:limit]
+
+    def slowest(self, limit=10, event='get_attribute'):
+        """
+        [(total seconds, max seconds, count, lookup)] of the lookups that
+        took the longest in total.
+        """
+        return sorted(
+            ((timing[0], timing[1], self.counters[(_event, lookup)], lookup)
+             for (_event, lookup), timing in self.timings.items() if _event == event),
+            reverse=True
+        )[:limit]
+
+    def totals(self):
+        """
+        {event: count} over all lookups.
+        """
+        totals = dict((event, 0) for event in EVENTS)
+        for (event, lookup), count in self.counters.items():
+            totals[event] = totals.get(event, 0) + count
+        return totals
@@ -0,0 +1,146 @@
+class LazySequence(object):
+    """
+    list of items that are converted on first access only.
+
+    the sequence keeps the unconverted items, converted ones are cached per
+    index. everything reading items (indexing, slicing, iteration, `in`,
+    comparisons, +) sees converted items. mutating a LazyList converts all
+    remaining items first, so it behaves like a plain list afterwards.
+    """
+    base = None
+
+    def setup(self, items, convert):
+        # items is kept if it is lazy itself, so its items stay lazy too
+        self._source = items if isinstance(items, LazySequence) else None
+        self._convert = convert
+        self._converted = {}
+
+    def raw_items(self):
+        return self.base.__iter__(self)
+
+    def _get(self, index):
+        if self._convert is None:
+            return self.base.__getitem__(self, index)
+        try:
+            return self._converted[index]
+        except KeyError:
+            pass
+        item = self._source[index] if self._source is not None else self.base.__getitem__(self, index)
+        return self._converted.setdefault(index, self._convert(item))
+
+    def materialized(self):
+        """
+        the converted items as plain list.
+        """
+        return self.base(self._get(index) for index in range(len(self)))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.base(self._get(i) for i in range(*index.indices(len(self))))
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('%s index out of range' % self.base.__name__)
+        return self._get(index)
+
+    def __getslice__(self, start, stop):
+        # python 2 calls this for simple slices of list subclasses
+        return self.__getitem__(slice(max(start, 0), max(stop, 0)))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._get(index)
+
+    def __reversed__(self):
+        for index in reversed(range(len(self))):
+            yield self._get(index)
+
+    def __contains__(self, value):
+        return any(item is value or item == value for item in self)
+
+    def index(self, value, *args):
+        return self.materialized().index(value, *args)
+
+    def count(self, value):
+        return self.materialized().count(value)
+
+    def __add__(self, other):
+        return self.materialized() + other
+
+    def __radd__(self, other):
+        return other + self.materialized()
+
+    def __mul__(self, times):
+        return self.materialized() * times
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other):
+        return self.materialized() == other
+
+    def __ne__(self, other):
+        return self.materialized() != other
+
+    def __lt__(self, other):
+        return self.materialized() < other
+
+    def __le__(self, other):
+        return self.materialized() <= other
+
+    def __gt__(self, other):
+        return self.materialized() > other
+
+    def __ge__(self, other):
+        return self.materialized() >= other
+
+    def __repr__(self):
+        return repr(self.materialized())
+
+    def __reduce__(self):
+        # copies / pickles are plain lists
+        return self.base, (self.materialized(), )
+
+
+class LazyList(LazySequence, list):
+    base = list
+
+    __hash__ = None
+
+    def __init__(self, items=(), convert=None):
+        list.__init__(self, items.raw_items() if isinstance(items, LazySequence) else items)
+        self.setup(items, convert)
+
+    def materialize(self):
+        """
+        stores all converted items in the list itself.
+        """
+        if self._convert is not None:
+            list.__setitem__(self, slice(None), self.materialized())
+            self.setup(None, None)
+
+
+def _materializing(name):
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        self.materialize()
+        return method(self, *args, **kwargs)
+    wrapper.__name__ = name
+    return wrapper
+
+for _name in ('__setitem__', '__delitem__', '__setslice__', '__delslice__', '__iadd__', '__imul__',
+              'append', 'extend', 'insert', 'pop', 'remove', 'reverse', 'sort'):
+    if hasattr(list, _name):
+        setattr(LazyList, _name, _materializing(_name))
+
+
+def lazy(items, convert):
+    """
+    items converted by convert on access, as LazyList. tuples are converted
+    at once: c code like f(*items) or '%s' % items reads the items of a
+    tuple (subclass) directly, skipping the conversion.
+    """
+    if isinstance(items, tuple):
+        return tuple(convert(item) for item in items)
+    return LazyList(items, convert)
@@ -0,0 +1,112 @@
+import threading
+from . import instrumentation
+
+
+class LazyIndex(object):
+    """
+    filter_value -> item of a list of settings, filled while scanning it:
+    a lookup reads the filter of the items only up to the first match,
+    like a plain scan of the list would. so items after the match are
+    neither wrapped nor resolved (and can't raise), and every item is read
+    at most once over all lookups.
+    """
+    def __init__(self, items, filter):
+        self._items = items
+        self._filter = filter
+        self._index = {}
+        self._scanned = 0
+        self._lock = threading.Lock()  # concurrent lookups mustn't skip items
+
+    def get(self, key, default=None):
+        index = self._index
+        try:
+            if key in index:
+                return index[key]
+        except TypeError:
+            return self.scan(key, default)  # unhashable, like a list
+        with self._lock:
+            items, filter = self._items, self._filter
+            while key not in index and self._scanned < len(items):
+                item = items[self._scanned]
+                item_key = getattr(item, filter, None)
+                self._scanned += 1
+                try:
+                    if item_key is not None and item_key not in index:
+                        index[item_key] = item
+                except TypeError:
+                    pass  # unhashable, matched by scan() only
+        return index.get(key, default)
+
+    def scan(self, key, default=None):
+        """
+        the first item whose filter equals key, without the index.
+        """
+        for item in self._items:
+            if getattr(item, self._filter, None) == key:
+                return item
+        return default
+
+
+def build_index(value, filter):
+    """
+    maps filter_value -> item for a prepared (list or dict) value, the same
+    way SettingsWrapper.apply_filter would match it. lists are indexed
+    lazily, see LazyIndex.
+    """
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, (list, tuple)) and filter:
+        return LazyIndex(value, filter)
+    return {}
+
+
+class LinkResolver(object):
+    """
+    resolves the values of one LINK ('TARGET|FILTER') for a source wrapper.
+
+    the link target is looked up on a wrapper that is resolving the link for
+    the source, and on the source itself as a fallback. each of them gets
+    prepared and indexed by the filter just once, so every linked value
+    costs a single dict lookup afterwards.
+    """
+    def __init__(self, source, link, configuration):
+        self.source = source
+        self.target, self.filter = link
+        self.configuration = configuration
+        self._link_index = None
+        self._source_index = None
+
+    def build_index(self, wrapper):
+        try:
+            value = wrapper.get_prepared_value(self.target)
+        except AttributeError:
+            return wrapper, {}  # target not available on this level
+        return wrapper, build_index(value, self.filter)
+
+    def get_link_index(self):
+        if self._link_index is None:
+            self._link_index = self.build_index(self.source.get_link_wrapper(self.configuration))
+        return self._link_index
+
+    def get_source_index(self):
+        # the source itself is just a fallback and indexed only if needed
+        if self._source_index is None:
+            self._source_index = self.build_index(self.source)
+        return self._source_index
+
+    def resolve(self, value):
+        for get_index in (self.get_link_index, self.get_source_index):
+            wrapper, index = get_index()
+            target = index.get(value, None)
+            if target is not None:
+                if instrumentation.enabled:
+                    instrumentation.record('link', self.source.get_absolute_lookup(self.target))
+                target = wrapper.load_value(self.target, target)
+                target.link_resolved()
+                return target
+        raise Exception('LINK NOT VALID: "%s"' % '|'.join(
+            part for part in (self.target, self.filter) if part
+        ))  # TODO: better Exception class
+
+    def __str__(self, ):
+        return 'LinkResolver: %s|%s (%s)' % (self.target, self.filter, self.source)
@@ -0,0 +1,41 @@
+import os
+from optparse import make_option
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from ...exceptions import InvalidSettingError
+from ...imports import import_from_string
+from ...settings import app_settings
+from ...snapshot import write_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        'Resolves every setting of the given app_configs (dotted paths) and '
+        'writes them to snapshot files, which app_settings() loads instead of '
+        'resolving the settings again (see APP_SETTINGS_SNAPSHOT_DIR).'
+    )
+    args = '<app_config app_config ...>'
+    option_list = BaseCommand.option_list + (
+        make_option(
+            '--dir', dest='directory', default=None,
+            help='directory of the snapshots, defaults to APP_SETTINGS_SNAPSHOT_DIR'
+        ),
+    )
+
+    def handle(self, *args, **options):
+        if not args:
+            raise CommandError('pass the dotted path of at least one app_config')
+        directory = options.get('directory') or getattr(settings, 'APP_SETTINGS_SNAPSHOT_DIR', None)
+        if not directory:
+            raise CommandError('pass --dir or define APP_SETTINGS_SNAPSHOT_DIR')
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        for path in args:
+            try:
+                app_config = import_from_string(None, path, 'app_settings_snapshot')
+                wrapped = app_settings(app_config, in_holder=False)
+                snapshot_path = write_snapshot(wrapped, directory)
+            except (ImportError, InvalidSettingError) as e:
+                raise CommandError(str(e))
+            self.stdout.write('%s: %s (%d settings)\n' % (path, snapshot_path, len(wrapped._frozen)))
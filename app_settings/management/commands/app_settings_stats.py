@@ -0,0 +1,50 @@
+from optparse import make_option
+from django.core.management.base import BaseCommand, CommandError
+from ...exceptions import InvalidSettingError
+from ...imports import import_from_string
+from ...instrumentation import MemoryCollector, add_collector, remove_collector
+from ...settings import app_settings
+
+
+class Command(BaseCommand):
+    help = (
+        'Resolves every setting of the given app_configs (dotted paths) with '
+        'instrumentation enabled and prints the hottest and slowest settings.'
+    )
+    args = '<app_config app_config ...>'
+    option_list = BaseCommand.option_list + (
+        make_option(
+            '--limit', type='int', dest='limit', default=10,
+            help='number of settings listed per table'
+        ),
+    )
+
+    def handle(self, *args, **options):
+        if not args:
+            raise CommandError('pass the dotted path of at least one app_config')
+        limit = options.get('limit', 10)
+
+        collector = add_collector(MemoryCollector())
+        try:
+            for path in args:
+                try:
+                    app_config = import_from_string(None, path, 'app_settings_stats')
+                    app_settings(app_config).freeze()
+                except (ImportError, InvalidSettingError) as e:
+                    raise CommandError(str(e))
+        finally:
+            remove_collector(collector)
+
+        self.stdout.write('events\n')
+        for event, count in sorted(collector.totals().items()):
+            self.stdout.write('    %-20s %10d\n' % (event, count))
+
+        for event in ('get_value', 'link', 'parent_settings'):
+            self.stdout.write('\nhottest settings (%s)\n' % event)
+            for count, lookup in collector.hottest(limit, event=event):
+                self.stdout.write('    %-60s %10d\n' % (lookup, count))
+
+        for event in ('get_attribute', 'import', 'init', 'instance_created'):
+            self.stdout.write('\nslowest settings (%s, total / max ms)\n' % event)
+            for total, maximum, count, lookup in collector.slowest(limit, event=event):
+                self.stdout.write('    %-60s %10.3f %10.3f %6d\n' % (lookup, total * 1000, maximum * 1000, count))
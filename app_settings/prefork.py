@@ -0,0 +1,88 @@
+"""
+preloading settings in the master process of prefork servers (gunicorn,
+uwsgi, ...), so the workers share the resolved settings and instances
+instead of resolving them again each.
+
+    # gunicorn.conf.py
+    preload_app = True
+
+    def post_fork(server, worker):
+        prefork.after_fork()  # done by os.register_at_fork() on python >= 3.7
+
+call preload() with the settings holders once the app is loaded (e.g. in
+AppConfig.ready()).
+"""
+import gc
+import os
+from . import instrumentation
+from .init import ClassWrapper, instance_flight, instance_registry
+
+_post_fork_hooks = []
+_registered_at_fork = False
+# pid of the process after_fork() ran in last
+_after_fork_pid = None
+
+
+def register_post_fork(hook):
+    """
+    hook is called without arguments in every forked worker, e.g. to
+    recreate instances which can't be shared. usable as decorator.
+    """
+    if hook not in _post_fork_hooks:
+        _post_fork_hooks.append(hook)
+    return hook
+
+
+def preload(holders, gc_freeze=True):
+    """
+    resolves every setting (including nested settings, collections, CLASS
+    and INIT instances) of holders now. afterwards reading them is served
+    from the frozen tables / cached values, which aren't written to anymore,
+    so the pages stay shared with the workers.
+
+    with gc_freeze the objects created so far are moved to the permanent
+    generation (python >= 3.7), so the garbage collector of the workers
+    doesn't touch (and copy) them either.
+    """
+    global _registered_at_fork
+    for holder in holders:
+        holder.freeze()
+
+    if not _registered_at_fork and hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=after_fork)
+        _registered_at_fork = True
+
+    if gc_freeze and hasattr(gc, 'freeze'):
+        gc.collect()
+        gc.freeze()
+
+
+def after_fork():
+    """
+    to be called in every worker right after the fork: replaces the locks
+    inherited from the master, calls after_fork() of every instance having
+    one (to reconnect etc.) and the hooks of register_post_fork().
+
+    runs once per process: on python >= 3.7 os.register_at_fork() calls it
+    already, calling it from the server's post_fork hook as well is fine.
+    """
+    global _after_fork_pid
+    pid = os.getpid()
+    if pid == _after_fork_pid:
+        return
+    _after_fork_pid = pid
+
+    instance_registry.after_fork()
+    instance_flight.after_fork()
+    for collector in list(instrumentation._collectors):
+        collector.after_fork()
+
+    for instance in instance_registry.instances():
+        if isinstance(instance, ClassWrapper):
+            continue  # stored along with the wrapped instance
+        method = getattr(instance, 'after_fork', None)
+        if callable(method):
+            method()
+
+    for hook in list(_post_fork_hooks):
+        hook()
@@ -0,0 +1,121 @@
+"""
+reloading settings without restarting.
+
+a SettingsReloader builds and resolves the new settings in the background
+and swaps them into the SettingsHolder with a single assignment. reading
+settings takes no lock: readers get either the old or the new settings,
+code needing several settings consistently reads them from
+holder.current().
+
+    reloader = SettingsReloader(settings, app_config, path='/etc/my_app.json')
+    reloader.start()  # checks the mtime of path every second
+    ...
+    reloader.reload()  # or explicitly
+"""
+import json
+import logging
+import os
+import threading
+from . import sources
+from .settings import app_settings
+
+logger = logging.getLogger(__name__)
+
+
+class SettingsReloader(object):
+    """
+    reloads the settings of holder from the json file path, from load()
+    or - if neither is given - from the django settings / sources (after
+    they were changed).
+    """
+    def __init__(self, holder, app_config, path=None, load=None, interval=1.0):
+        self.holder = holder
+        self.app_config = app_config
+        self.path = path
+        self.load = load
+        self.interval = interval
+        self.reloads = 0
+        self._mtime = self.get_mtime()
+        self._lock = threading.Lock()  # one reload at a time, readers don't lock
+        self._stop = threading.Event()
+        self._thread = None
+
+    def get_mtime(self):
+        if self.path is None:
+            return None
+        try:
+            return os.stat(self.path).st_mtime
+        except OSError:
+            return None
+
+    def load_settings(self):
+        if self.load is not None:
+            return self.load()
+        if self.path is not None:
+            with open(self.path) as f:
+                return json.load(f)
+        return sources.get_settings(self.app_config['NAME'])
+
+    def build(self, new_settings):
+        """
+        the new settings wrapper, fully resolved. it is built from
+        new_settings alone (links included), the django settings and the
+        wrapper being replaced stay untouched. cached values are keyed by
+        fingerprint, so the old and the new settings don't share any.
+        """
+        wrapped = app_settings(
+            self.app_config,
+            in_holder=False,
+            wrapper_class=self.holder.current().__class__,
+            settings=new_settings if new_settings is not None else {}
+        )
+        return wrapped.validate().freeze()
+
+    def reload(self, new_settings=None):
+        """
+        replaces the settings of holder by new_settings (loaded, if not
+        given) and returns the new settings wrapper. raises and keeps the
+        old settings, if the new ones are invalid.
+        """
+        with self._lock:
+            if new_settings is None:
+                new_settings = self.load_settings()
+            wrapped = self.build(new_settings)
+            self.holder._wrapped = wrapped
+            self.reloads += 1
+        return wrapped
+
+    def check(self):
+        """
+        reloads, if the file changed since the last check. returns whether
+        it did.
+        """
+        mtime = self.get_mtime()
+        if mtime is None or mtime == self._mtime:
+            return False
+        self._mtime = mtime
+        self.reload()
+        return True
+
+    def run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception('reloading %s failed, keeping the current settings', self.app_config['NAME'])
+
+    def start(self):
+        if self.path is None:
+            raise Exception('watching needs a path, call reload() for reloading explicitly')
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.run, name='app_settings reloader')
+            self._thread.daemon = True
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,206 @@
+from .fingerprint import fingerprint
+
+DEFAULT_ATTRIBUTES = ('PROTECTED', 'CLASS')
+DEFAULT_IMPORT_TARGETS = ('_INIT_METHOD', 'CLASS')
+DEFAULT_GLOBALS = ('DEBUG', '_INIT_METHOD')
+
+
+def unpack_filter(value):
+    if value and '|' in value:
+        return tuple(value.split('|'))
+    else:
+        return value, None
+
+
+class SettingsSchema(object):
+    """
+    compiled lookup tables for one level of an app_config.
+
+    a schema is built once from the app_config entries (SETTINGS, DEFAULTS,
+    IMPORT_STRINGS, ONE_TO_MANY, LINK, INIT, GLOBALS) and shared by every
+    SettingsWrapper of the same level. child schemas are derived once per
+    attribute_name and memoized, so wrappers created by as_wrapped() don't
+    recompute anything. all tables are meant to be read only.
+    """
+    fields = (
+        'available_settings', 'import_strings', 'one_to_many', 'defaults',
+        'links', 'init', 'global_settings', 'validation_method'
+    )
+
+    def __init__(self, available_settings=None, import_strings=None, one_to_many=None, defaults=None,
+                 links=None, init=None, global_settings=None, validation_method=None):
+        self.available_settings = available_settings or {}
+        self.import_strings = list(import_strings or [])
+        self.one_to_many = one_to_many or {}
+        self.defaults = defaults or {}
+        self.links = links or {}
+        self.init = frozenset(init or [])
+        self.global_settings = list(global_settings or [])
+        self.validation_method = validation_method or None
+
+        self.globals = frozenset(self.global_settings) | frozenset(DEFAULT_GLOBALS)
+        self.import_targets = frozenset(self.import_strings) | frozenset(DEFAULT_IMPORT_TARGETS)
+
+        self.available_attributes = dict(self.available_settings)
+        for key in DEFAULT_ATTRIBUTES + tuple(self.globals):
+            self.available_attributes[key] = None
+
+        self.many_for_one = {}
+        for key, value in self.one_to_many.items():
+            target, filter = unpack_filter(value)
+            self.many_for_one[target] = (key, filter)
+
+        self.unpacked_links = {}
+        for key, value in self.links.items():
+            self.unpacked_links[key] = unpack_filter(value)
+
+        self._children = {}
+        self._kwargs = None
+        self._fingerprint = None
+        self._dependency_names = {}
+        self._all_names = None
+        self.root = self
+
+    @classmethod
+    def from_app_config(cls, app_config):
+        return cls(
+            available_settings=app_config.get('SETTINGS', None),
+            defaults=app_config.get('DEFAULTS', None),
+            import_strings=app_config.get('IMPORT_STRINGS', None),
+            one_to_many=app_config.get('ONE_TO_MANY', None),
+            validation_method=app_config.get('VALIDATION_METHOD', None),
+            links=app_config.get('LINK', None),
+            init=app_config.get('INIT', None),
+            global_settings=app_config.get('GLOBALS'),
+        )
+
+    def get_many_for_one(self, attribute_name):
+        return self.many_for_one.get(attribute_name, (None, None))
+
+    def get_link(self, attribute_name, many_for_one_lookup=None):
+        return (
+            self.unpacked_links.get(attribute_name, None) or
+            self.unpacked_links.get(many_for_one_lookup, None)
+        )
+
+    def get_fingerprint(self):
+        if self._fingerprint is None:
+            self._fingerprint = fingerprint(self.as_kwargs())
+        return self._fingerprint
+
+    def as_kwargs(self):
+        kwargs = self._kwargs
+        if kwargs is None:
+            kwargs = self._kwargs = dict((name, getattr(self, name)) for name in self.fields)
+        return dict(kwargs)
+
+    def child(self, attribute_name):
+        """
+        schema of the settings wrapped for attribute_name. the other kwargs
+        of child wrappers come from SettingsWrapper.wrap_own_kwargs.
+        """
+        try:
+            return self._children[attribute_name]
+        except KeyError:
+            pass
+
+        prefix = attribute_name + '.'
+
+        def strip_prefix(strings):
+            return [string[len(prefix):] for string in strings if string.startswith(prefix)]
+
+        def filter_prefix(mapping, inherit_values):
+            new_dict = {}
+            for key, value in mapping.items():
+                add = False
+                if key.startswith(prefix):
+                    add = True
+                    key = key[len(prefix):]
+                if value.startswith(prefix):
+                    # only if its one_to_many kwarg, the value may cause an inheritance to the next wrapper
+                    add = inherit_values
+                    value = value[len(prefix):]
+                if add:
+                    new_dict[key] = value
+            return new_dict
+
+        child = self.__class__(
+            available_settings=self.available_settings.get(attribute_name, None),
+            defaults=self.defaults.get(attribute_name, None),
+            import_strings=strip_prefix(self.import_strings),
+            init=strip_prefix(self.init),
+            one_to_many=filter_prefix(self.one_to_many, True),
+            links=filter_prefix(self.links, False),
+            global_settings=self.global_settings,
+        )
+        child.root = self.root
+        self._children[attribute_name] = child
+        return child
+
+    def get_dependency_names(self, attribute_name):
+        """
+        every setting name the value of attribute_name may be resolved from:
+        itself, its nested settings, one to many counterparts, link targets
+        and globals. a configuration without any of them can't change it.
+        """
+        try:
+            return self._dependency_names[attribute_name]
+        except KeyError:
+            pass
+        names = set()
+        self._add_dependency_names(attribute_name, names, set())
+        names = self._dependency_names[attribute_name] = frozenset(names)
+        return names
+
+    def _add_dependency_names(self, attribute_name, names, visited):
+        if (id(self), attribute_name) in visited:
+            return
+        visited.add((id(self), attribute_name))
+
+        names.add(attribute_name)
+        names.add(attribute_name + '_COLLECTION')
+        many_for_one_lookup = self.get_many_for_one(attribute_name)[0]
+        if many_for_one_lookup:
+            names.add(many_for_one_lookup)
+
+        link = self.get_link(attribute_name, many_for_one_lookup)
+        if link:
+            # link targets are looked up from the root
+            self.root._add_dependency_names(link[0], names, visited)
+
+        if (
+            isinstance(self.available_settings.get(attribute_name, None), dict) or
+            isinstance(self.available_settings.get(many_for_one_lookup, None), dict)
+        ):
+            names.update(self.globals)
+            child = self.child(many_for_one_lookup or attribute_name)
+            for name in child.available_settings:
+                child._add_dependency_names(name, names, visited)
+
+    def get_all_names(self):
+        """
+        every setting name known to the schema, on any level.
+        """
+        if self._all_names is None:
+            names = set()
+            for name in self.available_attributes:
+                names.update(self.get_dependency_names(name))
+            self._all_names = frozenset(names)
+        return self._all_names
+
+
+_schemas = {}
+
+
+def get_schema(app_config):
+    """
+    returns the (cached) root schema of app_config.
+    """
+    try:
+        return _schemas[id(app_config)][1]
+    except KeyError:
+        pass
+    schema = SettingsSchema.from_app_config(app_config)
+    # keep a reference to app_config, so its id can't be reused
+    _schemas[id(app_config)] = (app_config, schema)
+    return schema
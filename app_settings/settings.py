@@ -1,27 +1,18 @@
 import logging
-from django.utils import importlib
-from .init import get_instance, get_wrapped_instance
-from .exceptions import InvalidSettingError
-from .utils import dict_merge
-
-
-def perform_import(settings_name, val, setting_lookup):
-    """
-    If the given setting is a string import notation,
-    then perform the necessary import or imports.
-    """
-    if not val:
-        return None
-    if isinstance(val, basestring):
-        return import_from_string(settings_name, val, setting_lookup)
-    elif isinstance(val, (list, tuple)):
-        return [import_from_string(settings_name, item, setting_lookup) for item in val]
-    elif isinstance(val, dict):
-        ret = {}
-        for key, value in val.items():
-            ret[key] = import_from_string(settings_name, value, setting_lookup)
-        val = ret
-    return val
+import weakref
+from . import cache, instrumentation, sources
+from .context import get_override
+from .imports import import_from_string, perform_import, preload_imports
+from .init import ClassWrapper, get_instance, get_wrapped_instance
+from .lazy import LazySequence, lazy
+from .links import LinkResolver, build_index
+from . import validation
+from .exceptions import InvalidSettingError, SettingsValidationError
+from .dependencies import DependencyGraph, changed_keys
+from .fingerprint import combine, fingerprint as fingerprint_of
+from .schema import SettingsSchema, get_schema, unpack_filter
+from .snapshot import load_snapshot
+from .utils import ReadOnlyDict, dict_merge
 
 
 def perform_init(settings_name, val, setting_lookup, init_method):
@@ -30,47 +21,62 @@ def perform_init(settings_name, val, setting_lookup, init_method):
         raise Exception('init method "%s" is not callable' % init_method)  # TODO: better class
 
     if isinstance(val, (tuple, list)):
-        ret = val.__class__()
-
-        for current_val in val:
-            if not isinstance(current_val, (basestring, dict, SettingsWrapper)):
-                return val
-            instance = init_method(current_val)
-            ret += val.__class__((instance, ))
-
-        return ret
+        # lazy values are wrapped settings already
+        if not isinstance(val, LazySequence):
+            for current_val in val:
+                if not isinstance(current_val, (basestring, dict, BaseSettingsWrapper)):
+                    return val
+
+        # items are initialized on access
+        return lazy(val, init_method)
     elif isinstance(val, dict):
         ret = {}
         for key, value in val.items():
             ret[key] = init_method(value)
         val = ret
 
-    if not isinstance(val, (SettingsWrapper)):
+    if not isinstance(val, (BaseSettingsWrapper)):
         return val
     return init_method(val)
 
 
-def import_from_string(settings_name, val, setting_lookup, scope=None):
+def configuration_keys(configuration):
     """
-    Attempt to import a class from a string representation.
+    the names a configuration sets, on its own or in '.'.
     """
-    # TODO: use scope for more detailed Exception message
-    parts = val.split('.')
-    module_path, class_name = '.'.join(parts[:-1]), parts[-1]
-    try:
-        # Nod to tastypie's use of importlib.
-        module = importlib.import_module(module_path)
-        return getattr(module, class_name)
-    except Exception:
-        raise
-        msg = "Could not import Class '%s' from module '%s' for '%s' setting '%s'" % (
-            class_name, module_path, settings_name, setting_lookup
-        )
-        raise ImportError(msg)
-    except:
-        raise
-        msg = "Could not import '%s' for '%s' setting '%s'" % (val, settings_name, setting_lookup)
-        raise ImportError(msg)
+    keys = set(configuration)
+    keys.update(configuration.get('.', None) or ())
+    keys.discard('.')
+    return keys
+
+
+def iter_wrappers(value):
+    """
+    the settings wrappers in a (prepared) value: the value itself or the
+    items of a list, tuple or collection.
+    """
+    if isinstance(value, BaseSettingsWrapper):
+        return [value]
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, (list, tuple)):
+        return []
+    return [item for item in value if isinstance(item, BaseSettingsWrapper)]
+
+
+def holds_wrappers(value):
+    """
+    whether value is or contains settings wrappers (also lazily or bound to
+    a class). they point back to the wrapper that resolved them, which may
+    still be configured or updated, so they aren't shared between wrappers.
+    """
+    if isinstance(value, (BaseSettingsWrapper, LazySequence, ClassWrapper)):
+        return True
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, (list, tuple, set, frozenset)):
+        return False
+    return any(holds_wrappers(item) for item in value)
 
 
 class SettingsHolder(object):
@@ -79,61 +85,130 @@ class SettingsHolder(object):
 
     @property
     def _wrapped(self):
-        return self.__wrapped
+        # overrides are local to the current thread / task, see override_app_settings
+        return get_override(self, self.__wrapped)
 
     @_wrapped.setter
     def _wrapped(self, wrapped):
+        # a single assignment, readers see either the old or the new settings (see reload)
         self.__wrapped = wrapped
 
+    def current(self):
+        """
+        the settings active right now. reading several settings from it is
+        consistent, even if they are reloaded meanwhile.
+        """
+        return self._wrapped
+
     def __getattr__(self, name):
         return getattr(self._wrapped, name)
 
+    def __getitem__(self, path):
+        return self._wrapped[path]
+
+    def __iter__(self):
+        return iter(self._wrapped)
+
+    def __contains__(self, path):
+        return path in self._wrapped
+
+    def freeze(self):
+        self._wrapped.freeze()
+        return self
+
+
+class BaseSettingsWrapper(object):
+    """
+    the settings wrapper logic. subclasses may change where the state (the
+    names in `state`) and the kwargs are stored and how resolved values are
+    cached: by default (SettingsWrapper) in the __dict__ of the wrapper,
+    CompactSettingsWrapper uses slots.
+    """
+    __slots__ = ()
+
+    state = (
+        '_config', '_dict', '_schema', '_many_for_one', '_fingerprint',
+        '_shared', '_frozen', '_paths', '_graph', '_base', '_overlay_keys', '_overlays'
+    )
+
+    # the kwargs that aren't part of the (shared) schema
+    instance_kwargs = (
+        'lookup_path', 'parent_settings', 'upper_setting', 'resolving_link',
+        'parent_setting', 'configuration'
+    )
 
-class SettingsWrapper(object):
     def __init__(self, config=None, settings=None, available_settings=None, import_strings=None, validation_method=None,
                  one_to_many=None, parent_settings=None, defaults=None, configuration=None, lookup_path=None,
                  links=None, init=None, upper_setting=None, global_settings=None,
-                 resolving_link=False, parent_setting=None, **kwargs):
+                 resolving_link=False, parent_setting=None, schema=None, **kwargs):
         # **kwargs are important for compatibility and can be ignored
-        self.__dict__['_config'] = config or {}
+        self._config = config or {}
+
+        self._dict = settings or {}
+
+        if schema is None:
+            schema = SettingsSchema(
+                available_settings=available_settings,
+                import_strings=import_strings,
+                validation_method=validation_method,
+                one_to_many=one_to_many,
+                defaults=defaults,
+                links=links,
+                init=init,
+                global_settings=global_settings
+            )
+        self._schema = schema
+        self._many_for_one = schema.many_for_one
+        self._fingerprint = None
+        self._shared = None
+        self._frozen = None
+        self._paths = None
+        self._graph = None
+        self._base = None
+        self._overlay_keys = None
+        self._overlays = None
+
+        self.init_kwargs(
+            lookup_path=lookup_path or '',
+            parent_settings=parent_settings or None,  # is accessed with getattr()
+            upper_setting=upper_setting,
+            resolving_link=resolving_link,
+            parent_setting=parent_setting,
+            configuration=None
+        )
+        if configuration:
+            self.configure(configuration)
 
-        self.__dict__['_dict'] = settings or {}
+    def init_kwargs(self, **kwargs):
+        self._kwargs = self._schema.as_kwargs()
+        self._kwargs.update(kwargs)
 
-        self.__dict__['_kwargs'] = {}
-        self.__dict__['_kwargs']['lookup_path'] = lookup_path or ''
-        self.__dict__['_kwargs']['available_settings'] = available_settings or {}
-        self.__dict__['_kwargs']['validation_method'] = validation_method or None
+    def get_kwarg(self, name):
+        return self._kwargs.get(name)
 
-        self.__dict__['_kwargs']['import_strings'] = list(import_strings or [])
-        self.__dict__['_kwargs']['one_to_many'] = one_to_many or {}
-        self.__dict__['_many_for_one'] = {}
-        for key, value in self.__dict__['_kwargs']['one_to_many'].items():
-            target, filter = self.unpack_filter(value)
-            self.__dict__['_many_for_one'][target] = '|'.join((key, filter) if filter else (key, ))
+    def set_kwarg(self, name, value):
+        self._kwargs[name] = value
 
-        self.__dict__['_kwargs']['parent_settings'] = parent_settings or None  # is accessed with getattr()
-        self.__dict__['_kwargs']['defaults'] = defaults or {}
-        self.__dict__['_kwargs']['global_settings'] = global_settings or []
+    def list_kwargs(self):
+        return self._kwargs.keys()
 
-        self.__dict__['_kwargs']['upper_setting'] = upper_setting
-        self.__dict__['_kwargs']['resolving_link'] = resolving_link
-        self.__dict__['_kwargs']['parent_setting'] = parent_setting
+    def cache_value(self, name, value):
+        setattr(self, name, value)
 
-        self.__dict__['_kwargs']['links'] = links or {}
-        self.__dict__['_kwargs']['init'] = init or {}
+    def uncache_value(self, name):
+        self.__dict__.pop(name, None)
 
-        self.__dict__['_kwargs']['configuration'] = None
-        if configuration:
-            self.configure(configuration)
+    def get_wrapper_class(self):
+        return self.__class__
 
     def unpack_filter(self, value):
-        if value and '|' in value:
-            return value.split('|')
-        else:
-            return value, None
+        return unpack_filter(value)
+
+    def get_schema(self):
+        return self._schema
 
     def as_dict(self):
-        return self.__dict__['_dict']
+        return self._dict
 
     def deprecation_warning(self, attribute_name, message=None):
         pass  # TODO: implement deprecation warning for settings wrapper
@@ -142,7 +217,7 @@ class SettingsWrapper(object):
         return self.get_kwarg('configuration')
 
     def link_resolved(self):
-        self.__dict__['_kwargs']['resolving_link'] = False
+        self.set_kwarg('resolving_link', False)
 
     def get_configuration_value(self, attribute_name):
         value = None
@@ -179,16 +254,20 @@ class SettingsWrapper(object):
         return value
 
     def get_value(self, attribute_name):
-        many_for_one_lookup, many_for_one_filter = self.unpack_filter(self.__dict__['_many_for_one'].get(attribute_name, None))
+        if instrumentation.enabled:
+            instrumentation.record('get_value', self.get_absolute_lookup(attribute_name))
+        many_for_one_lookup, many_for_one_filter = self.get_schema().get_many_for_one(attribute_name)
         wrap_one_to_many = False
         value = self.get_configuration_value(attribute_name)
         if isinstance(value, dict):
             value = None
 
         if value is None:
-            value = self.__dict__['_dict'].get(attribute_name, None)
+            value = self._dict.get(attribute_name, None)
 
         if value is None and self.get_kwarg('parent_settings') is not None:
+            if instrumentation.enabled:
+                instrumentation.record('parent_settings', self.get_absolute_lookup(attribute_name))
             value = getattr(self.get_kwarg('parent_settings'), attribute_name, None)
 
         if value is None and many_for_one_lookup:
@@ -205,6 +284,7 @@ class SettingsWrapper(object):
                         if many_for_one_filter not in value:
                             raise InvalidSettingError(many_for_one_filter, value)
                         value_lookup = value.get(many_for_one_filter)
+                        value = dict(value)  # don't touch the (shared) settings or defaults
                         value.update(self.get_configuration(value_lookup) or {})
                         ret[value_lookup] = value
                     value = ret
@@ -251,30 +331,18 @@ class SettingsWrapper(object):
         return value
 
     def list_available_attributes(self):
-        available_settings = {}
-
         # TODO: self.get_absolute_lookup(settings_name=False) in self.get_kwargs('init'): append 'CLASS'/'_INIT_METHOD'
-        default_attributes = ['PROTECTED', 'CLASS']
-        default_attributes += self.list_globals()
-
-        for key, value in self.get_kwarg('available_settings').items():
-            available_settings[key] = value
-        for key in default_attributes:
-            available_settings[key] = None
-
-        return available_settings
+        return self.get_schema().available_attributes
 
     def list_import_targets(self):
-        default_targets = ['_INIT_METHOD', 'CLASS']
-        return self.get_kwarg('import_strings') + default_targets
+        return self.get_schema().import_targets
 
     def list_globals(self):
-        default_globals = ['DEBUG', '_INIT_METHOD']
-        return self.get_kwarg('global_settings') + default_globals
+        return self.get_schema().globals
 
     def get_absolute_lookup(self, attribute_name, include_settings_name=True):
         return (
-            (self.__dict__['_config'].get('NAME') + '.')
+            (self._config.get('NAME') + '.')
             if include_settings_name else
             '') + (
                 (self.get_kwarg('lookup_path') + '.')
@@ -288,12 +356,80 @@ class SettingsWrapper(object):
             allow nested settings access
             TODO: is this usefull?
         """
-        settings = name.split('.')
+        if name in self.state or name.startswith('__'):
+            raise AttributeError(name)  # not initialized (yet)
+        if '.' in name:
+            return self.get_path(name)
+        frozen = self._frozen
+        if frozen is not None and name in frozen:
+            return frozen[name]
+        paths = self._paths
+        if paths is not None and name in paths:
+            return paths[name]
+        return self.get_attribute(name)
+
+    def __getitem__(self, path):
+        if not isinstance(path, basestring):
+            raise TypeError('settings are looked up by dotted path, not by %r' % (path, ))
+        return self.get_path(path)
+
+    # without these iter() and `in` would fall back to __getitem__(0), ...
+    def __iter__(self):
+        raise TypeError("'%s' object is not iterable" % self.__class__.__name__)
+
+    def __contains__(self, path):
+        raise TypeError("'%s' object doesn't support `in`, use get_path()" % self.__class__.__name__)
+
+    def get_path(self, path):
+        """
+        value of the dotted path 'A.B.C' (like settings.A.B.C). resolved
+        paths are remembered in a flat table, so reading them again is a
+        single dict lookup - see preload_paths() and freeze() for filling
+        it up front.
+        """
+        paths = self._paths
+        if paths is not None and path in paths:
+            return paths[path]
+        frozen = self._frozen
+        if frozen is not None and path in frozen:
+            return frozen[path]
+
         obj = self
-        for setting_name in settings:
+        for setting_name in path.split('.'):
             obj = obj.get_attribute(setting_name)
+
+        if paths is None:
+            paths = self._paths = {}
+        paths[path] = obj
         return obj
 
+    def preload_paths(self, path=None):
+        """
+        resolves the subtree below path (all settings, if path is None) at
+        once and adds every path in it to the table of get_path().
+        """
+        if path is None:
+            self.freeze()
+            return self
+        value = self.get_path(path)
+        if isinstance(value, BaseSettingsWrapper):
+            value.freeze()
+            prefix = path + '.'
+            self.add_paths(dict((prefix + key, child_value) for key, child_value in value._frozen.items()))
+        return self
+
+    def add_paths(self, paths):
+        """
+        adds already resolved {path: value} to the table of get_path() (see
+        snapshot.load_snapshot()). they depend on the inputs of the setting
+        they start with, like resolved values do.
+        """
+        if self._paths is None:
+            self._paths = {}
+        self._paths.update(paths)
+        for name in set(path.split('.', 1)[0] for path in paths):
+            self.record_dependencies(name)
+
     def get_attribute(self, name, filter=None, filter_value=None):
         # shortcuts
         if name == '_PARENT':
@@ -302,57 +438,176 @@ class SettingsWrapper(object):
             return self._INIT_METHOD(self)
 
         # test if requested attribute is available
-        available_attributes = self.list_available_attributes()
-        if name not in available_attributes:
-            self.raise_error(
-                AttributeError,
-                attribute_name=name
-            )  # TODO: maybe raise SettingNotAvailable or similar
-        if ('_DEPRECATED_' + name) in available_attributes:
-            self.deprecation_warning(name, available_attributes['_DEPRECATED_' + name])
+        self.check_available(name)
+
+        # overlays share whatever their configuration doesn't affect
+        if filter is None:
+            base = self.get_base(name)
+            if base is not None:
+                return getattr(base, name)
+
+        # serve from the process wide cache, if another wrapper of the same
+        # fingerprint already resolved this attribute
+        cache_key = self.get_cache_key(name, filter, filter_value)
+        if cache_key is not None:
+            value = cache.get_value(self.get_settings_name(), cache_key)
+            if value is not cache.Empty:
+                if instrumentation.enabled:
+                    instrumentation.record('cache_hit', self.get_absolute_lookup(name))
+                if filter is None and filter_value is None:
+                    self.cache_value(name, value)
+                    self.record_dependencies(name)
+                return value
+
+        start = instrumentation.enabled and instrumentation.clock()
 
         # get value
         value = self.get_value(name)
 
-        # validate value  # TODO: do this when writing a configuration / loading settings
         if value is None:
             self.raise_error(
                 attribute_name=name
             )
-        validation_method = None
-        if ('_VALIDATE_' + name) in self.__dict__['_dict']:
-            validation_method = perform_import(
-                self.get_absolute_lookup(name),
-                self.__dict__['_dict']['_VALIDATE_' + name],
-                '_VALIDATE_' + name
-            )
-        elif self.get_kwarg('validation_method') is not None:
-            validation_method = perform_import(
-                self.get_absolute_lookup(name),
-                self.get_kwarg('validation_method'),
-                'validation_method'
-            )
-        if validation_method is not None and False:  # TODO
-            if not validation_method(name, value):
-                self.raise_error(
-                    attribute_name=name
-                )  # TODO: maybe raise SettingsInvalid or similar
 
         # finalize the value: imports / init / ...
         value = self.finalize_value(name, value, filter, filter_value)
 
-        # cache for next access and return
-        setattr(self, name, value)
+        # cache for next access and return. filtered lookups are cached in
+        # the process wide cache only, the attribute holds the unfiltered value
+        if cache_key is not None and not holds_wrappers(value):
+            cache.set_value(self.get_settings_name(), cache_key, value)
+        if filter is None and filter_value is None:
+            self.cache_value(name, value)
+            self.record_dependencies(name)
+
+        if start:
+            instrumentation.record('get_attribute', self.get_absolute_lookup(name), instrumentation.clock() - start)
         return value
 
+    def record_dependencies(self, name):
+        """
+        remembers the inputs the cached value of name was resolved from: the
+        setting itself, its nested settings, link targets, one to many
+        counterparts and globals (see SettingsSchema.get_dependency_names).
+        """
+        graph = self._graph
+        if graph is None:
+            graph = self._graph = DependencyGraph()
+        graph.add(name, self.get_schema().get_dependency_names(name))
+
+    def invalidate(self, inputs):
+        """
+        drops the cached values depending on any of inputs (names of
+        settings or configuration entries), they are resolved again on
+        access. returns their names.
+        """
+        graph = self._graph
+        if not graph:
+            return set()
+        if set(inputs) - self.get_schema().get_all_names():
+            names = set(graph.inputs)  # may be a collection lookup value, which could affect anything
+        else:
+            names = graph.affected(inputs)
+
+        for name in names:
+            graph.remove(name)
+            self.uncache_value(name)
+        if self._paths and names:
+            for path in list(self._paths):
+                if path.split('.', 1)[0] in names:
+                    del self._paths[path]
+        if self._frozen and names:
+            self._frozen = ReadOnlyDict(
+                (path, value) for path, value in self._frozen.items() if path.split('.', 1)[0] not in names
+            )
+        return names
+
+    def update_settings(self, settings):
+        """
+        replaces the settings of this wrapper (like the dict in the django
+        settings) and of the overlays derived from it. only cached values
+        depending on changed entries are dropped, returns their names (of
+        this wrapper).
+        """
+        if self._overlays:
+            for overlay in list(self._overlays.values()):
+                overlay.update_settings(settings)
+        changed = changed_keys(self._dict, settings)
+        self._dict = settings or {}
+        if not changed:
+            return set()
+        self._fingerprint = None
+        self._shared = None
+        return self.invalidate(changed)
+
+    def check_available(self, name):
+        available_attributes = self.list_available_attributes()
+        if name not in available_attributes:
+            self.raise_error(
+                AttributeError,
+                attribute_name=name
+            )  # TODO: maybe raise SettingNotAvailable or similar
+        if ('_DEPRECATED_' + name) in available_attributes:
+            self.deprecation_warning(name, available_attributes['_DEPRECATED_' + name])
+
+    def get_settings_name(self):
+        return self._config.get('NAME')
+
+    def get_fingerprint(self):
+        """
+        canonical digest of the settings, configuration and position of this
+        wrapper. computed once and chained from the parent wrappers, wrappers
+        with equal fingerprints resolve equal values - in any process.
+        """
+        fingerprint = self._fingerprint
+        if fingerprint is None:
+            parent_setting = self.get_kwarg('parent_setting')
+            upper_setting = self.get_kwarg('upper_setting')
+            # kwargs added by subclasses, see ExampleSubclassWrapper
+            extra_kwargs = dict(
+                (name, self.get_kwarg(name)) for name in self.list_kwargs()
+                if name not in self.instance_kwargs and name not in SettingsSchema.fields
+            )
+            fingerprint = combine(
+                '%s.%s' % (self.__class__.__module__, self.__class__.__name__),
+                fingerprint_of(extra_kwargs) if extra_kwargs else '',
+                self.get_schema().get_fingerprint() if not upper_setting else '',
+                self.get_settings_name() or '',
+                self.get_kwarg('lookup_path'),
+                fingerprint_of(self._dict, memoize=True),
+                fingerprint_of(self.get_active_configuration()) if self.get_active_configuration() else '',
+                'link' if self.get_kwarg('resolving_link') else '',
+                parent_setting.get_fingerprint() if parent_setting is not None else '',
+                upper_setting.get_fingerprint() if upper_setting is not None else '',
+            )
+            self._fingerprint = fingerprint
+        return fingerprint
+
+    def get_cache_key(self, name, filter=None, filter_value=None):
+        if self.get_kwarg('parent_settings') is not None:
+            return None  # values depend on another settings object
+        return (self.get_fingerprint(), name, filter, filter_value)
+
     def get_filtered(self, attribute_name, filter, filter_value):
         # TODO: getattr, because of nested attribute_name
         if not isinstance(filter_value, basestring):
             raise Exception(attribute_name, filter, filter_value.__dict__)
         return self.get_attribute(attribute_name, filter, filter_value)
 
-    def finalize_value(self, attribute_name, value, filter, filter_value):
-        many_for_one_lookup, many_for_one_filter = self.unpack_filter(self.__dict__['_many_for_one'].get(attribute_name, None))
+    def get_prepared_value(self, attribute_name):
+        """
+        value of attribute_name with resolved links and wrapped child settings,
+        but before any filter, import or init is applied.
+        """
+        self.check_available(attribute_name)
+        value = self.get_value(attribute_name)
+        if value is None:
+            self.raise_error(
+                attribute_name=attribute_name
+            )
+        return self.prepare_value(attribute_name, value)
+
+    def get_link_configuration(self, many_for_one_filter=None):
         configuration = (self.get_active_configuration() or {'.': None}).get('.')
         if many_for_one_filter:
             conf = self.get_configuration(many_for_one_filter=many_for_one_filter)
@@ -360,44 +615,79 @@ class SettingsWrapper(object):
                 configuration = conf
             elif conf:
                 configuration.update(conf)
+        return configuration
+
+    def get_link_wrapper(self, configuration):
+        # links are resolved within the settings this wrapper was built from,
+        # not the ones the sources hold by now (see reload)
+        return app_settings(
+            self._config,
+            resolving_link_for=self,  # no: self.get_kwarg('parent_setting') if self.get_kwarg('resolving_link') else
+            configuration=configuration,
+            in_holder=False,
+            wrapper_class=self.get_wrapper_class(),
+            settings=self.get_root().as_dict()
+        )
+
+    def get_root(self):
+        """
+        the top level wrapper these (nested) settings belong to.
+        """
+        wrapper = self
+        upper_setting = wrapper.get_kwarg('upper_setting')
+        while upper_setting is not None:
+            wrapper = upper_setting
+            upper_setting = wrapper.get_kwarg('upper_setting')
+        return wrapper
+
+    def get_shared(self, key, factory):
+        """
+        returns factory(), built once for this wrapper (until it is
+        configured or updated). key has to be unique within the wrapper.
+        link resolvers and indexes hold this wrapper, so unlike resolved
+        values they aren't shared with other wrappers of the same fingerprint.
+        """
+        if self._shared is None:
+            self._shared = {}
+        shared = self._shared.get(key, None)
+        if shared is None:
+            shared = self._shared[key] = factory()
+        return shared
+
+    def get_link_resolver(self, link, many_for_one_filter=None):
+        return self.get_shared(
+            (LinkResolver, link, many_for_one_filter),
+            lambda: LinkResolver(self, link, self.get_link_configuration(many_for_one_filter))
+        )
+
+    def get_index(self, attribute_name, filter, value=None):
+        """
+        (prepared value, filter_value -> item index) of attribute_name, so
+        filtered lookups of collections and one to many settings don't have
+        to prepare and scan the value again (see links.build_index). built on
+        first use, dropped by configure() and update_settings().
+        """
+        def factory():
+            prepared = (
+                self.get_prepared_value(attribute_name)
+                if value is None else
+                self.prepare_value(attribute_name, value)
+            )
+            return prepared, build_index(prepared, filter)
+        return self.get_shared((build_index, attribute_name, filter), factory)
+
+    def prepare_value(self, attribute_name, value):
+        many_for_one_lookup, many_for_one_filter = self.get_schema().get_many_for_one(attribute_name)
 
         # handle links
-        target = None
-        link = self.get_kwarg('links').get(attribute_name, None) or self.get_kwarg('links').get(many_for_one_lookup, None)
+        link = self.get_schema().get_link(attribute_name, many_for_one_lookup)
         if link and isinstance(value, (list, tuple, basestring)):
-            target, filter = self.unpack_filter(link)
-
-            new_config = self.__dict__['_config']
-            resolving_link_for = self  # no: self.get_kwarg('parent_setting') if self.get_kwarg('resolving_link') else
+            resolver = self.get_link_resolver(link, many_for_one_filter)
             if isinstance(value, (list, tuple)):
-                link_target = value.__class__()
-                for temp_value in value:
-                    temp_target = app_settings(
-                        new_config,
-                        resolving_link_for=resolving_link_for,
-                        configuration=configuration,
-                        in_holder=False
-                    ).get_filtered(target, filter, temp_value)
-                    if not temp_target:
-                        temp_target = self.get_filtered(target, filter, temp_value)
-                    if not temp_target:
-                        raise Exception('LINK NOT VALID: "%s"' % link) # TODO: better Exception class
-                    temp_target.link_resolved()
-                    link_target += value.__class__([temp_target, ])
+                value = value.__class__([resolver.resolve(temp_value) for temp_value in value])
             else:
-                link_target = app_settings(
-                    new_config,
-                    resolving_link_for=resolving_link_for,
-                    configuration=configuration,
-                    in_holder=False
-                ).get_filtered(target, filter, value)
-                if link_target is None:
-                    link_target = self.get_filtered(target, filter, value)
-                if not link_target:
-                    raise Exception('LINK NOT VALID: "%s"' % link) # TODO: better Exception class
-                link_target.link_resolved()
-
-            value = link_target
+                value = resolver.resolve(value)
+
         # wrap child settings (but no collections!)
         if (
             attribute_name.endswith('_COLLECTION') or
@@ -420,61 +710,78 @@ class SettingsWrapper(object):
             isinstance(self.get_kwarg('available_settings').get(many_for_one_lookup, None), dict)
         ):
             if isinstance(value, (tuple, list)):
-                if len(value) and not isinstance(value[0], SettingsWrapper):
-                    new_value = value.__class__()
-                    for val in value:
-                        new_value += value.__class__(
-                            (self.as_wrapped(
-                                attribute_name=(many_for_one_lookup or attribute_name),
-                                value=val,
-                                many_for_one_filter=many_for_one_filter
-                            ), )
-                        )
-                    value = new_value
-            elif not isinstance(value, SettingsWrapper):
+                if len(value) and not isinstance(value[0], BaseSettingsWrapper):
+                    # items are wrapped on access
+                    value = lazy(value, lambda val: self.as_wrapped(
+                        attribute_name=(many_for_one_lookup or attribute_name),
+                        value=val,
+                        many_for_one_filter=many_for_one_filter
+                    ))
+            elif not isinstance(value, BaseSettingsWrapper):
                 value = self.as_wrapped(
                     attribute_name=attribute_name,
                     value=value,
                     many_for_one_filter=many_for_one_filter
                 )
 
-        # apply filter if needed
-        if filter_value:
-            matched = False
-            if isinstance(value, (list, tuple)) and value and filter:
-                for target in value:
-                    if getattr(target, filter, None) == filter_value:
-                        new_value = target
-                        matched = True
-                        break
-            elif isinstance(value, dict) and value:
-                new_value = value.get(filter_value, None)
-                matched = new_value is not None
-            if not matched:
-                raise Exception('filter "%s" not matched. found %s' % (filter_value, str(value)))
-            value = new_value
+        return value
+
+    def apply_filter(self, value, filter, filter_value, index=None):
+        if index is None:
+            index = build_index(value, filter)
+        new_value = index.get(filter_value, None) if value else None
+        if new_value is None:
+            raise Exception('filter "%s" not matched. found %s' % (filter_value, str(value)))
+        return new_value
+
+    def load_value(self, attribute_name, value):
+        many_for_one_lookup = self.get_schema().get_many_for_one(attribute_name)[0]
 
         # import
         if attribute_name in self.list_import_targets() and isinstance(attribute_name, basestring):  # Note: i think the isinstance check is useless and should be removed: TODO
+            start = instrumentation.enabled and instrumentation.clock()
             value = perform_import(
-                self.__dict__['_config'].get('NAME'),
+                self._config.get('NAME'),
                 value,
                 self.get_absolute_lookup(attribute_name)
             )
+            if start:
+                instrumentation.record('import', self.get_absolute_lookup(attribute_name), instrumentation.clock() - start)
 
         # init
         for lookup in [attribute_name, many_for_one_lookup]:
-            if lookup in self.get_kwarg('init'):
+            if lookup in self.get_schema().init:
+                start = instrumentation.enabled and instrumentation.clock()
                 value = perform_init(
-                    self.__dict__['_config'].get('NAME'),
+                    self._config.get('NAME'),
                     value,
                     self.get_absolute_lookup(lookup),
                     self._INIT_METHOD
                 )
+                if start:
+                    instrumentation.record('init', self.get_absolute_lookup(lookup), instrumentation.clock() - start)
                 break
 
         return value
 
+    def finalize_value(self, attribute_name, value, filter, filter_value):
+        start = instrumentation.enabled and instrumentation.clock()
+
+        # apply filter if needed
+        if filter_value:
+            link = self.get_schema().get_link(attribute_name, self.get_schema().get_many_for_one(attribute_name)[0])
+            if link:
+                filter = link[1]
+            prepared, index = self.get_index(attribute_name, filter, value)
+            value = self.apply_filter(prepared, filter, filter_value, index)
+        else:
+            value = self.prepare_value(attribute_name, value)
+
+        value = self.load_value(attribute_name, value)
+        if start:
+            instrumentation.record('finalize', self.get_absolute_lookup(attribute_name), instrumentation.clock() - start)
+        return value
+
     def raise_error(self, exception_class=InvalidSettingError, **kwargs):
         attribute_name = kwargs.pop('attribute_name')
         if 'lookup_path' not in kwargs:
@@ -484,44 +791,235 @@ class SettingsWrapper(object):
     def configure(self, configuration):
         _configuration = self.get_active_configuration()
         if _configuration is None:
-            self.__dict__['_kwargs']['configuration'] = {'.': {}}
-            _configuration = self.__dict__['_kwargs']['configuration']
+            _configuration = {'.': {}}
+            self.set_kwarg('configuration', _configuration)
 
-        if isinstance(configuration, SettingsWrapper):
+        if isinstance(configuration, BaseSettingsWrapper):
             configuration = configuration.as_dict()
 
-        if '.' in configuration:
-            _configuration['.'] = configuration['.']
-        else:
-            configuration['.'] = configuration
+        # don't touch the passed configuration, it may be used again
+        configuration = dict(configuration)
+        if '.' not in configuration:
+            configuration['.'] = dict(_configuration['.'] or {})
+            configuration['.'].update(configuration)
+            del configuration['.']['.']
         _configuration.update(configuration)
+        self.invalidate(configuration_keys(configuration))
+        self._fingerprint = None
+        self._shared = None
+        self._frozen = None
+        self._paths = None
 
     def with_configuration(self, configuration):
+        """
+        returns an overlay of these settings with configuration applied.
+
+        the overlay just stores the configuration. every attribute that the
+        configuration can't affect is served by (and cached on) this wrapper,
+        so deriving an overlay costs O(len(configuration)).
+        """
+        if isinstance(configuration, BaseSettingsWrapper):
+            configuration = configuration.as_dict()
         new_wrapper = self.as_wrapped()
         new_wrapper.configure(configuration)
+        new_wrapper._base = self
+        new_wrapper._overlay_keys = frozenset(configuration_keys(configuration))
+        # kept weakly, for passing on update_settings(). keyed by id, as the
+        # hash of a wrapper is its (changing) fingerprint
+        if self._overlays is None:
+            self._overlays = weakref.WeakValueDictionary()
+        self._overlays[id(new_wrapper)] = new_wrapper
         return new_wrapper
 
+    def get_base(self, attribute_name):
+        """
+        the wrapper this overlay shares attribute_name with or None.
+        """
+        base = self._base
+        if base is None:
+            return None
+        keys = self._overlay_keys
+        schema = self.get_schema()
+        if keys - schema.get_all_names():
+            return None  # may be a collection lookup value, which could affect anything
+        if keys & schema.get_dependency_names(attribute_name):
+            return None
+        return base
+
+    def list_resolution_order(self):
+        """
+        available attributes, plain ones first, then links and one to many
+        expansions (which may depend on plain ones) and INIT settings last.
+        """
+        schema = self.get_schema()
+
+        def rank(name):
+            if name in schema.init or schema.get_many_for_one(name)[0] in schema.init:
+                return 2
+            if schema.get_link(name, schema.get_many_for_one(name)[0]) or name in schema.many_for_one:
+                return 1
+            return 0
+        names = [name for name in self.list_available_attributes() if not name.startswith('_DEPRECATED_')]
+        return sorted(names, key=lambda name: (rank(name), name))
+
+    def freeze(self, _frozen_wrappers=None, _in_progress=None):
+        """
+        resolves every available setting now (including nested settings and
+        collections) instead of on first access. afterwards dotted lookups
+        like 'A.B.C' are answered from a flat table. settings that aren't
+        set (and have no default) are skipped, any other error is raised.
+        links resolving back to a setting being frozen raise
+        InvalidSettingError, as the table would be endless.
+        """
+        if _frozen_wrappers is None:
+            _frozen_wrappers = set()
+            _in_progress = set()
+        # link targets are new wrappers on every resolution, so a cycle is
+        # detected by the settings (not the wrapper) being frozen already
+        key = (
+            self.get_settings_name(),
+            self.get_kwarg('lookup_path'),
+            fingerprint_of(self._dict, memoize=True),
+            fingerprint_of(self.get_active_configuration()),
+        )
+        if key in _in_progress:
+            raise InvalidSettingError("Cyclic setting '%s'" % '.'.join(filter(None, key[:2])))
+        if id(self) in _frozen_wrappers:
+            return self
+        _frozen_wrappers.add(id(self))
+        _in_progress.add(key)
+
+        frozen = {}
+        for name in self.list_resolution_order():
+            try:
+                value = self.get_attribute(name)
+            except InvalidSettingError:
+                continue
+            frozen[name] = value
+
+            for child in iter_wrappers(value):
+                child.freeze(_frozen_wrappers, _in_progress)
+
+            if isinstance(value, BaseSettingsWrapper):
+                for path, child_value in value._frozen.items():
+                    frozen[name + '.' + path] = child_value
+
+        _in_progress.discard(key)
+        self._frozen = ReadOnlyDict(frozen)
+        return self
+
+    def validate(self):
+        """
+        runs the validation method (_VALIDATE_<name> or VALIDATION_METHOD)
+        of every setting, including nested settings, in one go. meant to be
+        called once at startup (AppConfig.ready()), freeze() doesn't validate.
+        results are cached by fingerprint, so validating the same settings
+        again is free. raises SettingsValidationError listing every invalid
+        setting, with the exceptions validation methods raised as its causes.
+        """
+        errors = self.collect_validation_errors(set())
+        if errors:
+            raise SettingsValidationError(
+                [lookup for lookup, cause in errors],
+                dict((lookup, cause) for lookup, cause in errors if cause is not None)
+            )
+        return self
+
+    def collect_validation_errors(self, validated_wrappers):
+        if id(self) in validated_wrappers:
+            return ()
+        validated_wrappers.add(id(self))
+
+        fingerprint = self.get_fingerprint()
+        errors = validation.get_result(fingerprint)
+        if errors is not None:
+            return errors
+
+        errors = []
+        schema = self.get_schema()
+        for name in self.list_resolution_order():
+            try:
+                value = self.get_value(name)
+            except InvalidSettingError:
+                continue
+            if value is None:
+                continue  # not set, raises on access
+            result = validation.validate_setting(self, name, value)
+            if result is not True:
+                errors.append((self.get_absolute_lookup(name), result if isinstance(result, Exception) else None))
+
+            many_for_one_lookup = schema.get_many_for_one(name)[0]
+            if not isinstance(schema.available_settings.get(many_for_one_lookup or name, None), dict):
+                continue
+            for child in iter_wrappers(self.get_prepared_value(name)):
+                errors.extend(child.collect_validation_errors(validated_wrappers))
+
+        validation.set_result(fingerprint, errors)
+        return errors
+
+    def list_init_targets(self, _visited_wrappers=None):
+        """
+        [(init method, settings wrapper)] of every INIT setting, including
+        nested settings and the items of lists / collections. see
+        app_settings.init.warm_up().
+        """
+        if _visited_wrappers is None:
+            _visited_wrappers = set()
+        if id(self) in _visited_wrappers:
+            return []
+        _visited_wrappers.add(id(self))
+
+        targets = []
+        schema = self.get_schema()
+        for name in self.list_resolution_order():
+            many_for_one_lookup = schema.get_many_for_one(name)[0]
+            if not isinstance(schema.available_settings.get(many_for_one_lookup or name, None), dict):
+                continue
+            try:
+                value = self.get_prepared_value(name)
+            except InvalidSettingError:
+                continue
+            init = name in schema.init or many_for_one_lookup in schema.init
+            for child in iter_wrappers(value):
+                if init:
+                    targets.append((self._INIT_METHOD, child))
+                targets.extend(child.list_init_targets(_visited_wrappers))
+        return targets
+
+    def preload_imports(self):
+        """
+        imports all modules referenced by import targets at once, see
+        app_settings.imports.preload_imports.
+        """
+        return preload_imports(self._config, self._dict)
+
+    def is_frozen(self):
+        return self._frozen is not None
+
     def as_wrapped(self, **kwargs):
         return self.get_wrapper_class()(**self.get_wrapped_kwargs(**kwargs))
 
     def get_wrapped_kwargs(self, **kwargs):
         attribute_name = kwargs.get('attribute_name', None)
-        if attribute_name and attribute_name in self.__dict__['_many_for_one']:
-            attribute_name = self.unpack_filter(self.__dict__['_many_for_one'].get(attribute_name))[0]
+        if attribute_name and attribute_name in self._many_for_one:
+            attribute_name = self._many_for_one[attribute_name][0]
         if attribute_name:
             kwargs['attribute_name'] = attribute_name
 
         if 'value' in kwargs:
             settings = kwargs.get('value')
         else:
-            settings = self.__dict__['_dict'].get(attribute_name, None) if attribute_name else self.__dict__['_dict']
+            settings = self._dict.get(attribute_name, None) if attribute_name else self._dict
 
         new_kwargs = {
-            'config': self.__dict__['_config'],
-            'settings': settings
+            'config': self._config,
+            'settings': settings,
+            'schema': self.get_schema().child(attribute_name) if attribute_name else self.get_schema()
         }
-        for kwarg in self.__dict__['_kwargs'].keys():
-            if kwarg not in ['config', 'settings']:
+        # the schema kwargs come with the child schema, the others (including
+        # those of subclasses) are passed on by wrap_own_kwargs
+        for kwarg in self.list_kwargs():
+            if kwarg not in ['config', 'settings'] and kwarg not in SettingsSchema.fields:
                 new_kwargs[kwarg] = self.wrap_own_kwargs(kwarg, **kwargs)
 
         return new_kwargs
@@ -532,39 +1030,13 @@ class SettingsWrapper(object):
         many_for_one_filter = kwargs.get('many_for_one_filter', None)
         #if attribute_name in self.get_kwarg('links'):
         #    link = self.unpack_filter(self.get_kwarg('links')[attribute_name])[0]
-        #    current_value = app_settings(self.__dict__['_config']).get_kwarg(link)
+        #    current_value = app_settings(self._config).get_kwarg(link)
         #else:
         current_value = self.get_kwarg(name)
 
         found = False
-        if name in ['defaults', 'available_settings', 'configuration']:
-            if name == 'configuration':
-                current_value = self.get_configuration(attribute_name, lookup_value=value, many_for_one_filter=many_for_one_filter)
-            elif attribute_name:
-                return current_value.get(attribute_name, None)
-            found = True
-        elif name in ['import_strings', 'init']:
-            if attribute_name:
-                prefix = attribute_name + '.'
-                return (string[len(prefix):] for string in current_value if string.startswith(prefix))
-            found = True
-        elif name in ['one_to_many', 'links']:
-            if attribute_name:
-                prefix = (attribute_name + '.')
-                new_dict = {}
-                for key, value in current_value.items():
-                    add = False
-                    if key.startswith(prefix):
-                        add = True
-                        key = key[len(prefix):]
-                    if value.startswith(prefix):
-                        # only if its one_to_many kwarg, the value may cause an inheritance to the next wrapper
-                        add = name in ['one_to_many']
-                        value = value[len(prefix):]
-                    if add:
-                        new_dict[key] = value
-
-                return new_dict
+        if name == 'configuration':
+            current_value = self.get_configuration(attribute_name, lookup_value=value, many_for_one_filter=many_for_one_filter)
             found = True
         elif name == 'parent_settings':# TODO: is this correct?
             if attribute_name:
@@ -584,40 +1056,106 @@ class SettingsWrapper(object):
                     return current_value
                 return self
             found = True
-        elif name in ['global_settings']:
-            found = True
 
         if found:
             return current_value
 
         return None
 
-    def get_kwarg(self, name):
-        return self.__dict__['_kwargs'].get(name)
-
-    def get_wrapper_class(self):
-        return SettingsWrapper
-
     def __str__(self, ):
-        return 'SettingsWrapper: config=%s' % self.__dict__['_dict']
+        return '%s: config=%s' % (self.__class__.__name__, self._dict)
 
     def __hash__(self):
-        return hash(str(self.__dict__['_dict']))  # TODO: find better hash source
+        return hash(self.get_fingerprint())
 
     def __unicode__(self, ):
         return self.__str__()
 
+
+class SettingsWrapper(BaseSettingsWrapper):
+    """
+    keeps its state and kwargs in its __dict__ and caches every resolved
+    setting as an instance attribute (the defaults of BaseSettingsWrapper).
+    """
+    def get_wrapper_class(self):
+        return SettingsWrapper
+
+
+class CompactSettingsWrapper(BaseSettingsWrapper):
+    """
+    memory saving variant for big settings trees: the state is kept in
+    slots, the schema kwargs are read from the shared (read only) schema
+    instead of being copied for every wrapper and at most max_cached_values
+    resolved settings are cached per wrapper - the process wide cache
+    serves the rest, except values holding wrappers (see holds_wrappers()).
+    """
+    __slots__ = BaseSettingsWrapper.state + tuple(
+        '_' + name for name in BaseSettingsWrapper.instance_kwargs
+    ) + ('_values', '__weakref__')
+
+    slot_names = frozenset(__slots__)
+
+    max_cached_values = 32
+
+    def __init__(self, *args, **kwargs):
+        self._values = None
+        super(CompactSettingsWrapper, self).__init__(*args, **kwargs)
+
+    def __getattr__(self, name):
+        if name in self.slot_names:
+            raise AttributeError(name)  # not initialized (yet)
+        values = self._values
+        if values is not None and name in values:
+            return values[name]
+        return super(CompactSettingsWrapper, self).__getattr__(name)
+
+    def init_kwargs(self, **kwargs):
+        for name in self.instance_kwargs:
+            setattr(self, '_' + name, kwargs.get(name, None))
+
+    def get_kwarg(self, name):
+        if name in self.instance_kwargs:
+            return getattr(self, '_' + name)
+        if name in SettingsSchema.fields:
+            return getattr(self._schema, name)
+        return None
+
+    def set_kwarg(self, name, value):
+        if name not in self.instance_kwargs:
+            raise Exception('"%s" is part of the shared schema and can\'t be changed' % name)  # TODO: better class
+        setattr(self, '_' + name, value)
+
+    def list_kwargs(self):
+        return SettingsSchema.fields + self.instance_kwargs
+
+    def cache_value(self, name, value):
+        if not self.max_cached_values:
+            return
+        values = self._values
+        if values is None:
+            values = self._values = {}
+        elif len(values) >= self.max_cached_values:
+            values.pop(next(iter(values)))
+        values[name] = value
+
+    def uncache_value(self, name):
+        if self._values is not None:
+            self._values.pop(name, None)
+
+    def get_wrapper_class(self):
+        return CompactSettingsWrapper
+
 """
 class ExampleSubclassWrapper(SettingsWrapper):
     def __init__(self, *args, my_var=None, **kwargs):
         super(ExampleSubclassWrapper, self).__init__(*args, **kwargs)
-        self.__dict__['_kwargs']['_my_var'] = my_var
+        self._kwargs['_my_var'] = my_var
 
     def get_value(self, attribute_name):
         value = super(ExampleSubclassWrapper, self).get_value(attribute_name)
 
         if value is None:
-            value = self.__dict__['_kwargs']['_my_var']
+            value = self._kwargs['_my_var']
 
         return value
 
@@ -628,7 +1166,7 @@ class ExampleSubclassWrapper(SettingsWrapper):
         if value is None and name == 'my_var':
             attribute_name = kwargs.get('attribute_name')
             if attribute_name:
-                return self.__dict__['_kwargs']['_my_var'] + '-' + attribute_name
+                return self._kwargs['_my_var'] + '-' + attribute_name
             found = True
 
         if found:
@@ -641,18 +1179,22 @@ class ExampleSubclassWrapper(SettingsWrapper):
 """
 
 
-def app_settings(app_config, parent_settings=None, configuration=None, resolving_link_for=None, in_holder=True):
+def app_settings(app_config, parent_settings=None, configuration=None, resolving_link_for=None, in_holder=True,
+                 wrapper_class=None, settings=None):
     settings_name = app_config.get('NAME')
     if settings_name is None:
         raise Exception('app_config.NAME should be defined')
+    start = instrumentation.enabled and instrumentation.clock()
 
     # TODO: check, that nothing insinde IMPORT_SETTINGS is represened by a dict in SETTINGS
 
+    # the given settings or the django settings, unless other sources are configured
+    app_settings = settings if settings is not None else sources.get_settings(settings_name)
     try:
-        from django.conf import settings
-        app_settings = getattr(settings, settings_name, None)
+        from django.conf import settings as django_settings
+        snapshot_dir = getattr(django_settings, 'APP_SETTINGS_SNAPSHOT_DIR', None)
     except ImportError:
-        app_settings = None
+        snapshot_dir = None
 
     one_to_many = app_config.get('ONE_TO_MANY', None)
     if one_to_many:
@@ -668,22 +1210,20 @@ def app_settings(app_config, parent_settings=None, configuration=None, resolving
             _configuration.update(configuration)
         configuration = _configuration
 
-    wrapped = SettingsWrapper(
+    wrapped = (wrapper_class or SettingsWrapper)(
         config=app_config,
         settings=app_settings,
         parent_settings=parent_settings,
-        available_settings=app_config.get('SETTINGS', None),
-        defaults=app_config.get('DEFAULTS', None),
-        import_strings=app_config.get('IMPORT_STRINGS', None),
-        one_to_many=one_to_many,
-        validation_method=app_config.get('VALIDATION_METHOD', None),
-        links=app_config.get('LINK', None),
-        init=app_config.get('INIT', None),
-        global_settings=app_config.get('GLOBALS'),
+        schema=get_schema(app_config),
         configuration=configuration,
         parent_setting=resolving_link_for,
         resolving_link=bool(resolving_link_for)
     )
+    if snapshot_dir and not resolving_link_for and parent_settings is None:
+        # skips resolving everything, that was resolved by the app_settings_snapshot command
+        load_snapshot(wrapped, snapshot_dir)
+    if start:
+        instrumentation.record('app_settings', settings_name, instrumentation.clock() - start)
     if not in_holder:
         return wrapped
 
@@ -0,0 +1,149 @@
+import json
+import os
+import tempfile
+from .fingerprint import integer_types, string_types
+from .imports import import_from_string
+
+# bump, whenever the format changes
+SNAPSHOT_VERSION = 1
+
+# snapshot file path -> decoded values, so every process reads a file once
+_loaded = {}
+
+
+def get_snapshot_path(wrapper, directory):
+    """
+    snapshots are keyed by the fingerprint of the settings, so a snapshot
+    of outdated settings is never found.
+    """
+    return os.path.join(directory, '%s.%s.json' % (wrapper.get_settings_name(), wrapper.get_fingerprint()))
+
+
+def encode(value):
+    """
+    json representation of a resolved value or None, if it can't be stored
+    (settings wrappers, instances, ...).
+    """
+    if value is None or isinstance(value, bool) or isinstance(value, integer_types + (float, )):
+        return {'v': value}
+    if isinstance(value, string_types):
+        if isinstance(value, bytes):
+            if bytes is not str:
+                return None
+            return {'b': value.decode('utf-8')}  # python 2 str
+        return {'v': value}
+    if isinstance(value, (list, tuple)):
+        items = [encode(item) for item in value]
+        if any(item is None for item in items):
+            return None
+        return {'t' if isinstance(value, tuple) else 'l': items}
+    if isinstance(value, dict):
+        items = []
+        for key, item in value.items():
+            key, item = encode(key), encode(item)
+            if key is None or item is None:
+                return None
+            items.append([key, item])
+        return {'d': items}
+    if isinstance(value, type) or (callable(value) and hasattr(value, '__name__')):
+        # import targets are stored as dotted path, if they can be imported again
+        path = '%s.%s' % (getattr(value, '__module__', None), value.__name__)
+        try:
+            if import_from_string(None, path, 'snapshot') is value:
+                return {'i': path}
+        except ImportError:
+            pass
+    return None
+
+
+def decode(value, settings_name, lookup):
+    if 'v' in value:
+        return value['v']
+    if 'b' in value:
+        return value['b'].encode('utf-8')
+    if 'l' in value:
+        return [decode(item, settings_name, lookup) for item in value['l']]
+    if 't' in value:
+        return tuple(decode(item, settings_name, lookup) for item in value['t'])
+    if 'd' in value:
+        return dict(
+            (decode(key, settings_name, lookup), decode(item, settings_name, lookup)) for key, item in value['d']
+        )
+    return import_from_string(settings_name, value['i'], lookup)
+
+
+def build_snapshot(wrapper):
+    """
+    resolves every setting of wrapper and returns the storable ones as
+    {'version', 'settings_name', 'fingerprint', 'values': {path: value}}.
+    """
+    wrapper.freeze()
+    values = {}
+    for path, value in wrapper._frozen.items():
+        value = encode(value)
+        if value is not None:
+            values[path] = value
+    return {
+        'version': SNAPSHOT_VERSION,
+        'settings_name': wrapper.get_settings_name(),
+        'fingerprint': wrapper.get_fingerprint(),
+        'values': values,
+    }
+
+
+def write_snapshot(wrapper, directory):
+    """
+    writes the snapshot of wrapper to directory (atomically) and returns
+    the path of the file.
+    """
+    data = build_snapshot(wrapper)
+    path = get_snapshot_path(wrapper, directory)
+    handle, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'w') as f:
+            json.dump(data, f, sort_keys=True)
+        os.rename(temp_path, path)
+    except Exception:
+        os.remove(temp_path)
+        raise
+    return path
+
+
+def read_snapshot(wrapper, directory):
+    """
+    {path: value} of the snapshot matching wrapper in directory or None.
+    """
+    path = get_snapshot_path(wrapper, directory)
+    try:
+        return _loaded[path]
+    except KeyError:
+        pass
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+    if data.get('version') != SNAPSHOT_VERSION or data.get('fingerprint') != wrapper.get_fingerprint():
+        return None
+
+    settings_name = wrapper.get_settings_name()
+    values = {}
+    for lookup, value in data['values'].items():
+        try:
+            values[lookup] = decode(value, settings_name, lookup)
+        except ImportError:
+            pass  # raises when the setting is resolved
+    _loaded[path] = values
+    return values
+
+
+def load_snapshot(wrapper, directory):
+    """
+    serves the settings of wrapper from its snapshot in directory, if there
+    is one. returns whether there was.
+    """
+    values = read_snapshot(wrapper, directory)
+    if values is None:
+        return False
+    wrapper.add_paths(values)
+    return True
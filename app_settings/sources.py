@@ -0,0 +1,272 @@
+"""
+pluggable sources of settings. by default app_settings() reads the settings
+named app_config['NAME'] from the django settings. after configure() it
+reads them from a stack of sources instead, later sources overriding
+(merging into) earlier ones:
+
+    sources.configure([
+        DjangoSource(),
+        FileSource('/etc/my_project/settings.toml'),
+        EnvSource(prefix='DJANGO__'),  # DJANGO__MY_APP__SETTING_1=5
+    ])
+
+every source is read (and parsed) at once on first use and kept along with
+its fingerprint until it is refreshed. refresh() returns the names whose
+settings changed, so they can be applied with update_settings() or a
+SettingsReloader.
+"""
+import json
+import os
+from .dependencies import changed_keys
+from .fingerprint import combine, fingerprint, string_types
+from .utils import dict_merge
+
+try:
+    import tomllib as toml  # python >= 3.11
+except ImportError:
+    try:
+        import toml
+    except ImportError:
+        toml = None
+
+
+def parse_value(value):
+    """
+    strings holding json are decoded, any other string is kept.
+    """
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def set_path(data, path, value):
+    for key in path[:-1]:
+        child = data.get(key, None)
+        if not isinstance(child, dict):
+            child = data[key] = {}
+        data = child
+    data[path[-1]] = value
+
+
+class Source(object):
+    """
+    base class of sources: read() returns {NAME: settings} of everything
+    the source holds in one go (nothing, by default).
+    """
+    def __init__(self):
+        self._data = None
+        self._fingerprint = None
+
+    def read(self):
+        return {}
+
+    def get_data(self):
+        data = self._data
+        if data is None:
+            data = self.read() or {}
+            self._fingerprint = fingerprint(data)
+            self._data = data
+        return data
+
+    def get(self, name):
+        return self.get_data().get(name, None)
+
+    def get_fingerprint(self):
+        self.get_data()
+        return self._fingerprint
+
+    def refresh(self):
+        """
+        reads the source again and returns the names whose settings changed.
+        """
+        old_data, old_fingerprint = self._data, self._fingerprint
+        self._data = None
+        data = self.get_data()
+        if old_data is None:
+            return set()  # not read before, so nothing read from it changed
+        if self._fingerprint == old_fingerprint:
+            self._data = old_data  # unchanged, keeps the merged settings valid
+            return set()
+        return changed_keys(old_data, data)
+
+
+class DjangoSource(Source):
+    """
+    the django settings. they are read live, as django (and
+    override_settings) keeps them in memory anyway.
+    """
+    def read(self):
+        from django.conf import settings
+        return dict((name, getattr(settings, name)) for name in dir(settings) if name.isupper())
+
+    def get(self, name):
+        try:
+            from django.conf import settings
+        except ImportError:
+            return None
+        return getattr(settings, name, None)
+
+
+class EnvSource(Source):
+    """
+    environment variables <prefix>NAME<separator>SETTING[<separator>...],
+    values holding json are decoded.
+    """
+    def __init__(self, prefix='', separator='__', environ=None):
+        super(EnvSource, self).__init__()
+        self.prefix = prefix
+        self.separator = separator
+        self.environ = environ
+
+    def read(self):
+        environ = dict(self.environ if self.environ is not None else os.environ)
+        data = {}
+        for key, value in sorted(environ.items()):
+            if not key.startswith(self.prefix):
+                continue
+            path = key[len(self.prefix):].split(self.separator)
+            if len(path) < 2 or not all(path):
+                continue
+            set_path(data, path, parse_value(value))
+        return data
+
+
+class FileSource(Source):
+    """
+    a json or toml file (chosen by its extension) holding {NAME: settings}.
+    toml needs python >= 3.11 or the toml package.
+    """
+    def __init__(self, path, format=None):
+        super(FileSource, self).__init__()
+        self.path = path
+        self.format = format or ('toml' if path.endswith('.toml') else 'json')
+
+    def read(self):
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path) as f:
+            content = f.read()
+        if self.format == 'toml':
+            if toml is None:
+                raise Exception('reading "%s" needs python >= 3.11 or the toml package' % self.path)
+            return toml.loads(content)
+        return json.loads(content)
+
+
+class MemoryStore(object):
+    """
+    in process key / value store, standing in for a remote one (redis,
+    consul, etcd, ...) in KeyValueSource.
+    """
+    def __init__(self, data=None):
+        self.data = dict(data or {})
+
+    def set(self, key, value):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def items(self, prefix=''):
+        return [(key, value) for key, value in self.data.items() if key.startswith(prefix)]
+
+
+class KeyValueSource(Source):
+    """
+    a key / value store with keys <prefix>NAME.SETTING[.SUB...]. store has
+    to provide items(prefix), returning every matching (key, value) in one
+    round trip. string values holding json are decoded.
+    """
+    def __init__(self, store, prefix=''):
+        super(KeyValueSource, self).__init__()
+        self.store = store
+        self.prefix = prefix
+
+    def read(self):
+        data = {}
+        for key, value in sorted(self.store.items(self.prefix)):
+            path = key[len(self.prefix):].split('.')
+            if len(path) < 2 or not all(path):
+                continue
+            if isinstance(value, bytes) and bytes is not str:
+                value = value.decode('utf-8')
+            set_path(data, path, parse_value(value) if isinstance(value, string_types) else value)
+        return data
+
+
+class SourceStack(object):
+    """
+    the settings of NAME merged over all sources, later ones taking
+    precedence. merged settings are rebuilt only when a source returns
+    another object for NAME (after a refresh).
+    """
+    def __init__(self, sources):
+        self.sources = list(sources)
+        # name -> (settings of every source, merged settings)
+        self._merged = {}
+
+    def get(self, name):
+        layers = [source.get(name) for source in self.sources]
+        cached = self._merged.get(name, None)
+        if cached is not None and all(layer is cached_layer for layer, cached_layer in zip(layers, cached[0])):
+            return cached[1]
+
+        value = None
+        for layer in layers:
+            if layer is None:
+                continue
+            value = layer if value is None else dict_merge(value, layer)
+        self._merged[name] = (layers, value)
+        return value
+
+    def get_fingerprint(self):
+        return combine(*[source.get_fingerprint() for source in self.sources])
+
+    def refresh(self, source=None):
+        """
+        refreshes source (every source, if None) and returns the names
+        whose settings changed.
+        """
+        changed = set()
+        for refreshed in ([source] if source is not None else self.sources):
+            changed.update(refreshed.refresh())
+        for name in changed:
+            self._merged.pop(name, None)
+        return changed
+
+
+_stack = None
+
+
+def configure(sources):
+    """
+    makes app_settings() read from sources (a list, lowest precedence
+    first). None restores reading the django settings only.
+    """
+    global _stack
+    _stack = SourceStack(sources) if sources else None
+    return _stack
+
+
+def get_stack():
+    return _stack
+
+
+def get_settings(name):
+    """
+    the settings of the app named name, as read by app_settings().
+    """
+    if _stack is None:
+        try:
+            from django.conf import settings
+        except ImportError:
+            return None
+        return getattr(settings, name, None)
+    return _stack.get(name)
+
+
+def refresh(source=None):
+    if _stack is None:
+        return set()
+    return _stack.refresh(source)
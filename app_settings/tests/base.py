@@ -0,0 +1,18 @@
+from django.test import SimpleTestCase
+
+from .. import cache, validation
+from ..imports import clear_import_cache
+from ..init import instance_registry
+
+
+class AppSettingsTestCase(SimpleTestCase):
+    """
+    clears the process wide caches, so every test resolves its settings
+    from scratch.
+    """
+    def setUp(self):
+        super(AppSettingsTestCase, self).setUp()
+        cache.invalidate()
+        validation.clear_validation_cache()
+        clear_import_cache()
+        instance_registry.clear()
@@ -0,0 +1,76 @@
+from django.test.utils import override_settings
+
+from .. import cache
+from ..settings import app_settings
+from .base import AppSettingsTestCase
+
+CONFIG = {
+    'NAME': 'CACHE_APP',
+    'SETTINGS': {'SETTING_1': None, 'OPTIONS': None, 'MODE': None, 'CHILD': {'NAME': None, 'MODE': None}},
+    'DEFAULTS': {'SETTING_1': 1, 'MODE': 'default'},
+    'GLOBALS': ['MODE'],
+}
+
+
+class CacheTest(AppSettingsTestCase):
+    def test_wrappers_of_equal_settings_share_values(self):
+        with override_settings(CACHE_APP={'OPTIONS': {'a': 1}, 'CHILD': {'NAME': 'child'}}):
+            first = app_settings(CONFIG)
+            second = app_settings(CONFIG)
+            self.assertIs(first.OPTIONS, second.OPTIONS)
+            self.assertEqual(first.CHILD.NAME, second.CHILD.NAME)
+
+    def test_wrappers_are_not_shared(self):
+        with override_settings(CACHE_APP={'CHILD': {'NAME': 'child'}}):
+            first = app_settings(CONFIG, in_holder=False)
+            child = first.CHILD
+            first.configure({'MODE': 'configured'})
+            second = app_settings(CONFIG, in_holder=False)
+            self.assertIsNot(second.CHILD, child)
+            self.assertEqual((second.MODE, second.CHILD.MODE), ('default', 'default'))
+            self.assertEqual((first.MODE, first.CHILD.MODE), ('configured', 'configured'))
+
+    def test_wrappers_resolved_earlier_are_not_shared(self):
+        with override_settings(CACHE_APP={'CHILD': {'NAME': 'child'}}):
+            first = app_settings(CONFIG, in_holder=False)
+            second = app_settings(CONFIG, in_holder=False)
+            first.CHILD, second.CHILD
+            first.configure({'MODE': 'configured'})
+            self.assertEqual((second.MODE, second.CHILD.MODE), ('default', 'default'))
+
+    def test_different_settings_dont_share_values(self):
+        with override_settings(CACHE_APP={'OPTIONS': {'a': 1}}):
+            first = app_settings(CONFIG)
+            self.assertEqual(first.OPTIONS, {'a': 1})
+        with override_settings(CACHE_APP={'OPTIONS': {'a': 2}}):
+            second = app_settings(CONFIG)
+            self.assertEqual(second.OPTIONS, {'a': 2})
+        self.assertEqual(first.OPTIONS, {'a': 1})
+
+    def test_setting_changed_invalidates(self):
+        with override_settings(CACHE_APP={'SETTING_1': 5}):
+            self.assertEqual(app_settings(CONFIG).SETTING_1, 5)
+            self.assertIsNot(cache.get_value('CACHE_APP', app_settings(CONFIG).get_cache_key('SETTING_1')), cache.Empty)
+        # leaving override_settings sends setting_changed again
+        self.assertEqual(cache._value_storage.get('CACHE_APP', {}), {})
+        self.assertEqual(app_settings(CONFIG).SETTING_1, 1)
+
+    def test_invalidate(self):
+        with override_settings(CACHE_APP={'SETTING_1': 5}):
+            settings = app_settings(CONFIG)
+            key = settings.get_cache_key('SETTING_1')
+            settings.SETTING_1
+            self.assertEqual(cache.get_value('CACHE_APP', key), 5)
+            cache.invalidate('CACHE_APP')
+            self.assertIs(cache.get_value('CACHE_APP', key), cache.Empty)
+
+    def test_oldest_entries_are_evicted(self):
+        original = cache.MAX_ENTRIES
+        cache.MAX_ENTRIES = 2
+        try:
+            for i in range(5):
+                cache.set_value('CACHE_APP', i, i)
+            self.assertEqual(list(cache._value_storage['CACHE_APP']), [3, 4])
+            self.assertEqual(cache.get_value('CACHE_APP', 4), 4)
+        finally:
+            cache.MAX_ENTRIES = original
@@ -0,0 +1,58 @@
+import threading
+
+from ..context import get_override, pop_override, push_override
+from .base import AppSettingsTestCase
+
+
+class Holder(object):
+    pass
+
+
+class OverrideStackTest(AppSettingsTestCase):
+    def test_nested_overrides(self):
+        holder = Holder()
+        push_override(holder, 'outer')
+        push_override(holder, 'inner')
+        self.assertEqual(get_override(holder), 'inner')
+        pop_override(holder)
+        self.assertEqual(get_override(holder), 'outer')
+        pop_override(holder)
+        self.assertIsNone(get_override(holder))
+
+    def test_pop_only_own_layer(self):
+        first, second = Holder(), Holder()
+        push_override(first, 'first')
+        push_override(second, 'second')
+        try:
+            with self.assertRaises(Exception):
+                pop_override(first)
+            self.assertEqual(get_override(first), 'first')
+            self.assertEqual(get_override(second), 'second')
+        finally:
+            pop_override(second)
+            pop_override(first)
+        self.assertIsNone(get_override(first))
+
+    def test_pop_without_override(self):
+        with self.assertRaises(Exception):
+            pop_override(Holder())
+
+    def test_overrides_are_per_thread(self):
+        holder = Holder()
+        seen = []
+
+        def read():
+            seen.append(get_override(holder))
+            push_override(holder, 'thread')
+            seen.append(get_override(holder))
+            pop_override(holder)
+
+        push_override(holder, 'main')
+        try:
+            thread = threading.Thread(target=read)
+            thread.start()
+            thread.join()
+            self.assertEqual(get_override(holder), 'main')
+        finally:
+            pop_override(holder)
+        self.assertEqual(seen, [None, 'thread'])
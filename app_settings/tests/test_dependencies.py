@@ -0,0 +1,63 @@
+from django.test.utils import override_settings
+
+from ..dependencies import DependencyGraph, changed_keys
+from ..settings import app_settings
+from .base import AppSettingsTestCase
+
+CONFIG = {
+    'NAME': 'DEPENDENCIES_APP',
+    'SETTINGS': {'SETTING_1': None, 'SETTING_2': None},
+}
+
+SETTINGS = {'SETTING_1': 1, 'SETTING_2': 2}
+
+CHILD_CONFIG = {
+    'NAME': 'DEPENDENCIES_CHILD_APP',
+    'SETTINGS': {'MODE': None, 'CHILD': {'NAME': None, 'MODE': None}},
+    'DEFAULTS': {'MODE': 'default'},
+    'GLOBALS': ['MODE'],
+}
+
+
+class DependencyGraphTest(AppSettingsTestCase):
+    def test_affected(self):
+        graph = DependencyGraph()
+        graph.add('A', ('X', 'Y'))
+        graph.add('B', ('Y',))
+        self.assertEqual(graph.affected(['X']), set(['A']))
+        self.assertEqual(graph.affected(['Y', 'Z']), set(['A', 'B']))
+        self.assertEqual(len(graph), 2)
+
+    def test_add_replaces_inputs(self):
+        graph = DependencyGraph()
+        graph.add('A', ('X',))
+        graph.add('A', ('Y',))
+        self.assertEqual(graph.affected(['X']), set())
+        self.assertEqual(graph.affected(['Y']), set(['A']))
+        graph.remove('A')
+        self.assertEqual(graph.dependents, {})
+        self.assertEqual(len(graph), 0)
+
+    def test_changed_keys(self):
+        self.assertEqual(changed_keys({'A': 1, 'B': [1]}, {'A': 1, 'B': [1]}), set())
+        self.assertEqual(changed_keys({'A': 1, 'B': 2}, {'A': 1, 'C': 3}), set(['B', 'C']))
+        self.assertEqual(changed_keys(None, {'A': 1}), set(['A']))
+
+
+class UpdateSettingsTest(AppSettingsTestCase):
+    def test_only_dependents_are_invalidated(self):
+        with override_settings(DEPENDENCIES_APP=SETTINGS):
+            settings = app_settings(CONFIG, in_holder=False)
+        self.assertEqual((settings.SETTING_1, settings.SETTING_2), (1, 2))
+        self.assertEqual(settings.update_settings(dict(SETTINGS, SETTING_2=3)), set(['SETTING_2']))
+        self.assertEqual((settings.SETTING_1, settings.SETTING_2), (1, 3))
+        self.assertEqual(settings.update_settings(dict(SETTINGS, SETTING_2=3)), set())
+
+    def test_update_doesnt_reach_other_wrappers(self):
+        with override_settings(DEPENDENCIES_CHILD_APP={'CHILD': {'NAME': 'child'}}):
+            settings = app_settings(CHILD_CONFIG, in_holder=False)
+            self.assertEqual(settings.CHILD.NAME, 'child')
+            settings.update_settings({'CHILD': {'NAME': 'child'}, 'MODE': 'updated'})
+            self.assertEqual(settings.CHILD.MODE, 'updated')
+            other = app_settings(CHILD_CONFIG, in_holder=False)
+            self.assertEqual((other.MODE, other.CHILD.MODE), ('default', 'default'))
@@ -0,0 +1,78 @@
+import functools
+
+from django.conf import settings as django_settings
+from django.test.utils import override_settings
+
+from ..fingerprint import fingerprint
+from ..settings import app_settings
+from .base import AppSettingsTestCase
+
+
+def make(value):
+    def func():
+        return value
+    return func
+
+
+class Importable(object):
+    def method(self):
+        pass
+
+
+CONFIG = {
+    'NAME': 'FINGERPRINT_APP',
+    'SETTINGS': {'FUNC': None, 'SETTING_1': None},
+}
+
+
+class FingerprintTest(AppSettingsTestCase):
+    def test_stable_for_equal_values(self):
+        self.assertEqual(fingerprint({'a': [1, 'b', None], 'c': 2.0}), fingerprint({'c': 2.0, 'a': [1, 'b', None]}))
+        self.assertNotEqual(fingerprint([1, 2]), fingerprint((1, 2)))
+        self.assertNotEqual(fingerprint({'a': 1}), fingerprint({'a': '1'}))
+
+    def test_importable_callables_by_path(self):
+        self.assertEqual(fingerprint(Importable), fingerprint(Importable))
+        self.assertEqual(fingerprint(make), fingerprint(make))
+        self.assertNotEqual(fingerprint(make), fingerprint(Importable))
+
+    def test_closures_lambdas_and_partials_by_identity(self):
+        first, second = make(1), make(2)
+        self.assertNotEqual(fingerprint(first), fingerprint(second))
+        self.assertEqual(fingerprint(first), fingerprint(first))
+        self.assertNotEqual(fingerprint(lambda: 1), fingerprint(lambda: 2))
+        self.assertNotEqual(fingerprint(functools.partial(make, 1)), fingerprint(functools.partial(make, 2)))
+        self.assertNotEqual(fingerprint(Importable().method), fingerprint(Importable().method))
+
+    def test_objects_with_id_based_repr_by_identity(self):
+        first, second = Importable(), Importable()
+        self.assertNotEqual(fingerprint(first), fingerprint(second))
+        self.assertEqual(fingerprint(first), fingerprint(first))
+
+    def test_overlays_with_different_closures(self):
+        with override_settings(FINGERPRINT_APP={'SETTING_1': 1}):
+            settings = app_settings(CONFIG)
+            first = settings.with_configuration({'FUNC': make(1)})
+            second = settings.with_configuration({'FUNC': make(2)})
+            self.assertEqual(first.FUNC(), 1)
+            self.assertEqual(second.FUNC(), 2)
+
+    def test_settings_with_different_closures(self):
+        with override_settings(FINGERPRINT_APP={'FUNC': make(1)}):
+            self.assertEqual(app_settings(CONFIG).FUNC(), 1)
+        with override_settings(FINGERPRINT_APP={'FUNC': make(2)}):
+            self.assertEqual(app_settings(CONFIG).FUNC(), 2)
+
+    def test_mutable_containers_are_not_memoized(self):
+        value = {'a': [1]}
+        digest = fingerprint(value, memoize=True)
+        value['a'].append(2)
+        self.assertNotEqual(fingerprint(value, memoize=True), digest)
+        frozen = ('a', (1, 2))
+        self.assertEqual(fingerprint(frozen, memoize=True), fingerprint(('a', (1, 2))))
+
+    def test_settings_changed_in_place(self):
+        with override_settings(FINGERPRINT_APP={'SETTING_1': 5}):
+            self.assertEqual(app_settings(CONFIG).SETTING_1, 5)
+            django_settings.FINGERPRINT_APP['SETTING_1'] = 7
+            self.assertEqual(app_settings(CONFIG).SETTING_1, 7)
@@ -0,0 +1,54 @@
+from django.test.utils import override_settings
+
+from ..exceptions import InvalidSettingError
+from ..settings import app_settings
+from .base import AppSettingsTestCase
+
+CONFIG = {
+    'NAME': 'FREEZE_APP',
+    'SETTINGS': {
+        'TITLE': None,
+        'NODES': {'NAME': None, 'PARENT': None},
+    },
+    'DEFAULTS': {'TITLE': 'default'},
+    'LINK': {'NODES.PARENT': 'NODES|NAME'},
+}
+
+
+class FreezeTest(AppSettingsTestCase):
+    def test_freeze_resolves_links(self):
+        nodes = [{'NAME': 'a', 'PARENT': 'b'}, {'NAME': 'b', 'PARENT': 'c'}, {'NAME': 'c'}]
+        with override_settings(FREEZE_APP={'NODES': nodes}):
+            settings = app_settings(CONFIG).freeze()
+            self.assertEqual(settings.TITLE, 'default')
+            self.assertEqual(settings.NODES[0].PARENT.PARENT.NAME, 'c')
+
+    def test_cycle_raises(self):
+        with override_settings(FREEZE_APP={'NODES': [{'NAME': 'a', 'PARENT': 'a'}]}):
+            with self.assertRaises(InvalidSettingError):
+                app_settings(CONFIG).freeze()
+
+    def test_indirect_cycle_raises(self):
+        nodes = [{'NAME': 'a', 'PARENT': 'b'}, {'NAME': 'b', 'PARENT': 'a'}]
+        with override_settings(FREEZE_APP={'NODES': nodes}):
+            with self.assertRaises(InvalidSettingError):
+                app_settings(CONFIG).freeze()
+
+    def test_frozen_table_is_read_only(self):
+        with override_settings(FREEZE_APP={'NODES': []}):
+            frozen = app_settings(CONFIG).freeze()._wrapped._frozen
+            self.assertEqual(frozen['TITLE'], 'default')
+            with self.assertRaises(TypeError):
+                frozen['TITLE'] = 'changed'
+            with self.assertRaises(TypeError):
+                frozen.update(TITLE='changed')
+            self.assertEqual(frozen['TITLE'], 'default')
+
+    def test_invalidate_keeps_table_read_only(self):
+        with override_settings(FREEZE_APP={'NODES': []}):
+            wrapped = app_settings(CONFIG).freeze()._wrapped
+            wrapped.update_settings({'TITLE': 'changed', 'NODES': []})
+            self.assertNotIn('TITLE', wrapped._frozen)
+            with self.assertRaises(TypeError):
+                wrapped._frozen['TITLE'] = 'changed'
+            self.assertEqual(wrapped.TITLE, 'changed')
@@ -0,0 +1,84 @@
+import sys
+import threading
+import types
+
+from django.test.utils import override_settings
+
+from .. import imports
+from ..exceptions import SettingImportError
+from ..settings import app_settings
+from .base import AppSettingsTestCase
+
+CONFIG = {
+    'NAME': 'IMPORTS_APP',
+    'SETTINGS': {'PARSER': None, 'RENDERERS': None},
+    'IMPORT_STRINGS': ('PARSER', 'RENDERERS'),
+}
+
+SETTINGS = {
+    'PARSER': 'json.loads',
+    'RENDERERS': ['json.dumps', 'app_settings_missing_module.render'],
+}
+
+
+class PreloadImportsTest(AppSettingsTestCase):
+    def test_preload_records_timings_per_module(self):
+        with override_settings(IMPORTS_APP=SETTINGS):
+            timings = app_settings(CONFIG).preload_imports()
+        self.assertEqual(sorted(timings), ['app_settings_missing_module', 'json'])
+        self.assertIn('json', imports.import_timings)
+        self.assertIn('json.loads', imports._resolved)
+
+    def test_preload_imports_in_calling_thread(self):
+        threads = []
+        original = imports.importlib.import_module
+
+        def import_module(name, *args, **kwargs):
+            threads.append(threading.current_thread())
+            return original(name, *args, **kwargs)
+
+        imports.importlib.import_module = import_module
+        try:
+            with override_settings(IMPORTS_APP=SETTINGS):
+                app_settings(CONFIG).preload_imports()
+        finally:
+            imports.importlib.import_module = original
+        self.assertTrue(threads)
+        self.assertEqual(set(threads), set([threading.current_thread()]))
+
+
+class ImportFromStringTest(AppSettingsTestCase):
+    def test_failures_are_cached_until_cleared(self):
+        path = 'app_settings_late_module.render'
+        imported = []
+        original = imports.importlib.import_module
+
+        def import_module(name, *args, **kwargs):
+            imported.append(name)
+            return original(name, *args, **kwargs)
+
+        imports.importlib.import_module = import_module
+        module = types.ModuleType('app_settings_late_module')
+        module.render = lambda: None
+        try:
+            for i in range(2):
+                with self.assertRaises(SettingImportError):
+                    imports.import_from_string('IMPORTS_APP', path, 'RENDERER')
+            self.assertEqual(imported, ['app_settings_late_module'])
+            self.assertEqual(imports.import_stats()['failed'], 1)
+
+            sys.modules['app_settings_late_module'] = module
+            with self.assertRaises(SettingImportError):
+                imports.import_from_string('IMPORTS_APP', path, 'RENDERER')
+            imports.clear_import_cache()
+            self.assertIs(imports.import_from_string('IMPORTS_APP', path, 'RENDERER'), module.render)
+            self.assertEqual(len(imported), 2)
+        finally:
+            imports.importlib.import_module = original
+            sys.modules.pop('app_settings_late_module', None)
+
+    def test_setting_changed_clears_failures(self):
+        with self.assertRaises(SettingImportError):
+            imports.import_from_string('IMPORTS_APP', 'app_settings_missing_module.render', 'RENDERER')
+        with override_settings(IMPORTS_APP=SETTINGS):
+            self.assertEqual(imports.import_stats()['failed'], 0)
@@ -0,0 +1,222 @@
+import threading
+from unittest import skipIf
+
+from django.test.utils import override_settings
+
+from .. import init
+from ..init import (
+    BoundClassWrapper, ClassWrapper, InstanceRegistry, SingleFlight, aget_instance, awarm_up, get_instance, warm_up
+)
+from ..settings import app_settings
+from .base import AppSettingsTestCase
+
+
+class Backend(object):
+    created = 0
+
+    def __init__(self, settings=None):
+        Backend.created += 1
+        self.settings = settings
+
+
+class Instance(object):
+    pass
+
+
+class Greeter(object):
+    def greet(self):
+        return 'hello'
+
+
+CONFIG = {
+    'NAME': 'INIT_APP',
+    'SETTINGS': {'BACKEND': {'NAME': None, 'CLASS': None}},
+    'IMPORT_STRINGS': ['BACKEND.CLASS'],
+}
+
+SETTINGS = {'BACKEND': {'NAME': 'b', 'CLASS': 'app_settings.tests.test_init.Backend'}}
+
+INIT_CONFIG = {
+    'NAME': 'WARM_UP_APP',
+    'SETTINGS': {'BACKENDS': {'NAME': None, 'CLASS': None}},
+    'IMPORT_STRINGS': ['BACKENDS.CLASS'],
+    'INIT': ['BACKENDS'],
+}
+
+INIT_SETTINGS = {
+    '_INIT_METHOD': 'app_settings.init.get_instance',
+    'BACKENDS': [{'NAME': 'b%d' % i, 'CLASS': 'app_settings.tests.test_init.Backend'} for i in range(5)],
+}
+
+
+class InstanceRegistryTest(AppSettingsTestCase):
+    def test_lru_eviction(self):
+        registry = InstanceRegistry(max_size=2)
+        instances = [Instance() for i in range(3)]
+        for i, instance in enumerate(instances):
+            registry.set(i, instance)
+        self.assertIsNone(registry.get(0))
+        self.assertIs(registry.get(2), instances[2])
+        self.assertEqual(registry.stats()['evictions'], 1)
+
+    def test_ttl(self):
+        registry = InstanceRegistry(ttl=-1)
+        registry.set('key', Instance())
+        self.assertIsNone(registry.get('key'))
+
+    def test_weak(self):
+        registry = InstanceRegistry(weak=True)
+        registry.set('key', Instance())
+        self.assertIsNone(registry.get('key'))
+
+    def test_configure_keeps_the_storage_bounded(self):
+        registry = InstanceRegistry()
+        registry.configure(ttl=60)
+        self.assertEqual(registry.max_size, 1024)
+        registry.configure(max_size=None)
+        self.assertIsNone(registry.max_size)
+
+
+class GetInstanceTest(AppSettingsTestCase):
+    def test_instances_are_shared_by_fingerprint(self):
+        with override_settings(INIT_APP=SETTINGS):
+            instance = get_instance(app_settings(CONFIG).BACKEND)
+            self.assertIsInstance(instance, Backend)
+            self.assertIs(get_instance(app_settings(CONFIG).BACKEND), instance)
+        with override_settings(INIT_APP={'BACKEND': dict(SETTINGS['BACKEND'], NAME='other')}):
+            self.assertIsNot(get_instance(app_settings(CONFIG).BACKEND), instance)
+
+
+class BoundClassWrapperTest(AppSettingsTestCase):
+    def wrap(self, wrapper_class, instance, settings=SETTINGS):
+        with override_settings(INIT_APP=settings):
+            return wrapper_class(instance, app_settings(CONFIG).BACKEND)
+
+    def test_conflicts_raise_when_wrapping(self):
+        instance = Greeter()
+        instance.NAME = 'instance'
+        for wrapper_class in (ClassWrapper, BoundClassWrapper):
+            with self.assertRaises(Exception):
+                self.wrap(wrapper_class, instance)
+
+    def test_config_and_instance_attributes(self):
+        wrapper = self.wrap(BoundClassWrapper, Greeter())
+        self.assertEqual(wrapper.NAME, 'b')
+        self.assertEqual(wrapper.NAME, 'b')
+        self.assertEqual(wrapper.greet(), 'hello')
+        with self.assertRaises(AttributeError):
+            wrapper.unknown
+
+    def test_methods_are_not_cached(self):
+        instance = Greeter()
+        wrapper = self.wrap(BoundClassWrapper, instance)
+        self.assertEqual(wrapper.greet(), 'hello')
+        instance.greet = lambda: 'patched'
+        self.assertEqual(wrapper.greet(), 'patched')
+        self.assertNotIn('greet', wrapper.__dict__)
+
+
+class SingleFlightTest(AppSettingsTestCase):
+    def test_concurrent_callers_share_the_call(self):
+        waiting = threading.Semaphore(0)
+
+        class Event(object):
+            def __init__(self):
+                self.event = threading.Event()
+                self.set = self.event.set
+
+            def wait(self, *args):
+                waiting.release()  # a follower waits for the leader
+                return self.event.wait(*args)
+
+        class Threading(object):
+            Lock = staticmethod(threading.Lock)
+            current_thread = staticmethod(threading.current_thread)
+
+        flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        calls, results = [], []
+
+        def func():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return object()
+
+        def call():
+            results.append(flight.do('key', func))
+
+        threads = [threading.Thread(target=call) for i in range(4)]
+        Threading.Event = Event
+        init.threading = Threading
+        try:
+            threads[0].start()
+            started.wait()
+            for thread in threads[1:]:
+                thread.start()
+                waiting.acquire()
+        finally:
+            init.threading = threading
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 4)
+        self.assertEqual(len(set(id(result) for result in results)), 1)
+        self.assertEqual(flight._calls, {})
+
+    def test_errors_are_raised(self):
+        flight = SingleFlight()
+
+        def func():
+            raise ValueError('failed')
+        with self.assertRaises(ValueError):
+            flight.do('key', func)
+        self.assertEqual(flight.do('key', lambda: 1), 1)
+
+    def test_reentrant_call(self):
+        flight = SingleFlight()
+        self.assertEqual(flight.do('key', lambda: flight.do('key', lambda: 2)), 2)
+
+
+class WarmUpTest(AppSettingsTestCase):
+    def test_instances_are_created_once(self):
+        Backend.created = 0
+        with override_settings(WARM_UP_APP=INIT_SETTINGS):
+            settings = app_settings(INIT_CONFIG)
+            self.assertEqual(warm_up(settings, max_workers=3), 5)
+            self.assertEqual(Backend.created, 5)
+            self.assertEqual([backend.settings.NAME for backend in settings.BACKENDS], ['b%d' % i for i in range(5)])
+            self.assertEqual(Backend.created, 5)
+
+
+@skipIf(init.asyncio is None, 'needs asyncio (python 3)')
+class AsyncioTest(AppSettingsTestCase):
+    def setUp(self):
+        super(AsyncioTest, self).setUp()
+        self.loop = init.asyncio.new_event_loop()
+        init.asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        init.asyncio.set_event_loop(None)
+        self.loop.close()
+        super(AsyncioTest, self).tearDown()
+
+    def test_aget_instance(self):
+        Backend.created = 0
+        with override_settings(INIT_APP=SETTINGS):
+            config = app_settings(CONFIG).BACKEND
+            first, second = self.loop.run_until_complete(
+                init.asyncio.gather(aget_instance(config), aget_instance(config)))
+            self.assertIsInstance(first, Backend)
+            self.assertIs(first, second)
+            self.assertIs(self.loop.run_until_complete(aget_instance(config)), first)
+            self.assertIs(get_instance(config), first)
+            self.assertEqual(Backend.created, 1)
+
+    def test_awarm_up(self):
+        Backend.created = 0
+        with override_settings(WARM_UP_APP=INIT_SETTINGS):
+            settings = app_settings(INIT_CONFIG)
+            self.assertEqual(self.loop.run_until_complete(awarm_up(settings, max_workers=3)), 5)
+            self.assertEqual(Backend.created, 5)
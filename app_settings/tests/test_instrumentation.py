@@ -0,0 +1,74 @@
+from django.core.management import call_command
+from django.test.utils import override_settings
+from django.utils.six import StringIO
+
+from .. import instrumentation
+from ..settings import app_settings
+from .base import AppSettingsTestCase
+
+CONFIG = {
+    'NAME': 'INSTRUMENTED_APP',
+    'SETTINGS': {'SETTING_1': None},
+}
+
+
+class CollectorTest(AppSettingsTestCase):
+    def test_base_collector_ignores_events(self):
+        collector = instrumentation.add_collector(instrumentation.Collector())
+        try:
+            instrumentation.record('get_attribute', 'APP.SETTING', 0.1)
+        finally:
+            instrumentation.remove_collector(collector)
+        self.assertFalse(instrumentation.enabled)
+
+
+class MemoryCollectorTest(AppSettingsTestCase):
+    def setUp(self):
+        super(MemoryCollectorTest, self).setUp()
+        self.collector = instrumentation.add_collector(instrumentation.MemoryCollector())
+
+    def tearDown(self):
+        instrumentation.remove_collector(self.collector)
+        super(MemoryCollectorTest, self).tearDown()
+
+    def test_enabled_while_collecting(self):
+        self.assertTrue(instrumentation.enabled)
+        instrumentation.remove_collector(self.collector)
+        self.assertFalse(instrumentation.enabled)
+
+    def test_counters_and_histogram(self):
+        instrumentation.record('get_attribute', 'APP.A', 5e-6)
+        instrumentation.record('get_attribute', 'APP.A', 0.5)
+        instrumentation.record('get_attribute', 'APP.B', 2.0)
+        instrumentation.record('link', 'APP.A')
+        self.assertEqual(self.collector.counters[('get_attribute', 'APP.A')], 2)
+        histogram = dict(self.collector.histogram('get_attribute', 'APP.A'))
+        self.assertEqual(histogram[1e-5], 1)
+        self.assertEqual(histogram[1.0], 1)
+        self.assertEqual(dict(self.collector.histogram('get_attribute', 'APP.B'))[None], 1)
+        self.assertEqual(self.collector.histogram('link', 'APP.A'), [])
+        self.assertEqual([lookup for total, maximum, count, lookup in self.collector.slowest()], ['APP.B', 'APP.A'])
+        self.assertEqual(self.collector.hottest(event='link'), [(1, 'APP.A')])
+        self.assertEqual(self.collector.totals()['get_attribute'], 3)
+
+    def test_settings_lookups_are_recorded(self):
+        with override_settings(INSTRUMENTED_APP={'SETTING_1': 2}):
+            settings = app_settings(CONFIG)
+            self.assertEqual(settings.SETTING_1, 2)
+        self.assertEqual(self.collector.counters[('get_attribute', 'INSTRUMENTED_APP.SETTING_1')], 1)
+        self.assertIn(('get_value', 'INSTRUMENTED_APP.SETTING_1'), self.collector.counters)
+
+    def test_cache_hits_are_recorded(self):
+        with override_settings(INSTRUMENTED_APP={'SETTING_1': 2}):
+            app_settings(CONFIG).SETTING_1
+            app_settings(CONFIG).SETTING_1
+        self.assertEqual(self.collector.counters[('cache_hit', 'INSTRUMENTED_APP.SETTING_1')], 1)
+
+
+class StatsCommandTest(AppSettingsTestCase):
+    def test_prints_tables(self):
+        output = StringIO()
+        with override_settings(INSTRUMENTED_APP={'SETTING_1': 2}):
+            call_command('app_settings_stats', 'app_settings.tests.test_instrumentation.CONFIG', stdout=output)
+        self.assertIn('INSTRUMENTED_APP.SETTING_1', output.getvalue())
+        self.assertFalse(instrumentation.enabled)
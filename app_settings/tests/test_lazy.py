@@ -0,0 +1,101 @@
+import copy
+
+from django.test.utils import override_settings
+
+from ..lazy import LazyList, lazy
+from ..settings import BaseSettingsWrapper, app_settings
+from .base import AppSettingsTestCase
+
+CONFIG = {
+    'NAME': 'LAZY_APP',
+    'SETTINGS': {'BACKENDS': {'NAME': None}},
+}
+
+INIT_CONFIG = {
+    'NAME': 'LAZY_INIT_APP',
+    'SETTINGS': {'INIT_LIST': {'NAME': None}},
+    'INIT': ['INIT_LIST'],
+}
+
+
+def init_name(settings):
+    return settings.NAME.upper()
+
+
+class LazySequenceTest(AppSettingsTestCase):
+    def setUp(self):
+        super(LazySequenceTest, self).setUp()
+        self.converted = []
+
+    def convert(self, item):
+        self.converted.append(item)
+        return item * 10
+
+    def test_items_are_converted_on_access(self):
+        items = lazy([1, 2, 3], self.convert)
+        self.assertIsInstance(items, LazyList)
+        self.assertEqual(items[1], 20)
+        self.assertEqual(self.converted, [2])
+        self.assertEqual(items[1], 20)
+        self.assertEqual(self.converted, [2])
+        self.assertEqual(list(items), [10, 20, 30])
+        self.assertEqual(self.converted, [2, 1, 3])
+
+    def test_reading(self):
+        items = lazy([1, 2, 3], self.convert)
+        self.assertEqual(len(items), 3)
+        self.assertEqual(items[-1], 30)
+        self.assertEqual(items[:2], [10, 20])
+        self.assertIn(20, items)
+        self.assertEqual(items, [10, 20, 30])
+        self.assertEqual(items + [40], [10, 20, 30, 40])
+
+    def test_mutation_materializes(self):
+        items = lazy([1, 2], self.convert)
+        items.append(3)
+        self.assertEqual(list.__getitem__(items, 0), 10)  # stored converted
+        self.assertEqual(items, [10, 20, 3])
+
+    def test_tuples_are_converted_at_once(self):
+        items = lazy((1, 2), self.convert)
+        self.assertIs(type(items), tuple)
+        self.assertEqual(items, (10, 20))
+        self.assertEqual(self.converted, [1, 2])
+
+    def test_unpacking_and_formatting(self):
+        def f(*args):
+            return args
+        self.assertEqual(f(*lazy([1, 2], self.convert)), (10, 20))
+        items = lazy((1, 2), self.convert)
+        self.assertEqual(f(*items), (10, 20))
+        self.assertEqual('%s %s' % items, '10 20')
+
+    def test_copies_are_plain(self):
+        items = lazy([1, 2], self.convert)
+        self.assertEqual(type(copy.copy(items)), list)
+        self.assertEqual(copy.deepcopy(items), [10, 20])
+
+
+class LazySettingsTest(AppSettingsTestCase):
+    def test_list_items_are_wrapped_on_access(self):
+        with override_settings(LAZY_APP={'BACKENDS': [{'NAME': 'a'}, {'NAME': 'b'}]}):
+            backends = app_settings(CONFIG).BACKENDS
+            self.assertIsInstance(backends, LazyList)
+            self.assertEqual(backends._converted, {})
+            self.assertIsInstance(backends[1], BaseSettingsWrapper)
+            self.assertEqual(list(backends._converted), [1])
+            self.assertEqual([backend.NAME for backend in backends], ['a', 'b'])
+
+    def test_unpacking_initialized_items(self):
+        def f(*args):
+            return args
+        for items in ([{'NAME': 'a'}, {'NAME': 'b'}], ({'NAME': 'a'}, {'NAME': 'b'})):
+            value = {'_INIT_METHOD': 'app_settings.tests.test_lazy.init_name', 'INIT_LIST': items}
+            with override_settings(LAZY_INIT_APP=value):
+                settings = app_settings(INIT_CONFIG)
+                self.assertEqual(f(*settings.INIT_LIST), ('A', 'B'))
+
+    def test_formatting_initialized_tuples(self):
+        value = {'_INIT_METHOD': 'app_settings.tests.test_lazy.init_name', 'INIT_LIST': ({'NAME': 'a'}, {'NAME': 'b'})}
+        with override_settings(LAZY_INIT_APP=value):
+            self.assertEqual('%s %s' % app_settings(INIT_CONFIG).INIT_LIST, 'A B')
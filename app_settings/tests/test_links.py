@@ -0,0 +1,108 @@
+from django.test.utils import override_settings
+
+from ..exceptions import InvalidSettingError
+from ..links import LinkResolver, build_index
+from ..settings import app_settings
+from .base import AppSettingsTestCase
+
+CONFIG = {
+    'NAME': 'LINK_APP',
+    'SETTINGS': {
+        'DATABASES': {'NAME': None, 'HOST': None},
+        'BACKEND': {'NAME': None, 'DATABASE': None},
+        'BACKENDS': {'NAME': None, 'DATABASE': None},
+    },
+    'LINK': {'BACKEND.DATABASE': 'DATABASES|NAME', 'BACKENDS.DATABASE': 'DATABASES|NAME'},
+}
+
+SETTINGS = {
+    'DATABASES': [{'NAME': 'db1', 'HOST': 'h1'}, {'NAME': 'db2', 'HOST': 'h2'}],
+    'BACKEND': {'NAME': 'b', 'DATABASE': 'db2'},
+    'BACKENDS': [
+        {'NAME': 'b1', 'DATABASE': 'db1'},
+        {'NAME': 'b2', 'DATABASE': ['db1', 'db2']},
+    ],
+}
+
+
+class Item(object):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class LinkTest(AppSettingsTestCase):
+    def test_single_link(self):
+        with override_settings(LINK_APP=SETTINGS):
+            self.assertEqual(app_settings(CONFIG).BACKEND.DATABASE.HOST, 'h2')
+
+    def test_link_lists(self):
+        with override_settings(LINK_APP=SETTINGS):
+            backends = app_settings(CONFIG).BACKENDS
+            self.assertEqual(backends[0].DATABASE.HOST, 'h1')
+            self.assertEqual([database.HOST for database in backends[1].DATABASE], ['h1', 'h2'])
+
+    def test_invalid_link(self):
+        with override_settings(LINK_APP=dict(SETTINGS, BACKEND={'NAME': 'b', 'DATABASE': 'db3'})):
+            with self.assertRaises(Exception):
+                app_settings(CONFIG).BACKEND.DATABASE
+
+    def test_resolver_is_kept_per_wrapper(self):
+        with override_settings(LINK_APP=SETTINGS):
+            backend = app_settings(CONFIG).BACKEND
+            link = backend.get_schema().get_link('DATABASE')
+            resolver = backend.get_link_resolver(link)
+            self.assertIsInstance(resolver, LinkResolver)
+            self.assertIs(backend.get_link_resolver(link), resolver)
+            # it holds the wrapper, which may be configured later on
+            self.assertIsNot(app_settings(CONFIG).BACKEND.get_link_resolver(link), resolver)
+
+    def test_filtered_lookup_keeps_attribute(self):
+        with override_settings(LINK_APP=SETTINGS):
+            settings = app_settings(CONFIG)
+            self.assertEqual(settings.get_filtered('DATABASES', 'NAME', 'db2').HOST, 'h2')
+            self.assertEqual([database.NAME for database in settings.DATABASES], ['db1', 'db2'])
+            overlay = settings.with_configuration({'BACKEND': {'NAME': 'overlay'}})
+            self.assertEqual([database.NAME for database in overlay.DATABASES], ['db1', 'db2'])
+
+    def test_build_index(self):
+        first, second, duplicate = Item(NAME='a'), Item(NAME='b'), Item(NAME='a')
+        index = build_index([first, second, duplicate], 'NAME')
+        self.assertIs(index.get('a'), first)
+        self.assertIs(index.get('b'), second)
+        self.assertIsNone(index.get('c'))
+        self.assertEqual(build_index({'a': first}, 'NAME'), {'a': first})
+        self.assertEqual(build_index([first], None), {})
+
+    def test_index_with_unhashable_values(self):
+        first, second = Item(NAME=['a']), Item(NAME='b')
+        index = build_index([first, second], 'NAME')
+        self.assertIs(index.get('b'), second)
+        self.assertIs(index.get(['a']), first)
+        self.assertIsNone(index.get({'NAME': 'c'}))
+
+    def test_unmatched_unhashable_filter_value(self):
+        with override_settings(LINK_APP=SETTINGS):
+            settings = app_settings(CONFIG)
+            databases = settings.get_prepared_value('DATABASES')
+            with self.assertRaises(Exception) as context:
+                settings.apply_filter(databases, 'NAME', ['db1'])
+            self.assertNotIsInstance(context.exception, TypeError)
+
+    def test_index_scans_up_to_match(self):
+        class Failing(object):
+            @property
+            def NAME(self):
+                raise InvalidSettingError('NAME')
+
+        first = Item(NAME='a')
+        index = build_index([first, Failing()], 'NAME')
+        self.assertIs(index.get('a'), first)
+        with self.assertRaises(InvalidSettingError):
+            index.get('b')
+
+    def test_link_ignores_invalid_items_after_match(self):
+        databases = [{'NAME': 'db1', 'HOST': 'h1'}, {'HOST': 'h2'}]
+        with override_settings(LINK_APP=dict(SETTINGS, DATABASES=databases, BACKEND={'NAME': 'b', 'DATABASE': 'db1'})):
+            settings = app_settings(CONFIG)
+            self.assertEqual(settings.BACKEND.DATABASE.HOST, 'h1')
+            self.assertEqual(settings.get_filtered('DATABASES', 'NAME', 'db1').HOST, 'h1')
@@ -0,0 +1,56 @@
+import gc
+
+from django.test.utils import override_settings
+
+from ..settings import CompactSettingsWrapper, SettingsWrapper, app_settings
+from .base import AppSettingsTestCase
+
+CONFIG = {
+    'NAME': 'OVERLAY_APP',
+    'SETTINGS': {'SETTING_1': None, 'SETTING_2': None, 'CHILD': {'NAME': None}},
+    'DEFAULTS': {'SETTING_1': 1},
+}
+
+SETTINGS = {'SETTING_2': 'old', 'CHILD': {'NAME': 'child'}}
+
+
+class OverlayTest(AppSettingsTestCase):
+    def wrap(self, wrapper_class=SettingsWrapper):
+        with override_settings(OVERLAY_APP=SETTINGS):
+            return app_settings(CONFIG, in_holder=False, wrapper_class=wrapper_class)
+
+    def test_configuration_is_applied(self):
+        settings = self.wrap()
+        overlay = settings.with_configuration({'SETTING_1': 2})
+        self.assertEqual(overlay.SETTING_1, 2)
+        self.assertEqual(settings.SETTING_1, 1)
+
+    def test_unaffected_values_are_shared(self):
+        settings = self.wrap()
+        overlay = settings.with_configuration({'SETTING_1': 2})
+        self.assertIs(overlay.CHILD, settings.CHILD)
+        self.assertIs(overlay.get_base('CHILD'), settings)
+        self.assertIsNone(overlay.get_base('SETTING_1'))
+
+    def test_update_settings_reaches_overlays(self):
+        for wrapper_class in (SettingsWrapper, CompactSettingsWrapper):
+            settings = self.wrap(wrapper_class)
+            overlay = settings.with_configuration({'SETTING_1': 2})
+            # not a setting name (like a collection lookup value): nothing is shared
+            nested = overlay.with_configuration({'SETTING_1': 3, 'lookup-value': {}})
+            self.assertIsNone(nested.get_base('SETTING_2'))
+            for wrapper in (settings, overlay, nested):
+                self.assertEqual(wrapper.SETTING_2, 'old')
+                self.assertEqual(wrapper.CHILD.NAME, 'child')
+
+            self.assertEqual(settings.update_settings(dict(SETTINGS, SETTING_2='new')), set(['SETTING_2']))
+            for wrapper in (settings, overlay, nested):
+                self.assertEqual(wrapper.SETTING_2, 'new')
+                self.assertEqual(wrapper.CHILD.NAME, 'child')
+            self.assertEqual((overlay.SETTING_1, nested.SETTING_1), (2, 3))
+
+    def test_overlays_are_not_kept_alive(self):
+        settings = self.wrap()
+        settings.with_configuration({'SETTING_1': 2})
+        gc.collect()
+        self.assertEqual(len(settings._overlays), 0)
@@ -0,0 +1,49 @@
+from django.test.utils import override_settings
+
+from ..settings import app_settings
+from .base import AppSettingsTestCase
+
+CONFIG = {
+    'NAME': 'PATHS_APP',
+    'SETTINGS': {'SETTING_1': None, 'CHILD': {'NAME': None, 'GRANDCHILD': {'NAME': None}}},
+    'DEFAULTS': {'SETTING_1': 1},
+}
+
+SETTINGS = {'CHILD': {'NAME': 'child', 'GRANDCHILD': {'NAME': 'grandchild'}}}
+
+
+class PathTest(AppSettingsTestCase):
+    def test_get_path(self):
+        with override_settings(PATHS_APP=SETTINGS):
+            settings = app_settings(CONFIG)
+            self.assertEqual(settings.get_path('CHILD.GRANDCHILD.NAME'), 'grandchild')
+            self.assertEqual(settings['CHILD.NAME'], 'child')
+            self.assertEqual(settings._wrapped['SETTING_1'], 1)
+            self.assertEqual(settings.CHILD['GRANDCHILD.NAME'], 'grandchild')
+
+    def test_frozen_paths(self):
+        with override_settings(PATHS_APP=SETTINGS):
+            settings = app_settings(CONFIG).freeze()
+            self.assertEqual(settings._wrapped._frozen['CHILD.GRANDCHILD.NAME'], 'grandchild')
+            self.assertEqual(settings['CHILD.GRANDCHILD.NAME'], 'grandchild')
+
+    def test_unknown_path(self):
+        with override_settings(PATHS_APP=SETTINGS):
+            with self.assertRaises(AttributeError):
+                app_settings(CONFIG)['CHILD.UNKNOWN']
+
+    def test_non_string_keys(self):
+        with override_settings(PATHS_APP=SETTINGS):
+            settings = app_settings(CONFIG)
+            for wrapper in (settings, settings._wrapped, settings.CHILD):
+                with self.assertRaises(TypeError):
+                    wrapper[0]
+
+    def test_not_iterable(self):
+        with override_settings(PATHS_APP=SETTINGS):
+            settings = app_settings(CONFIG)
+            for wrapper in (settings, settings._wrapped, settings.CHILD):
+                with self.assertRaises(TypeError):
+                    iter(wrapper)
+                with self.assertRaises(TypeError):
+                    'SETTING_1' in wrapper
@@ -0,0 +1,51 @@
+import os
+
+from django.test.utils import override_settings
+
+from .. import prefork
+from ..settings import app_settings
+from .base import AppSettingsTestCase
+
+CONFIG = {
+    'NAME': 'PREFORK_APP',
+    'SETTINGS': {'SETTING_1': None, 'CHILD': {'NAME': None}},
+    'DEFAULTS': {'SETTING_1': 1},
+}
+
+
+class PreforkTest(AppSettingsTestCase):
+    def setUp(self):
+        super(PreforkTest, self).setUp()
+        self.calls = []
+        prefork._after_fork_pid = None
+        prefork.register_post_fork(self.hook)
+
+    def tearDown(self):
+        prefork._post_fork_hooks.remove(self.hook)
+        prefork._after_fork_pid = None
+        super(PreforkTest, self).tearDown()
+
+    def hook(self):
+        self.calls.append(os.getpid())
+
+    def test_preload_freezes(self):
+        with override_settings(PREFORK_APP={'CHILD': {'NAME': 'child'}}):
+            holder = app_settings(CONFIG)
+            prefork.preload([holder], gc_freeze=False)
+            self.assertTrue(holder._wrapped.is_frozen())
+            self.assertEqual(holder['CHILD.NAME'], 'child')
+
+    def test_after_fork_runs_once_per_process(self):
+        prefork.after_fork()
+        prefork.after_fork()  # e.g. register_at_fork() and the post_fork hook of the server
+        self.assertEqual(self.calls, [os.getpid()])
+
+    def test_after_fork_runs_in_new_process(self):
+        prefork.after_fork()
+        prefork._after_fork_pid = -1  # as seen by a forked worker
+        prefork.after_fork()
+        self.assertEqual(len(self.calls), 2)
+
+    def test_hooks_are_registered_once(self):
+        prefork.register_post_fork(self.hook)
+        self.assertEqual(prefork._post_fork_hooks.count(self.hook), 1)
@@ -0,0 +1,81 @@
+from django.conf import settings as django_settings
+from django.test.utils import override_settings
+
+from ..exceptions import SettingsValidationError
+from ..reload import SettingsReloader
+from ..settings import app_settings
+from .base import AppSettingsTestCase
+
+
+def validate_host(name, value):
+    if name == 'HOST' and not value:
+        return False
+
+
+CONFIG = {
+    'NAME': 'RELOAD_APP',
+    'SETTINGS': {
+        'DATABASES': {'NAME': None, 'HOST': None},
+        'BACKEND': {'NAME': None, 'DATABASE': None},
+    },
+    'LINK': {'BACKEND.DATABASE': 'DATABASES|NAME'},
+    'VALIDATION_METHOD': validate_host,
+}
+
+
+def make_settings(host):
+    return {
+        'DATABASES': [{'NAME': 'db', 'HOST': host}],
+        'BACKEND': {'NAME': 'b', 'DATABASE': 'db'},
+    }
+
+
+class ReloadTest(AppSettingsTestCase):
+    def test_reload_swaps_settings(self):
+        with override_settings(RELOAD_APP=make_settings('old')):
+            holder = app_settings(CONFIG)
+            reloader = SettingsReloader(holder, CONFIG)
+            wrapped = reloader.reload(make_settings('new'))
+            self.assertIs(holder.current(), wrapped)
+            self.assertEqual(holder.BACKEND.DATABASE.HOST, 'new')
+            self.assertEqual(reloader.reloads, 1)
+
+    def test_reload_leaves_django_settings_alone(self):
+        old_settings = make_settings('old')
+        with override_settings(RELOAD_APP=old_settings):
+            holder = app_settings(CONFIG)
+            SettingsReloader(holder, CONFIG).reload(make_settings('new'))
+            self.assertIs(django_settings.RELOAD_APP, old_settings)
+
+    def test_old_settings_stay_consistent(self):
+        with override_settings(RELOAD_APP=make_settings('old')):
+            holder = app_settings(CONFIG)
+            old = holder.current()
+            SettingsReloader(holder, CONFIG).reload(make_settings('new'))
+            # links of the old settings are resolved after the reload, still within the old settings
+            self.assertEqual(old.BACKEND.DATABASE.HOST, 'old')
+            self.assertEqual(holder.BACKEND.DATABASE.HOST, 'new')
+
+    def test_links_follow_the_wrapper_not_the_sources(self):
+        with override_settings(RELOAD_APP=make_settings('old')):
+            holder = app_settings(CONFIG)
+            with override_settings(RELOAD_APP=make_settings('other')):
+                self.assertEqual(holder.BACKEND.DATABASE.HOST, 'old')
+
+    def test_invalid_settings_are_not_swapped(self):
+        with override_settings(RELOAD_APP=make_settings('old')):
+            holder = app_settings(CONFIG)
+            old = holder.current()
+            reloader = SettingsReloader(holder, CONFIG)
+            with self.assertRaises(SettingsValidationError):
+                reloader.reload(make_settings(''))
+            self.assertIs(holder.current(), old)
+            self.assertEqual(reloader.reloads, 0)
+
+    def test_reload_from_django_settings(self):
+        with override_settings(RELOAD_APP=make_settings('old')):
+            holder = app_settings(CONFIG)
+            reloader = SettingsReloader(holder, CONFIG)
+            with override_settings(RELOAD_APP=make_settings('new')):
+                reloader.reload()
+            self.assertEqual(holder.BACKEND.DATABASE.HOST, 'new')
@@ -0,0 +1,52 @@
+from django.test.utils import override_settings
+
+from ..schema import SettingsSchema, get_schema
+from ..settings import app_settings
+from .base import AppSettingsTestCase
+
+CONFIG = {
+    'NAME': 'SCHEMA_APP',
+    'SETTINGS': {
+        'SETTING_1': None,
+        'DATABASES': {'NAME': None, 'HOST': None},
+        'BACKEND': {'NAME': None, 'DATABASE': None, 'CLASS': None},
+    },
+    'DEFAULTS': {'SETTING_1': 1, 'BACKEND': {'NAME': 'default'}},
+    'IMPORT_STRINGS': ['BACKEND.CLASS'],
+    'LINK': {'BACKEND.DATABASE': 'DATABASES|NAME'},
+}
+
+
+class SchemaTest(AppSettingsTestCase):
+    def test_schema_is_built_once_per_app_config(self):
+        self.assertIs(get_schema(CONFIG), get_schema(CONFIG))
+        self.assertIsNot(get_schema(CONFIG), get_schema(dict(CONFIG)))
+
+    def test_child_schema(self):
+        schema = get_schema(CONFIG)
+        child = schema.child('BACKEND')
+        self.assertIs(child, schema.child('BACKEND'))
+        self.assertIs(child.root, schema)
+        self.assertEqual(child.defaults, {'NAME': 'default'})
+        self.assertEqual(child.import_strings, ['CLASS'])
+        self.assertEqual(child.unpacked_links, {'DATABASE': ('DATABASES', 'NAME')})
+        self.assertIn('CLASS', child.import_targets)
+
+    def test_default_attributes(self):
+        schema = SettingsSchema(available_settings={'A': None})
+        self.assertEqual(set(schema.available_attributes), {'A', 'PROTECTED', 'CLASS', 'DEBUG', '_INIT_METHOD'})
+
+    def test_dependency_names(self):
+        schema = get_schema(CONFIG)
+        self.assertEqual(schema.get_dependency_names('SETTING_1'), {'SETTING_1', 'SETTING_1_COLLECTION'})
+        names = schema.get_dependency_names('BACKEND')
+        self.assertIn('DATABASES', names)  # link target
+        self.assertIn('DEBUG', names)  # global of the nested settings
+        self.assertNotIn('SETTING_1', names)
+
+    def test_wrappers_share_the_schema(self):
+        with override_settings(SCHEMA_APP={'BACKEND': {'NAME': 'b'}}):
+            settings = app_settings(CONFIG)
+            self.assertIs(settings.BACKEND.get_schema(), get_schema(CONFIG).child('BACKEND'))
+            self.assertEqual(settings.SETTING_1, 1)
+            self.assertEqual(settings.BACKEND.NAME, 'b')
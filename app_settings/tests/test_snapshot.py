@@ -0,0 +1,60 @@
+import json
+import shutil
+import tempfile
+
+from django.test.utils import override_settings
+
+from .. import snapshot
+from ..settings import app_settings
+from .base import AppSettingsTestCase
+
+CONFIG = {
+    'NAME': 'SNAPSHOT_APP',
+    'SETTINGS': {'A': None, 'B': None, 'CHILD': {'NAME': None}, 'PARSER': None},
+    'IMPORT_STRINGS': ('PARSER', ),
+}
+
+SETTINGS = {'A': 'old', 'B': [1, (2, 3)], 'CHILD': {'NAME': 'child'}, 'PARSER': 'json.loads'}
+
+
+class SnapshotTest(AppSettingsTestCase):
+    def setUp(self):
+        super(SnapshotTest, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        snapshot._loaded.clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        snapshot._loaded.clear()
+        super(SnapshotTest, self).tearDown()
+
+    def load(self):
+        with override_settings(SNAPSHOT_APP=SETTINGS, APP_SETTINGS_SNAPSHOT_DIR=self.directory):
+            return app_settings(CONFIG, in_holder=False)
+
+    def test_round_trip(self):
+        with override_settings(SNAPSHOT_APP=SETTINGS):
+            snapshot.write_snapshot(app_settings(CONFIG, in_holder=False), self.directory)
+        settings = self.load()
+        self.assertIn('A', settings._paths)
+        self.assertEqual(settings.A, 'old')
+        self.assertEqual(settings['B'], [1, (2, 3)])
+        self.assertEqual(settings['CHILD.NAME'], 'child')
+        self.assertIs(settings['PARSER'], json.loads)
+
+    def test_outdated_snapshot_is_ignored(self):
+        with override_settings(SNAPSHOT_APP=dict(SETTINGS, A='other')):
+            snapshot.write_snapshot(app_settings(CONFIG, in_holder=False), self.directory)
+        settings = self.load()
+        self.assertFalse(settings._paths)
+        self.assertEqual(settings.A, 'old')
+
+    def test_update_settings_invalidates_loaded_paths(self):
+        with override_settings(SNAPSHOT_APP=SETTINGS):
+            snapshot.write_snapshot(app_settings(CONFIG, in_holder=False), self.directory)
+        settings = self.load()
+        self.assertEqual(settings['A'], 'old')
+        self.assertEqual(settings.update_settings(dict(SETTINGS, A='new')), set(['A']))
+        self.assertEqual(settings.A, 'new')
+        self.assertEqual(settings['A'], 'new')
+        self.assertEqual(settings['CHILD.NAME'], 'child')
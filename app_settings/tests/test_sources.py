@@ -0,0 +1,98 @@
+import json
+import os
+import tempfile
+
+from .. import sources
+from ..settings import app_settings
+from .base import AppSettingsTestCase
+
+
+class SourceTest(AppSettingsTestCase):
+    def test_base_source_is_empty(self):
+        source = sources.Source()
+        self.assertEqual(source.get_data(), {})
+        self.assertIsNone(source.get('APP'))
+        self.assertEqual(source.refresh(), set())
+
+
+class EnvSourceTest(AppSettingsTestCase):
+    def test_paths_and_json_values(self):
+        source = sources.EnvSource(prefix='DJANGO__', environ={
+            'DJANGO__APP__SETTING_1': '5',
+            'DJANGO__APP__CHILD__NAME': 'child',
+            'DJANGO__APP__LIST': '[1, 2]',
+            'DJANGO__APP': 'too short',
+            'OTHER__APP__SETTING_1': '1',
+        })
+        self.assertEqual(source.get('APP'), {'SETTING_1': 5, 'CHILD': {'NAME': 'child'}, 'LIST': [1, 2]})
+
+
+class FileSourceTest(AppSettingsTestCase):
+    def setUp(self):
+        super(FileSourceTest, self).setUp()
+        handle, self.path = tempfile.mkstemp(suffix='.json')
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+        super(FileSourceTest, self).tearDown()
+
+    def write(self, data):
+        with open(self.path, 'w') as f:
+            json.dump(data, f)
+
+    def test_read_and_refresh(self):
+        self.write({'APP': {'SETTING_1': 1, 'SETTING_2': 2}})
+        source = sources.FileSource(self.path)
+        self.assertEqual(source.get('APP'), {'SETTING_1': 1, 'SETTING_2': 2})
+        self.assertEqual(source.refresh(), set())
+
+        self.write({'APP': {'SETTING_1': 1, 'SETTING_2': 3}, 'OTHER': {}})
+        self.assertEqual(source.refresh(), set(['APP', 'OTHER']))
+        self.assertEqual(source.get('APP')['SETTING_2'], 3)
+
+    def test_missing_file(self):
+        self.assertEqual(sources.FileSource(self.path + '.missing').get_data(), {})
+
+
+class KeyValueSourceTest(AppSettingsTestCase):
+    def test_keys_and_values(self):
+        store = sources.MemoryStore({'app/APP.SETTING_1': '1', 'app/APP.CHILD.NAME': b'child', 'app/APP': 'x'})
+        source = sources.KeyValueSource(store, prefix='app/')
+        self.assertEqual(source.get('APP'), {'SETTING_1': 1, 'CHILD': {'NAME': 'child'}})
+
+        store.set('app/APP.SETTING_1', '2')
+        self.assertEqual(source.refresh(), set(['APP']))
+        self.assertEqual(source.get('APP')['SETTING_1'], 2)
+
+
+class SourceStackTest(AppSettingsTestCase):
+    def tearDown(self):
+        sources.configure(None)
+        super(SourceStackTest, self).tearDown()
+
+    def test_later_sources_take_precedence(self):
+        low = sources.KeyValueSource(sources.MemoryStore({'APP.SETTING_1': '1', 'APP.CHILD.NAME': 'a'}))
+        high = sources.EnvSource(environ={'APP__CHILD__NAME': 'b'})
+        stack = sources.SourceStack([low, high])
+        self.assertEqual(stack.get('APP'), {'SETTING_1': 1, 'CHILD': {'NAME': 'b'}})
+        self.assertIs(stack.get('APP'), stack.get('APP'))
+        self.assertIsNone(stack.get('OTHER'))
+
+    def test_refresh_rebuilds_changed_settings(self):
+        store = sources.MemoryStore({'APP.SETTING_1': '1'})
+        stack = sources.SourceStack([sources.KeyValueSource(store)])
+        merged = stack.get('APP')
+        fingerprint = stack.get_fingerprint()
+        store.set('APP.SETTING_1', '2')
+        self.assertEqual(stack.refresh(), set(['APP']))
+        self.assertIsNot(stack.get('APP'), merged)
+        self.assertEqual(stack.get('APP'), {'SETTING_1': 2})
+        self.assertNotEqual(stack.get_fingerprint(), fingerprint)
+
+    def test_app_settings_read_configured_sources(self):
+        config = {'NAME': 'SOURCES_APP', 'SETTINGS': {'SETTING_1': None}, 'DEFAULTS': {'SETTING_1': 0}}
+        sources.configure([sources.EnvSource(environ={'SOURCES_APP__SETTING_1': '5'})])
+        self.assertEqual(app_settings(config).SETTING_1, 5)
+        sources.configure(None)
+        self.assertEqual(app_settings(config).SETTING_1, 0)
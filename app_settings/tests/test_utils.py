@@ -0,0 +1,30 @@
+from django.test import SimpleTestCase
+
+from ..utils import dict_merge
+
+
+class DictMergeTest(SimpleTestCase):
+    def test_merge(self):
+        self.assertEqual(
+            dict_merge({'a': 1, 'b': {'c': 2, 'd': 3}}, {'b': {'c': 4}, 'e': 5}),
+            {'a': 1, 'b': {'c': 4, 'd': 3}, 'e': 5}
+        )
+
+    def test_inputs_are_not_touched(self):
+        a = {'b': {'c': 2}}
+        b = {'b': {'c': 4}}
+        dict_merge(a, b)
+        self.assertEqual(a, {'b': {'c': 2}})
+        self.assertEqual(b, {'b': {'c': 4}})
+
+    def test_unchanged_subtrees_are_shared(self):
+        shared = {'x': 1}
+        a = {'shared': shared, 'b': {'c': 2}}
+        result = dict_merge(a, {'b': {'c': 3}})
+        self.assertIs(result['shared'], shared)
+        self.assertIs(dict_merge(a, {'b': {'c': 2}}), a)
+        self.assertIs(dict_merge(a, {}), a)
+
+    def test_non_dicts_replace(self):
+        self.assertEqual(dict_merge({'a': {'b': 1}}, {'a': 2}), {'a': 2})
+        self.assertEqual(dict_merge({'a': 1}, [1]), [1])
@@ -0,0 +1,70 @@
+from django.test.utils import override_settings
+
+from .. import validation
+from ..exceptions import SettingsValidationError
+from ..settings import app_settings
+from .base import AppSettingsTestCase
+
+
+def accept(name, value):
+    pass
+
+
+def reject_negative(name, value):
+    if isinstance(value, int) and value < 0:
+        return False
+
+
+def fail(name, value):
+    raise ValueError(value)
+
+
+def make_config(validation_method):
+    return {
+        'NAME': 'VALIDATION_APP',
+        'SETTINGS': {'SETTING_1': None, 'SETTING_2': None},
+        'DEFAULTS': {'SETTING_1': 1, 'SETTING_2': 2},
+        'VALIDATION_METHOD': validation_method,
+    }
+
+
+class ValidationTest(AppSettingsTestCase):
+    def test_returning_none_is_valid(self):
+        with override_settings(VALIDATION_APP={}):
+            app_settings(make_config(accept)).validate()
+
+    def test_returning_false_is_invalid(self):
+        with override_settings(VALIDATION_APP={'SETTING_2': -1}):
+            with self.assertRaises(SettingsValidationError) as context:
+                app_settings(make_config(reject_negative)).validate()
+        self.assertIn('VALIDATION_APP.SETTING_2', str(context.exception))
+        self.assertNotIn('VALIDATION_APP.SETTING_1', str(context.exception))
+
+    def test_raising_is_invalid(self):
+        with override_settings(VALIDATION_APP={}):
+            with self.assertRaises(SettingsValidationError):
+                app_settings(make_config(fail)).validate()
+
+    def test_freeze_does_not_validate(self):
+        with override_settings(VALIDATION_APP={}):
+            settings = app_settings(make_config(fail)).freeze()
+            self.assertEqual(settings.SETTING_2, 2)
+
+    def test_exceptions_are_attached(self):
+        with override_settings(VALIDATION_APP={}):
+            with self.assertRaises(SettingsValidationError) as context:
+                app_settings(make_config(fail)).validate()
+        causes = context.exception.causes
+        self.assertEqual(sorted(causes), ['VALIDATION_APP.SETTING_1', 'VALIDATION_APP.SETTING_2'])
+        self.assertIsInstance(causes['VALIDATION_APP.SETTING_1'], ValueError)
+        self.assertIn("'VALIDATION_APP.SETTING_1' (ValueError: 1)", str(context.exception))
+
+    def test_results_are_bounded(self):
+        original = validation.MAX_RESULTS
+        validation.MAX_RESULTS = 2
+        try:
+            for i in range(5):
+                validation.set_result(i, [])
+            self.assertEqual(list(validation._results), [3, 4])
+        finally:
+            validation.MAX_RESULTS = original
@@ -0,0 +1,70 @@
+from django.test.utils import override_settings
+
+from ..settings import BaseSettingsWrapper, SettingsWrapper, app_settings
+from .base import AppSettingsTestCase
+
+CONFIG = {
+    'NAME': 'WRAPPERS_APP',
+    'SETTINGS': {'SETTING_1': None, 'CHILD': {'NAME': None}},
+    'DEFAULTS': {'SETTING_1': 1},
+}
+
+
+class PlainWrapper(BaseSettingsWrapper):
+    pass
+
+
+class BaseSettingsWrapperTest(AppSettingsTestCase):
+    def test_subclass_without_overrides(self):
+        with override_settings(WRAPPERS_APP={'CHILD': {'NAME': 'child'}}):
+            settings = app_settings(CONFIG, in_holder=False, wrapper_class=PlainWrapper)
+            self.assertIsInstance(settings, PlainWrapper)
+            self.assertEqual(settings.SETTING_1, 1)
+            self.assertIsInstance(settings.CHILD, PlainWrapper)
+            self.assertEqual(settings.CHILD.NAME, 'child')
+            self.assertIsInstance(settings.with_configuration({'SETTING_1': 2}), PlainWrapper)
+
+    def test_uncache_value(self):
+        with override_settings(WRAPPERS_APP={}):
+            settings = app_settings(CONFIG, in_holder=False, wrapper_class=PlainWrapper)
+            self.assertEqual(settings.SETTING_1, 1)
+            self.assertIn('SETTING_1', settings.__dict__)
+            settings.uncache_value('SETTING_1')
+            self.assertNotIn('SETTING_1', settings.__dict__)
+
+
+class PrefixWrapper(SettingsWrapper):
+    """
+    passes an own kwarg on to its child wrappers, like ExampleSubclassWrapper.
+    """
+    def __init__(self, *args, **kwargs):
+        prefix = kwargs.pop('prefix', None)
+        super(PrefixWrapper, self).__init__(*args, **kwargs)
+        self.set_kwarg('prefix', prefix)
+
+    def get_value(self, attribute_name):
+        value = super(PrefixWrapper, self).get_value(attribute_name)
+        if value is None:
+            value = self.get_kwarg('prefix')
+        return value
+
+    def wrap_own_kwargs(self, name, **kwargs):
+        if name == 'prefix':
+            attribute_name = kwargs.get('attribute_name')
+            return self.get_kwarg(name) + '-' + attribute_name if attribute_name else self.get_kwarg(name)
+        return super(PrefixWrapper, self).wrap_own_kwargs(name, **kwargs)
+
+    def get_wrapper_class(self):
+        return PrefixWrapper
+
+
+class SubclassKwargsTest(AppSettingsTestCase):
+    def wrap(self, prefix):
+        settings = app_settings(CONFIG, in_holder=False, wrapper_class=PrefixWrapper)
+        settings.set_kwarg('prefix', prefix)
+        return settings
+
+    def test_kwargs_reach_child_wrappers(self):
+        with override_settings(WRAPPERS_APP={'CHILD': {}}):
+            self.assertEqual(self.wrap('root').CHILD.NAME, 'root-CHILD')
+            self.assertEqual(self.wrap('other').CHILD.NAME, 'other-CHILD')
@@ -1,22 +1,48 @@
-from copy import deepcopy
 from functools import wraps
 
+from .context import pop_override, push_override
+
 
 def dict_merge(a, b):
     '''recursively merges dict's. not just simple a['key'] = b['key'], if
     both a and bhave a key who's value is a dict then dict_merge is called
-    on both values and the result stored in the returned dictionary.'''
+    on both values and the result stored in the returned dictionary.
+
+    nothing gets copied: only the dicts on paths where a and b both have a
+    dict are rebuilt, every other value (and subtree) is shared with a or b.
+    so the result has to be treated as read only.'''
     if not isinstance(b, dict):
         return b
-    result = deepcopy(a)
-    for k, v in b.iteritems():
-        if k in result and isinstance(result[k], dict):
-                result[k] = dict_merge(result[k], v)
-        else:
-            result[k] = deepcopy(v)
+    if not isinstance(a, dict) or not a:
+        return b
+    if not b:
+        return a
+    result = None
+    for k, v in b.items():
+        current = a.get(k, None)
+        if isinstance(current, dict):
+            v = dict_merge(current, v)
+        if k in a and current is v:
+            continue
+        if result is None:
+            result = dict(a)
+        result[k] = v
+    if result is None:
+        return a
     return result
 
 
+class ReadOnlyDict(dict):
+    """
+    dict refusing every change, for tables handed out to callers (see
+    freeze()).
+    """
+    def _refuse(self, *args, **kwargs):
+        raise TypeError('%s is read only' % self.__class__.__name__)
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _refuse
+
+
 class override_app_settings(object):
     """
     Acts as either a decorator, or a context manager. If it's a decorator it
@@ -59,16 +85,15 @@ class override_app_settings(object):
                 test_func._overridden_settings, **self.options)
 
     def enable(self):
+        # layered on top of the settings active in this thread / task
         override = self.settings.with_configuration(self.options)
-        self.wrapped = self.settings._wrapped
-        self.settings._wrapped = override
+        push_override(self.settings, override)
         #for key, new_value in self.options.items():
         #    setting_changed.send(sender=self.settings._wrapped.__class__,
         #                         setting=key, value=new_value, enter=True)
 
     def disable(self):
-        self.settings._wrapped = self.wrapped
-        del self.wrapped
+        pop_override(self.settings)
         #for key in self.options:
         #    new_value = getattr(self.settings, key, None)
         #    setting_changed.send(sender=self.settings._wrapped.__class__,
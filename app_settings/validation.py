@@ -0,0 +1,79 @@
+import threading
+import time
+from collections import OrderedDict
+from .imports import import_from_string
+
+# absolute setting lookup -> seconds its last validation took
+validation_timings = {}
+
+MAX_RESULTS = 1000
+
+# wrapper fingerprint -> [(lookup, cause)] of the invalid settings of the
+# wrapper, oldest results first
+_results = OrderedDict()
+_lock = threading.Lock()
+
+
+def get_validation_method(wrapper, attribute_name):
+    """
+    the callable validating attribute_name of wrapper: _VALIDATE_<name> of
+    the settings or the VALIDATION_METHOD of the app_config (or None).
+    """
+    lookup = '_VALIDATE_' + attribute_name
+    validation_method = wrapper.as_dict().get(lookup, None)
+    if validation_method is None:
+        lookup = 'VALIDATION_METHOD'
+        # VALIDATION_METHOD applies to nested settings too
+        validation_method = wrapper.get_kwarg('validation_method') or wrapper.get_schema().root.validation_method
+    if isinstance(validation_method, basestring):
+        validation_method = import_from_string(
+            wrapper.get_settings_name(),
+            validation_method,
+            wrapper.get_absolute_lookup(lookup, include_settings_name=False)
+        )
+    return validation_method
+
+
+def validate_setting(wrapper, attribute_name, value):
+    """
+    calls the validation method of attribute_name (if any) with the not yet
+    finalized value and records the time it took. returns True if the value
+    is valid: the method returns anything but False (like None). otherwise
+    False, or the exception the method raised - so a bug in the method isn't
+    mistaken for a plain invalid value.
+    """
+    validation_method = get_validation_method(wrapper, attribute_name)
+    if validation_method is None:
+        return True
+    start = time.time()
+    try:
+        return validation_method(attribute_name, value) is not False
+    except Exception as e:
+        return e
+    finally:
+        validation_timings[wrapper.get_absolute_lookup(attribute_name)] = time.time() - start
+
+
+def get_result(fingerprint):
+    return _results.get(fingerprint, None)
+
+
+def set_result(fingerprint, errors):
+    with _lock:
+        if fingerprint not in _results and len(_results) >= MAX_RESULTS:
+            _results.popitem(last=False)
+        _results[fingerprint] = tuple(errors)
+
+
+def clear_validation_cache():
+    _results.clear()
+
+
+def slowest_validations(limit=10):
+    """
+    [(seconds, setting lookup)] of the slowest recorded validations.
+    """
+    return sorted(
+        ((seconds, lookup) for lookup, seconds in validation_timings.items()),
+        reverse=True
+    )[:limit]
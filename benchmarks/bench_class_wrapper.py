@@ -0,0 +1,49 @@
+"""
+attribute access through ClassWrapper / BoundClassWrapper compared to the
+wrapped instance itself.
+"""
+from __future__ import print_function
+
+from common import measure, report, setup_django
+
+
+class Backend(object):
+    def __init__(self, settings=None):
+        self.settings = settings
+        self.connected = True
+
+    def ping(self):
+        return 'pong'
+
+
+def main():
+    app_config = {
+        'NAME': 'BENCH_CLASS_WRAPPER',
+        'SETTINGS': {'BACKEND': {'NAME': None, 'TIMEOUT': None, 'CLASS': None}},
+        'IMPORT_STRINGS': ['BACKEND.CLASS'],
+    }
+    setup_django(BENCH_CLASS_WRAPPER={
+        'BACKEND': {'NAME': 'backend', 'TIMEOUT': 10, 'CLASS': 'bench_class_wrapper.Backend'},
+    })
+
+    from app_settings.init import BoundClassWrapper, ClassWrapper, get_instance, wrap_class_with_config
+    from app_settings.settings import app_settings
+
+    config = app_settings(app_config).BACKEND
+    instance = get_instance(config)
+    wrapped = ClassWrapper(instance, config)
+    bound = BoundClassWrapper(instance, config)
+
+    results = []
+    for name, target in [('instance', instance), ('ClassWrapper', wrapped), ('BoundClassWrapper', bound)]:
+        results.append(('%s.ping()' % name, measure(lambda: target.ping())))
+        results.append(('%s.connected' % name, measure(lambda: target.connected)))
+        if target is not instance:
+            results.append(('%s.TIMEOUT' % name, measure(lambda: target.TIMEOUT)))
+    results.append(('wrap_class_with_config()', measure(lambda: wrap_class_with_config(config))))
+    report('attribute access (per call)', results)
+
+
+if __name__ == '__main__':
+    import bench_class_wrapper
+    bench_class_wrapper.main()
@@ -0,0 +1,62 @@
+"""
+filtered lookups (get_filtered) of big lists and _COLLECTIONs.
+
+"scan" is what a filtered lookup used to cost: preparing the whole value
+and matching the items one by one. "indexed" is get_filtered() of values
+that aren't cached yet, answered from the index of the attribute.
+"""
+from __future__ import print_function
+
+from common import setup_django, timed
+
+LOOKUPS = 200
+
+
+def collection_config(name, size):
+    app_config = {
+        'NAME': name,
+        'SETTINGS': {
+            'BACKENDS': {'NAME': None, 'HOST': None},
+            'COUNTRIES_COLLECTION': {'NAME': None, 'CURRENCY': None},
+        },
+    }
+    values = {
+        'BACKENDS': [{'NAME': 'backend-%d' % i, 'HOST': 'host-%d' % i} for i in range(size)],
+        'COUNTRIES_COLLECTION': dict(
+            ('country-%d' % i, {'NAME': 'country-%d' % i, 'CURRENCY': 'currency-%d' % i}) for i in range(size)
+        ),
+    }
+    return app_config, values
+
+
+def main():
+    from app_settings import cache
+    from app_settings.settings import app_settings
+
+    print('%d filtered lookups of distinct values (seconds)' % LOOKUPS)
+    print('    %-24s %6s %10s %10s' % ('', 'size', 'scan', 'indexed'))
+    for size in (100, 500, 2000):
+        name = 'BENCH_COLLECTIONS_%d' % size
+        app_config, values = collection_config(name, size)
+        setup_django(**{name: values})
+        step = max(1, size // LOOKUPS)
+
+        for attribute_name, filter, prefix in [('BACKENDS', 'NAME', 'backend'),
+                                              ('COUNTRIES_COLLECTION', None, 'country')]:
+            keys = ['%s-%d' % (prefix, i) for i in range(0, size, step)][:LOOKUPS]
+            cache.invalidate()
+            wrapper = app_settings(app_config, in_holder=False)
+
+            def scan():
+                for key in keys:
+                    wrapper.apply_filter(wrapper.get_prepared_value(attribute_name), filter, key)
+
+            def indexed():
+                for key in keys:
+                    wrapper.get_filtered(attribute_name, filter, key)
+
+            print('    %-24s %6d %10.3f %10.3f' % (attribute_name, size, timed(scan), timed(indexed)))
+
+
+if __name__ == '__main__':
+    main()
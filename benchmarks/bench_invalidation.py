@@ -0,0 +1,41 @@
+"""
+cost of changing one setting of fully resolved settings: update_settings()
+(diff + invalidating the dependent values + resolving them again) compared
+to building and resolving the settings from scratch.
+"""
+from __future__ import print_function
+
+from common import flat_config, setup_django, timed
+
+
+def main():
+    from app_settings import cache
+    from app_settings.settings import app_settings
+
+    print('changing SETTING_1 (seconds)')
+    print('    %8s %12s %12s %12s' % ('settings', 'invalidated', 'update', 'rebuild'))
+    for width in (10, 100, 1000, 5000):
+        name = 'BENCH_INVALIDATION_%d' % width
+        app_config, values = flat_config(name, width)
+        setup_django(**{name: values})
+
+        holder = app_settings(app_config).freeze()
+        changed = dict(values)
+        changed['SETTING_1'] = 'changed'
+        invalidated = []
+
+        def update():
+            invalidated[:] = holder.update_settings(changed)
+            holder.SETTING_1
+
+        def rebuild():
+            cache.invalidate(name)
+            setup_django(**{name: changed})
+            app_settings(app_config).freeze()
+
+        update_time = timed(update)
+        print('    %8d %12d %12.6f %12.6f' % (width, len(invalidated), update_time, timed(rebuild)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+cost of a list of nested settings with 10k items: getting the attribute,
+random access to a few items and iterating all of them (which wraps every
+item, like getting the attribute used to do).
+"""
+from __future__ import print_function
+
+import random
+
+from common import setup_django, timed
+
+SIZE = 10000
+SAMPLES = 10
+
+
+def main():
+    app_config = {
+        'NAME': 'BENCH_LAZY',
+        'SETTINGS': {
+            'BACKENDS': {'NAME': None, 'HOST': None},
+        },
+    }
+    setup_django(BENCH_LAZY={
+        'BACKENDS': [{'NAME': 'backend-%d' % i, 'HOST': 'host-%d' % i} for i in range(SIZE)],
+    })
+
+    from app_settings import cache
+    from app_settings.settings import app_settings
+
+    cache.invalidate()
+    wrapper = app_settings(app_config, in_holder=False)
+    backends = []
+    indexes = random.Random(0).sample(range(SIZE), SAMPLES)
+
+    def get():
+        backends.append(wrapper.BACKENDS)
+
+    def access():
+        for index in indexes:
+            backends[0][index].HOST
+
+    def iterate():
+        for backend in backends[0]:
+            backend.NAME
+
+    print('%d nested settings (seconds)' % SIZE)
+    print('    %-40s %10.4f' % ('fingerprint (once per process)', timed(wrapper.get_fingerprint)))
+    print('    %-40s %10.4f' % ('get attribute', timed(get)))
+    print('    %-40s %10.4f' % ('access %d random items' % SAMPLES, timed(access)))
+    print('    %-40s %10.4f' % ('iterate (first time)', timed(iterate)))
+    print('    %-40s %10.4f' % ('iterate (again)', timed(iterate)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+"""
+resolution of a LINK heavy config: every backend links a list of databases.
+"""
+from __future__ import print_function
+
+from common import link_config, setup_django, timed
+
+
+def resolve_all(app_settings, app_config):
+    settings = app_settings(app_config, in_holder=False)
+    for backend in settings.BACKENDS:
+        for database in backend.DATABASES:
+            database.HOST
+
+
+def main():
+    from app_settings.settings import app_settings
+
+    print('LINK resolution (cold, whole config)')
+    for targets, sources, links_per_source in [(50, 10, 10), (200, 50, 20), (500, 100, 40)]:
+        name = 'BENCH_LINKS_%d_%d_%d' % (targets, sources, links_per_source)
+        app_config, values = link_config(name, targets, sources, links_per_source)
+        setup_django(**{name: values})
+        duration = timed(lambda: resolve_all(app_settings, app_config))
+        print('    %4d targets, %4d links: %10.3f s' % (targets, sources * links_per_source, duration))
+
+
+if __name__ == '__main__':
+    main()
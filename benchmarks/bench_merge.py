@@ -0,0 +1,85 @@
+"""
+dict_merge() of DEFAULTS and settings trees, compared to the former
+deepcopy based implementation.
+"""
+from __future__ import print_function
+
+import sys
+from copy import deepcopy
+
+from common import measure
+
+from app_settings.utils import dict_merge
+
+
+def deepcopy_merge(a, b):
+    # the dict_merge implementation before structural sharing
+    if not isinstance(b, dict):
+        return b
+    result = deepcopy(a)
+    for k, v in b.items():
+        if k in result and isinstance(result[k], dict):
+                result[k] = deepcopy_merge(result[k], v)
+        else:
+            result[k] = deepcopy(v)
+    return result
+
+
+def tree(depth, width, leaf=0):
+    if depth == 0:
+        return leaf
+    return dict(('key-%d' % i, tree(depth - 1, width, leaf)) for i in range(width))
+
+
+def override(depth, width):
+    # changes a single leaf of a tree(depth, width)
+    if depth == 0:
+        return 1
+    return {'key-0': override(depth - 1, width)}
+
+
+def allocated(result, *inputs):
+    """
+    bytes of the dicts in result, that are not shared with the inputs.
+    """
+    shared = set()
+    for value in inputs:
+        collect_dicts(value, shared)
+    size = 0
+    seen = set()
+    stack = [result]
+    while stack:
+        value = stack.pop()
+        if not isinstance(value, dict) or id(value) in seen:
+            continue
+        seen.add(id(value))
+        if id(value) not in shared:
+            size += sys.getsizeof(value)
+        stack.extend(value.values())
+    return size
+
+
+def collect_dicts(value, ids):
+    if isinstance(value, dict):
+        ids.add(id(value))
+        for item in value.values():
+            collect_dicts(item, ids)
+
+
+def main():
+    print('dict_merge (defaults tree + one changed leaf)')
+    print('    %-22s %14s %14s %12s %12s' % ('shape', 'deepcopy us', 'sharing us', 'deepcopy B', 'sharing B'))
+    for name, depth, width in [('deep (8 x 3)', 8, 3), ('wide (2 x 300)', 2, 300), ('mixed (4 x 12)', 4, 12)]:
+        defaults, settings = tree(depth, width), override(depth, width)
+        number = 20
+        results = (
+            measure(lambda: deepcopy_merge(defaults, settings), number=number, repeat=3),
+            measure(lambda: dict_merge(defaults, settings), number=number, repeat=3),
+            allocated(deepcopy_merge(defaults, settings), defaults, settings),
+            allocated(dict_merge(defaults, settings), defaults, settings),
+        )
+        print('    %-22s %14.1f %14.1f %12d %12d' % ((name, ) + results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+reading a deeply nested setting: attribute chains vs get_path().
+"""
+from __future__ import print_function
+
+from common import measure, nested_config, report, setup_django
+
+DEPTH = 6
+
+
+def main():
+    app_config, values = nested_config('BENCH_PATHS', depth=DEPTH, width=5)
+    setup_django(BENCH_PATHS=values)
+
+    from app_settings.settings import app_settings
+
+    path = '.'.join(['CHILD'] * DEPTH + ['SETTING_1'])
+    holder = app_settings(app_config)
+    wrapper = app_settings(app_config, in_holder=False)
+
+    def chain(settings):
+        obj = settings
+        for name in path.split('.'):
+            obj = getattr(obj, name)
+        return obj
+
+    assert chain(holder) == holder[path] == wrapper.get_path(path) == getattr(holder, path)
+
+    report('%s (per call)' % path, [
+        ('attribute chain (holder)', measure(lambda: chain(holder))),
+        ('attribute chain (wrapper)', measure(lambda: chain(wrapper))),
+        ('getattr dotted (holder)', measure(lambda: getattr(holder, path))),
+        ('holder[path]', measure(lambda: holder[path])),
+        ('wrapper.get_path(path)', measure(lambda: wrapper.get_path(path))),
+    ])
+
+    subtree = app_settings(app_config, in_holder=False).preload_paths('CHILD.CHILD')
+    report('after preload_paths(\'CHILD.CHILD\') (per call)', [
+        ('get_path(path)', measure(lambda: subtree.get_path(path))),
+    ])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+memory of forked workers reading every setting, when the master process
+resolved them before forking (prefork.preload()) compared to resolving
+them in every worker. linux only: reads Private_Dirty of /proc/self/smaps.
+
+    python benchmarks/bench_prefork.py [workers]
+"""
+from __future__ import print_function
+
+import os
+import sys
+
+from common import collection_config, init_config, setup_django
+
+
+def private_dirty_kb():
+    """
+    memory of the current process, that isn't shared (anymore) with others.
+    """
+    path = '/proc/self/smaps_rollup'
+    if not os.path.exists(path):
+        path = '/proc/self/smaps'
+    total = 0
+    with open(path) as f:
+        for line in f:
+            if line.startswith('Private_Dirty:'):
+                total += int(line.split()[1])
+    return total
+
+
+def build():
+    from app_settings.settings import app_settings
+
+    collection, collection_values = collection_config('BENCH_PREFORK_COLLECTION', size=5000, width=10)
+    init, init_values = init_config('BENCH_PREFORK_INIT', size=1000)
+    setup_django(BENCH_PREFORK_COLLECTION=collection_values, BENCH_PREFORK_INIT=init_values)
+    return [app_settings(collection), app_settings(init)]
+
+
+def read_all(holders, resolve):
+    for holder in holders:
+        if resolve:
+            holder.freeze()
+        for path in holder._wrapped._frozen:
+            holder[path]
+        for backend in holder._wrapped._frozen.get('BACKENDS', ()):
+            backend.settings.NAME
+
+
+def run(mode, workers):
+    """
+    forks workers, which read every setting. returns the growth of their
+    private memory in kb.
+    """
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # a fresh master, so the modes don't share anything
+        from app_settings import cache, prefork
+        from app_settings.init import instance_registry
+        cache.invalidate()
+        instance_registry.clear()
+        holders = build()
+        if mode == 'preload':
+            prefork.preload(holders)
+        children = []
+        for i in range(workers):
+            child_read, child_write = os.pipe()
+            child = os.fork()
+            if child == 0:
+                if mode == 'preload':
+                    prefork.after_fork()
+                before = private_dirty_kb()
+                read_all(holders, resolve=mode != 'preload')
+                os.write(child_write, str(private_dirty_kb() - before).encode())
+                os._exit(0)
+            os.close(child_write)
+            children.append((child, child_read))
+        results = []
+        for child, child_read in children:
+            results.append(os.read(child_read, 64).decode())
+            os.waitpid(child, 0)
+        os.write(write_fd, ' '.join(results).encode())
+        os._exit(0)
+
+    os.close(write_fd)
+    data = b''
+    while True:
+        chunk = os.read(read_fd, 4096)
+        if not chunk:
+            break
+        data += chunk
+    os.waitpid(pid, 0)
+    return [int(value) for value in data.decode().split()]
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    setup_django()
+    print('private memory added per worker reading every setting (kb, %d workers)' % workers)
+    print('    %-10s %10s %10s %10s' % ('mode', 'mean', 'max', 'total'))
+    for mode in ('lazy', 'preload'):
+        results = run(mode, workers)
+        print('    %-10s %10d %10d %10d' % (mode, sum(results) / len(results), max(results), sum(results)))
+
+
+if __name__ == '__main__':
+    main()
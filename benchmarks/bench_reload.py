@@ -0,0 +1,53 @@
+"""
+reading settings while they are reloaded in the background compared to
+reading them without reloads, and the duration of a reload.
+
+the background thread reloads every RELOAD_INTERVAL seconds - far more
+often than any deployment does, but not in a busy loop: reloading back to
+back keeps the GIL busy, so the reader mostly measures waiting for the
+reload thread instead of the (lock free) read.
+"""
+from __future__ import print_function
+
+import threading
+
+from common import flat_config, measure, report, setup_django, timed
+
+RELOAD_INTERVAL = 0.1
+
+
+def main():
+    from app_settings.reload import SettingsReloader
+    from app_settings.settings import app_settings
+
+    name = 'BENCH_RELOAD'
+    app_config, values = flat_config(name, 1000)
+    setup_django(**{name: values})
+    holder = app_settings(app_config).freeze()
+    reloader = SettingsReloader(holder, app_config)
+
+    results = [('holder.SETTING_1', measure(lambda: holder.SETTING_1))]
+
+    stop = threading.Event()
+    changed = [dict(values, SETTING_1='changed-%d' % i) for i in range(2)]
+
+    def reload_forever():
+        i = 0
+        while not stop.wait(RELOAD_INTERVAL):
+            reloader.reload(changed[i % 2])
+            i += 1
+
+    thread = threading.Thread(target=reload_forever)
+    thread.start()
+    try:
+        results.append(('holder.SETTING_1 (reloading)', measure(lambda: holder.SETTING_1, repeat=20)))
+    finally:
+        stop.set()
+        thread.join()
+    report('reading a setting (per call)', results)
+    print('reloads meanwhile: %d' % reloader.reloads)
+    print('reload of 1000 settings: %.6f s' % timed(lambda: reloader.reload(values)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+"""
+per attribute access cost of the lookup tables used by get_attribute().
+"""
+from __future__ import print_function
+
+from common import flat_config, measure, report, setup_django
+
+
+def main():
+    app_config, values = flat_config('BENCH_SCHEMA', width=100)
+    setup_django(BENCH_SCHEMA=values)
+
+    from app_settings.settings import app_settings
+    wrapper = app_settings(app_config, in_holder=False)
+
+    report('schema lookups (per call)', [
+        ('list_available_attributes()', measure(wrapper.list_available_attributes)),
+        ('list_import_targets()', measure(wrapper.list_import_targets)),
+        ('list_globals()', measure(wrapper.list_globals)),
+        ('get_attribute() (uncached)', measure(lambda: wrapper.get_attribute('SETTING_1'))),
+        ('as_wrapped()', measure(lambda: wrapper.as_wrapped(attribute_name='SETTING_1'))),
+    ])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+booting settings from a snapshot (app_settings_snapshot command) compared
+to resolving them: app_settings() + reading every setting once.
+"""
+from __future__ import print_function
+
+import shutil
+import tempfile
+
+from common import flat_config, nested_config, setup_django, timed
+
+
+def read_all(holder, names):
+    for name in names:
+        holder[name]
+
+
+def main():
+    from app_settings import cache, snapshot
+    from app_settings.settings import app_settings
+
+    directory = tempfile.mkdtemp()
+    try:
+        print('app_settings() + reading every setting (seconds)')
+        print('    %-12s %8s %12s %12s' % ('shape', 'settings', 'resolved', 'snapshot'))
+        for shape, width in (('flat', 100), ('flat', 1000), ('flat', 5000), ('nested', 4), ('nested', 6)):
+            name = 'BENCH_SNAPSHOT_%s_%d' % (shape.upper(), width)
+            if shape == 'flat':
+                app_config, values = flat_config(name, width)
+            else:
+                app_config, values = nested_config(name, depth=width, width=4)
+            setup_django(**{name: values})
+            names = sorted(app_settings(app_config).freeze()._wrapped._frozen)
+
+            def boot():
+                cache.invalidate(name)
+                read_all(app_settings(app_config), names)
+
+            resolved = timed(boot)
+            snapshot.write_snapshot(app_settings(app_config, in_holder=False), directory)
+            setup_django(APP_SETTINGS_SNAPSHOT_DIR=directory)
+            from_snapshot = timed(boot)
+            setup_django(APP_SETTINGS_SNAPSHOT_DIR=None)
+            print('    %-12s %8d %12.6f %12.6f' % (shape, len(names), resolved, from_snapshot))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+app_settings() reading from a stack of sources (django settings, file,
+key / value store, environment) compared to the django settings only, and
+the cost of refreshing a single source.
+"""
+from __future__ import print_function
+
+import json
+import os
+import shutil
+import tempfile
+
+from common import flat_config, measure, report, setup_django
+
+
+def main():
+    from app_settings import sources
+    from app_settings.settings import app_settings
+
+    name = 'BENCH_SOURCES'
+    app_config, values = flat_config(name, 1000)
+    setup_django(**{name: values})
+
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'settings.json')
+        with open(path, 'w') as f:
+            json.dump({name: dict(('SETTING_%d' % i, 'file-%d' % i) for i in range(0, 1000, 10))}, f)
+        store = sources.MemoryStore(dict(('%s.SETTING_%d' % (name, i), '"kv"') for i in range(0, 1000, 100)))
+        environ = {'%s__SETTING_1' % name: '"env"'}
+
+        results = [('app_settings() (django)', measure(lambda: app_settings(app_config), number=1000))]
+        stack = sources.configure([
+            sources.DjangoSource(),
+            sources.FileSource(path),
+            sources.KeyValueSource(store),
+            sources.EnvSource(environ=environ),
+        ])
+        try:
+            results.append(('app_settings() (4 sources)', measure(lambda: app_settings(app_config), number=1000)))
+            results.append(('refresh(file)', measure(lambda: stack.refresh(stack.sources[1]), number=100)))
+            results.append(('refresh(key / value)', measure(lambda: stack.refresh(stack.sources[2]), number=100)))
+        finally:
+            sources.configure(None)
+        report('per call', results)
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+memory and creation cost of SettingsWrapper vs CompactSettingsWrapper.
+
+bytes per wrapper only count what a wrapper owns itself (the object, its
+__dict__, kwargs and value cache), the settings, config and schema are
+shared by all wrappers either way.
+"""
+from __future__ import print_function
+
+import sys
+
+from common import measure, setup_django
+
+WIDTH = 20
+CHILDREN = 500
+
+
+def tree_config(name):
+    app_config = {
+        'NAME': name,
+        'SETTINGS': {
+            'BACKENDS': dict(('OPTION_%d' % i, None) for i in range(WIDTH)),
+        },
+    }
+    values = {
+        'BACKENDS': [
+            dict(('OPTION_%d' % i, 'backend-%d-%d' % (j, i)) for i in range(WIDTH))
+            for j in range(CHILDREN)
+        ],
+    }
+    return app_config, values
+
+
+def own_size(wrapper):
+    size = sys.getsizeof(wrapper)
+    own = [getattr(wrapper, '__dict__', None)]
+    for name in ('_kwargs', '_values', '_shared'):
+        try:
+            own.append(object.__getattribute__(wrapper, name))
+        except AttributeError:
+            pass
+    for value in own:
+        if value is not None:
+            size += sys.getsizeof(value)
+    return size
+
+
+def main():
+    app_config, values = tree_config('BENCH_WRAPPERS')
+    setup_django(BENCH_WRAPPERS=values)
+
+    from app_settings.settings import app_settings, SettingsWrapper, CompactSettingsWrapper
+
+    print('%d child wrappers with %d settings each' % (CHILDREN, WIDTH))
+    print('    %-24s %16s %16s %16s' % ('', 'bytes (new)', 'bytes (resolved)', 'as_wrapped() / s'))
+    for wrapper_class in (SettingsWrapper, CompactSettingsWrapper):
+        wrapper = app_settings(app_config, in_holder=False, wrapper_class=wrapper_class)
+        children = wrapper.BACKENDS
+        new = sum(own_size(child) for child in children) / float(len(children))
+        for child in children:
+            for i in range(WIDTH):
+                getattr(child, 'OPTION_%d' % i)
+        resolved = sum(own_size(child) for child in children) / float(len(children))
+
+        settings = values['BACKENDS'][0]
+        per_call = measure(lambda: wrapper.as_wrapped(attribute_name='BACKENDS', value=settings), number=2000)
+        print('    %-24s %16.0f %16.0f %16.0f' % (wrapper_class.__name__, new, resolved, 1e6 / per_call))
+
+
+if __name__ == '__main__':
+    main()
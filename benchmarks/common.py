@@ -0,0 +1,170 @@
+"""
+helpers shared by the benchmark scripts.
+
+the scripts are meant to be run from a checkout without installing anything
+but django: python benchmarks/<script>.py
+"""
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def setup_django(**options):
+    from django.conf import settings
+    if not settings.configured:
+        settings.configure(**options)
+    else:
+        for key, value in options.items():
+            setattr(settings, key, value)
+    return settings
+
+
+def flat_config(name, width=50):
+    """
+    app_config / django settings pair with `width` plain settings.
+    """
+    app_config = {
+        'NAME': name,
+        'SETTINGS': dict(('SETTING_%d' % i, None) for i in range(width)),
+        'DEFAULTS': dict(('SETTING_%d' % i, i) for i in range(0, width, 2)),
+    }
+    values = dict(('SETTING_%d' % i, 'value-%d' % i) for i in range(1, width, 2))
+    return app_config, values
+
+
+def measure(func, number=10000, repeat=5):
+    """
+    best time per call of func in microseconds.
+    """
+    timings = timeit.repeat(func, number=number, repeat=repeat)
+    return min(timings) / number * 1e6
+
+
+def report(title, results):
+    print(title)
+    for name, value in results:
+        print('    %-40s %10.3f us' % (name, value))
+
+
+def link_config(name, targets=200, sources=50, links_per_source=20):
+    """
+    app_config / django settings pair, where every one of `sources` BACKENDS
+    LINKs `links_per_source` of the `targets` DATABASES by NAME.
+    """
+    app_config = {
+        'NAME': name,
+        'SETTINGS': {
+            'DATABASES': {'NAME': None, 'HOST': None},
+            'BACKENDS': {'NAME': None, 'DATABASES': None},
+        },
+        'LINK': {'BACKENDS.DATABASES': 'DATABASES|NAME'},
+    }
+    values = {
+        'DATABASES': [
+            {'NAME': 'db-%d' % i, 'HOST': 'host-%d' % i} for i in range(targets)
+        ],
+        'BACKENDS': [
+            {
+                'NAME': 'backend-%d' % i,
+                'DATABASES': ['db-%d' % ((i + j) % targets) for j in range(links_per_source)]
+            } for i in range(sources)
+        ],
+    }
+    return app_config, values
+
+
+def timed(func):
+    """
+    runs func once and returns its duration in seconds.
+    """
+    start = timeit.default_timer()
+    func()
+    return timeit.default_timer() - start
+
+
+class BenchBackend(object):
+    """
+    CLASS of the instantiated settings of init_config().
+    """
+    def __init__(self, settings=None):
+        self.settings = settings
+
+
+def nested_config(name, depth=5, width=5):
+    """
+    app_config / django settings pair with settings nested `depth` levels
+    deep, every level having `width` plain settings and a CHILD.
+    """
+    def level(depth):
+        settings = dict(('SETTING_%d' % i, None) for i in range(width))
+        values = dict(('SETTING_%d' % i, 'value-%d-%d' % (depth, i)) for i in range(width))
+        if depth:
+            settings['CHILD'], values['CHILD'] = level(depth - 1)
+        return settings, values
+    settings, values = level(depth)
+    return {'NAME': name, 'SETTINGS': settings}, values
+
+
+def collection_config(name, size=500, width=5):
+    """
+    app_config / django settings pair with a _COLLECTION of `size` items.
+    """
+    app_config = {
+        'NAME': name,
+        'SETTINGS': {
+            'ITEMS_COLLECTION': dict(('FIELD_%d' % i, None) for i in range(width)),
+        },
+    }
+    values = {
+        'ITEMS_COLLECTION': dict(
+            ('item-%d' % j, dict(('FIELD_%d' % i, 'value-%d-%d' % (j, i)) for i in range(width)))
+            for j in range(size)
+        ),
+    }
+    return app_config, values
+
+
+def one_to_many_config(name, size=100):
+    """
+    app_config / django settings pair with a BACKEND, that is one of the
+    `size` items of BACKENDS_COLLECTION (ONE_TO_MANY).
+    """
+    app_config = {
+        'NAME': name,
+        'SETTINGS': {
+            'BACKEND': {'NAME': None, 'HOST': None},
+            'BACKENDS_COLLECTION': {'NAME': None, 'HOST': None},
+        },
+        'ONE_TO_MANY': {'BACKEND': 'BACKENDS_COLLECTION|NAME'},
+    }
+    values = {
+        'BACKEND': {'NAME': 'backend-0', 'HOST': 'host-0'},
+        'BACKENDS_COLLECTION': dict(
+            ('backend-%d' % i, {'NAME': 'backend-%d' % i, 'HOST': 'host-%d' % i}) for i in range(size)
+        ),
+    }
+    return app_config, values
+
+
+def init_config(name, size=100):
+    """
+    app_config / django settings pair with `size` BACKENDS, that are
+    instances of BenchBackend.
+    """
+    app_config = {
+        'NAME': name,
+        'SETTINGS': {
+            'BACKENDS': {'NAME': None, 'CLASS': None},
+        },
+        'IMPORT_STRINGS': ['BACKENDS.CLASS'],
+        'INIT': ['BACKENDS'],
+    }
+    values = {
+        '_INIT_METHOD': 'app_settings.init.get_instance',
+        'BACKENDS': [{'NAME': 'backend-%d' % i, 'CLASS': 'common.BenchBackend'} for i in range(size)],
+    }
+    return app_config, values
@@ -0,0 +1,206 @@
+"""
+benchmark suite over the whole resolution path, for comparing commits:
+
+    python benchmarks/suite.py --output before.json
+    (check out another commit)
+    python benchmarks/suite.py --output after.json --compare before.json
+
+every case is run for each synthetic config shape (flat, nested,
+collection, links, one to many, init). results are microseconds per call
+(best of --repeat), written as json.
+"""
+from __future__ import print_function
+
+import json
+import optparse
+import platform
+import subprocess
+import sys
+import time
+
+from common import (
+    collection_config, flat_config, init_config, link_config, measure, nested_config,
+    one_to_many_config, setup_django
+)
+
+SHAPES = (
+    ('flat', lambda name: flat_config(name, width=100)),
+    ('nested', lambda name: nested_config(name, depth=6, width=5)),
+    ('collection', lambda name: collection_config(name, size=500)),
+    ('links', lambda name: link_config(name, targets=100, sources=20, links_per_source=10)),
+    ('one_to_many', lambda name: one_to_many_config(name, size=100)),
+    ('init', lambda name: init_config(name, size=100)),
+)
+
+# a setting of every shape, read by the attribute access cases
+ATTRIBUTES = {
+    'flat': 'SETTING_1',
+    'nested': 'CHILD',
+    'collection': 'ITEMS_COLLECTION',
+    'links': 'BACKENDS',
+    'one_to_many': 'BACKENDS_COLLECTION',
+    'init': 'BACKENDS',
+}
+
+
+def reset_caches():
+    """
+    drops the process wide caches of the checked out revision. older
+    revisions lack some of them, so every one is optional.
+    """
+    try:
+        from app_settings import cache
+    except ImportError:
+        pass
+    else:
+        cache.invalidate()
+    try:
+        from app_settings.imports import clear_import_cache
+    except ImportError:
+        pass
+    else:
+        clear_import_cache()
+    try:
+        from app_settings.init import instance_registry
+    except ImportError:
+        pass
+    else:
+        instance_registry.clear()
+    try:
+        from app_settings.validation import clear_validation_cache
+    except ImportError:
+        pass
+    else:
+        clear_validation_cache()
+
+
+def resolve_all(holder):
+    """
+    resolves every setting of holder, with freeze() if the revision has it.
+    """
+    if hasattr(holder._wrapped, 'freeze'):
+        holder.freeze()
+        return
+    for name in holder._wrapped.list_available_attributes():
+        try:
+            getattr(holder, name)
+        except Exception:
+            pass  # not set
+
+
+def run_cases(shape, app_config, number, repeat):
+    from app_settings.settings import app_settings
+    from app_settings.utils import override_app_settings
+
+    attribute = ATTRIBUTES[shape]
+    results = {}
+
+    def cold():
+        reset_caches()
+        resolve_all(app_settings(app_config))
+    results['app_settings (cold, resolve all)'] = measure(cold, number=1, repeat=repeat)
+
+    resolve_all(app_settings(app_config))
+    results['app_settings (warm, resolve all)'] = measure(
+        lambda: resolve_all(app_settings(app_config)), number=max(1, number // 100), repeat=repeat
+    )
+
+    holder = app_settings(app_config)
+    getattr(holder, attribute)
+    results['SettingsHolder.__getattr__'] = measure(lambda: getattr(holder, attribute), number=number, repeat=repeat)
+
+    wrapped = holder._wrapped
+    results['with_configuration'] = measure(
+        lambda: wrapped.with_configuration({'DEBUG': True}), number=number, repeat=repeat
+    )
+
+    def override():
+        with override_app_settings(holder, {'DEBUG': True}):
+            pass
+    results['override_app_settings enter/exit'] = measure(override, number=number, repeat=repeat)
+
+    if shape == 'init' and hasattr(wrapped, 'get_prepared_value'):
+        from app_settings.init import wrap_class_with_config
+        configs = list(wrapped.get_prepared_value('BACKENDS'))
+
+        def wrap():
+            for wrapper in wrap_class_with_config(configs):
+                pass
+        results['wrap_class_with_config'] = measure(wrap, number=max(1, number // 100), repeat=repeat)
+
+    return results
+
+
+def get_revision():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.STDOUT
+        ).decode('ascii').strip()
+    except Exception:
+        return None
+
+
+def compare(results, previous, threshold):
+    print('\ncompared to %s' % (previous['meta'].get('revision') or 'previous run'))
+    regressions = 0
+    for key in sorted(results):
+        if key not in previous['results']:
+            continue
+        ratio = results[key] / previous['results'][key] if previous['results'][key] else 1.0
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  REGRESSION'
+            regressions += 1
+        print('    %-60s %8.2fx%s' % (key, ratio, flag))
+    return regressions
+
+
+def main():
+    parser = optparse.OptionParser()
+    parser.add_option('--output', help='write the results as json to this file')
+    parser.add_option('--compare', help='json results of a previous run to compare to')
+    parser.add_option('--threshold', type='float', default=0.1, help='relative slowdown reported as regression')
+    parser.add_option('--number', type='int', default=1000)
+    parser.add_option('--repeat', type='int', default=3)
+    parser.add_option('--shape', action='append', help='run only these shapes')
+    options, args = parser.parse_args()
+
+    shapes = [(name, build) for name, build in SHAPES if not options.shape or name in options.shape]
+    configs = {}
+    django_settings = {'DEBUG': False}
+    for shape, build in shapes:
+        name = 'BENCH_SUITE_%s' % shape.upper()
+        configs[shape], django_settings[name] = build(name)
+    setup_django(**django_settings)
+
+    results = {}
+    for shape, build in shapes:
+        for case, value in sorted(run_cases(shape, configs[shape], options.number, options.repeat).items()):
+            key = '%s: %s' % (shape, case)
+            results[key] = value
+            print('%-60s %12.3f us' % (key, value))
+
+    output = {
+        'meta': {
+            'revision': get_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'number': options.number,
+            'repeat': options.repeat,
+        },
+        'results': results,
+    }
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump(output, f, indent=2, sort_keys=True)
+
+    if options.compare:
+        with open(options.compare) as f:
+            previous = json.load(f)
+        if compare(results, previous, options.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
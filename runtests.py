@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+"""
+runs the tests of app_settings:
+
+    python runtests.py [app_settings.tests.test_schema ...]
+"""
+import sys
+
+import django
+from django.conf import settings
+
+
+def main():
+    settings.configure(
+        DEBUG=False,
+        INSTALLED_APPS=['app_settings'],
+        DATABASES={},
+    )
+    django.setup()
+
+    from django.test.utils import get_runner
+    runner = get_runner(settings)()
+    failures = runner.run_tests(sys.argv[1:] or ['app_settings.tests'])
+    sys.exit(bool(failures))
+
+
+if __name__ == '__main__':
+    main()